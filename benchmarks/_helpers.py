@@ -0,0 +1,60 @@
+"""
+Shared helpers for the micro-benchmarks.
+"""
+
+from unittest.mock import MagicMock
+
+
+class RecordingSession:
+    """
+    Session stub that keeps the last executed statement and returns no rows.
+
+    Only the last statement and a count are kept, so memory stays flat however
+    many rounds a benchmark runs.
+    """
+
+    def __init__(self):
+        self.last_statement = None
+        self.executed = 0
+        self._result = MagicMock()
+        self._result.scalars.return_value.all.return_value = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.last_statement = stmt
+        self.executed += 1
+        return self._result
+
+
+def run_sync(coro):
+    """
+    Run a coroutine that never suspends without an event loop.
+
+    Args:
+        coro: The coroutine.
+
+    Returns:
+        The coroutine result.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("Coroutine suspended; it needs an event loop")
+
+
+class SyncSessionAdapter:
+    """
+    Async session facade over a synchronous ORM session.
+
+    Lets the async services run against a real SQLite database through
+    ``run_sync``: ``execute`` never suspends, so no event loop is needed.
+
+    Args:
+        session (Session): The synchronous session.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, stmt, *args, **kwargs):
+        return self.session.execute(stmt, *args, **kwargs)
@@ -0,0 +1,31 @@
+import pytest
+from datetime import date
+
+from app.database.models import Contact
+from app.services.auth import Hash
+
+from _helpers import RecordingSession
+
+
+@pytest.fixture(scope="session")
+def contact():
+    return Contact(
+        id=1,
+        name="Olena",
+        surname="Shevchenko",
+        email="olena.shevchenko@example.com",
+        phone="+380501234567",
+        birthdate=date(1990, 5, 17),
+        notes="Family friend",
+        user_id=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def password_hash():
+    return Hash().get_password_hash("benchmark-password")
+
+
+@pytest.fixture
+def recording_session():
+    return RecordingSession()
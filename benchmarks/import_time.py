@@ -0,0 +1,87 @@
+"""
+Import-time budget check for the application package.
+
+Runs ``python -X importtime -c "import app.main"`` several times, reports the
+median total import time and the heaviest top-level packages, and fails when
+the median exceeds the budget or when an integration that must be imported
+lazily shows up at import time.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/import_time.py --budget-ms 1000
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from app.startup import LAZY_MODULES
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| +(\S+)")
+
+
+def measure(target: str) -> tuple[float, dict[str, float]]:
+    """
+    Import a module in a fresh interpreter and parse ``-X importtime`` output.
+
+    Args:
+        target (str): The module to import.
+
+    Returns:
+        tuple: The total import time of the target in milliseconds, and the
+        self time summed per top-level package in milliseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+        check=True,
+    )
+    total = 0.0
+    packages: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        own, cumulative, name = int(match[1]), int(match[2]), match[3]
+        if name == target:
+            total = cumulative / 1000
+        packages[name.split(".")[0]] += own / 1000
+    return total, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    measure(args.target)
+    runs = [measure(args.target) for _ in range(args.runs)]
+    median = statistics.median(total for total, _ in runs)
+    packages = runs[-1][1]
+
+    print(f"import {args.target}: median {median:.1f} ms over {args.runs} runs")
+    for name, elapsed in sorted(packages.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {elapsed:8.1f} ms  {name}")
+
+    failures = []
+    eager = [name for name in LAZY_MODULES if name in packages]
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    if median > args.budget_ms:
+        failures.append(f"median {median:.1f} ms exceeds budget of {args.budget_ms} ms")
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Save and compare service-layer and ORM micro-benchmark baselines.
+
+Baselines are stored by pytest-benchmark under ``benchmarks/.baselines``, per
+machine and interpreter, so a comparison is only meaningful on the machine that
+saved the baseline.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/micro.py save
+    PYTHONPATH=src python benchmarks/micro.py compare --tolerance 10
+"""
+
+import argparse
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STORAGE = os.path.join(HERE, ".baselines")
+BASELINE = "baseline"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("mode", choices=["save", "compare"])
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=10,
+        help="Allowed regression of the median, in percent.",
+    )
+    args, extra = parser.parse_known_args()
+
+    pytest_args = [
+        os.path.join(HERE, "test_services.py"),
+        os.path.join(HERE, "test_orm.py"),
+        f"--benchmark-storage=file://{STORAGE}",
+        "--benchmark-sort=name",
+        "-p",
+        "no:cacheprovider",
+    ]
+    if args.mode == "save":
+        pytest_args.append(f"--benchmark-save={BASELINE}")
+    else:
+        pytest_args += [
+            "--benchmark-compare",
+            f"--benchmark-compare-fail=median:{args.tolerance}%",
+        ]
+    sys.exit(pytest.main(pytest_args + extra))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Deterministic dataset seeder for benchmarks.
+
+Generates ``users`` confirmed users with ``contacts`` contacts each. All users
+share the same password so login can be benchmarked without paying for one
+bcrypt hash per seeded user.
+"""
+
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+from app.database.models import Base, Contact, User, UserRole
+from app.services.auth import Hash
+
+PASSWORD = "benchmark-password"
+"""
+Password of every seeded user.
+"""
+
+FIRST_NAMES = [
+    "Olena", "Taras", "Iryna", "Andrii", "Maria", "Dmytro", "Sofia", "Oleh",
+    "Kateryna", "Bohdan", "Anna", "Yurii", "Nataliia", "Serhii", "Daria", "Ivan",
+]
+LAST_NAMES = [
+    "Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko", "Oliinyk",
+    "Shevchuk", "Polishchuk", "Lysenko", "Marchenko", "Savchenko", "Rudenko",
+]
+DOMAINS = ["example.com", "meta.ua", "mail.com", "ukr.net", "gmail.com"]
+
+
+def user_name(index: int) -> str:
+    """
+    Get the name of a seeded user.
+
+    Args:
+        index (int): The user index.
+
+    Returns:
+        str: The user name.
+    """
+    return f"bench_user_{index}"
+
+
+async def seed_dataset(
+    engine, users: int, contacts: int, seed: int = 42, reset: bool = False
+) -> list[int]:
+    """
+    Recreate the schema and fill it with a deterministic dataset.
+
+    Seeding drops every table first, so it refuses to run against a database
+    whose name does not contain ``bench`` unless ``reset`` is set.
+
+    Args:
+        engine (AsyncEngine): The engine to seed.
+        users (int): The number of users.
+        contacts (int): The number of contacts per user.
+        seed (int): The random seed.
+        reset (bool): Whether to drop the tables of any database.
+
+    Returns:
+        list[int]: The IDs of the seeded users.
+
+    Raises:
+        RuntimeError: If the database does not look like a benchmark database.
+    """
+    database = engine.url.database or ""
+    if "bench" not in database and not reset:
+        raise RuntimeError(
+            f"Refusing to drop all tables in {database!r}: its name does not contain "
+            "'bench'. Pass --reset to seed it anyway."
+        )
+    rng = random.Random(seed)
+    password = Hash().get_password_hash(PASSWORD)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        result = await conn.execute(
+            insert(User).returning(User.id),
+            [
+                {
+                    "name": user_name(i),
+                    "email": f"{user_name(i)}@example.com",
+                    "password": password,
+                    "confirmed": True,
+                    "role": UserRole.USER,
+                }
+                for i in range(users)
+            ],
+        )
+        user_ids = [row[0] for row in result]
+
+        for user_id in user_ids:
+            rows = []
+            for i in range(contacts):
+                name = rng.choice(FIRST_NAMES)
+                surname = rng.choice(LAST_NAMES)
+                rows.append(
+                    {
+                        "name": name,
+                        "surname": surname,
+                        "email": f"{name}.{surname}.{i}@{rng.choice(DOMAINS)}".lower(),
+                        "phone": f"+380{rng.randint(100000000, 999999999)}",
+                        "birthdate": date(rng.randint(1960, 2005), 1, 1)
+                        + timedelta(days=rng.randint(0, 364)),
+                        "notes": rng.choice([None, "Colleague", "Family friend " * 5]),
+                        "user_id": user_id,
+                    }
+                )
+            await conn.execute(insert(Contact), rows)
+
+    return user_ids
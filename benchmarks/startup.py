@@ -0,0 +1,156 @@
+"""
+Compare the development and production server modes.
+
+Starts the app with ``app.main:main`` (reload, single process) and
+``app.main:serve`` (multi-worker, uvloop/httptools), measures the time until
+the server answers, the throughput of a short request burst and the time to
+shut down on SIGTERM, and writes the results to a JSON file.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/startup.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+
+MODES = {
+    "dev": "from app.main import main; main()",
+    "prod": "from app.main import serve; serve()",
+}
+"""
+Server modes and the code that starts them.
+"""
+
+
+async def wait_ready(url: str, timeout: float) -> float:
+    """
+    Poll a URL until it answers.
+
+    Args:
+        url (str): The URL to poll.
+        timeout (float): The maximum time to wait in seconds.
+
+    Returns:
+        float: The time the server became ready, from ``time.perf_counter``.
+    """
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() < deadline:
+            try:
+                response = await client.get(url)
+                if response.status_code < 500:
+                    return time.perf_counter()
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.02)
+    raise TimeoutError(f"{url} did not become ready in {timeout}s")
+
+
+async def burst(url: str, requests: int, concurrency: int) -> dict:
+    """
+    Send a burst of requests and measure throughput.
+
+    Args:
+        url (str): The URL to request.
+        requests (int): The total number of requests.
+        concurrency (int): The number of concurrent connections.
+
+    Returns:
+        dict: The number of requests, errors and requests per second.
+    """
+    counter = iter(range(requests))
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits) as client:
+
+        async def worker():
+            nonlocal errors
+            for _ in counter:
+                try:
+                    response = await client.get(url)
+                    errors += response.status_code >= 500
+                except httpx.TransportError:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {"requests": requests, "errors": errors, "rps": round(requests / elapsed, 1)}
+
+
+def run_mode(name: str, port: int, args) -> dict:
+    """
+    Start a server mode, benchmark it and shut it down.
+
+    Args:
+        name (str): The mode name.
+        port (int): The port to serve on.
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        dict: The mode results.
+    """
+    env = dict(os.environ, APP_PORT=str(port))
+    if args.workers:
+        env["APP_WORKERS"] = str(args.workers)
+    url = f"http://127.0.0.1:{port}{args.path}"
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", MODES[name]],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        ready = asyncio.run(wait_ready(url, args.timeout))
+        result = {"startup_seconds": round(ready - started, 3)}
+        result.update(asyncio.run(burst(url, args.requests, args.concurrency)))
+    finally:
+        stopping = time.perf_counter()
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+    result["shutdown_seconds"] = round(time.perf_counter() - stopping, 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--path", default="/docs")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--output", default="bench-startup.json")
+    args = parser.parse_args()
+
+    results = {}
+    for offset, name in enumerate(args.modes):
+        results[name] = run_mode(name, args.port + offset, args)
+        print(f"{name:>5}: {json.dumps(results[name])}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+ORM-layer overhead benchmarks.
+
+Each hot query is run through the service, which uses statements prebuilt with bound parameters, and
+through an equivalent ``select()`` built on every call, against an in-memory
+SQLite database. The database work is the same for both, so the difference is
+the per-request Python overhead of building the statement and its cache key.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from _helpers import SyncSessionAdapter, run_sync
+from app.database.models import Base, Contact, User, UserRole
+from app.services.contacts import ContactsService
+from app.services.user import UserService
+
+
+@pytest.fixture(scope="module")
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            User(name="olena", email="olena@example.com", password="x", role=UserRole.USER)
+        )
+        session.flush()
+        session.add_all(
+            Contact(
+                name=f"Name{i}",
+                surname="Shevchenko",
+                email=f"contact{i}@example.com",
+                phone="+380501234567",
+                birthdate=date(1990, 5, 17),
+                user_id=1,
+            )
+            for i in range(50)
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_get_by_id_prebuilt(benchmark, session):
+    service = ContactsService(SyncSessionAdapter(session))
+    contact = benchmark(lambda: run_sync(service.get_by_id(1, 7)))
+    assert contact.id == 7
+
+
+def test_get_by_id_select(benchmark, session):
+    def get_by_id(user_id, id):
+        stmt = select(Contact).where(Contact.user_id == user_id, Contact.id == id)
+        return session.execute(stmt).scalar_one_or_none()
+
+    assert benchmark(get_by_id, 1, 7).id == 7
+
+
+def test_get_contacts_prebuilt(benchmark, session):
+    service = ContactsService(SyncSessionAdapter(session))
+    contacts = benchmark(lambda: run_sync(service.get_contacts(1, 10, 10)))
+    assert len(contacts) == 10
+
+
+def test_get_contacts_select(benchmark, session):
+    def get_contacts(user_id, skip, limit):
+        stmt = select(Contact).where(Contact.user_id == user_id).offset(skip).limit(limit)
+        return session.execute(stmt).scalars().all()
+
+    assert len(benchmark(get_contacts, 1, 10, 10)) == 10
+
+
+def test_search_contacts_prebuilt(benchmark, session):
+    service = ContactsService(SyncSessionAdapter(session))
+    contacts = benchmark(lambda: run_sync(service.search_contacts(1, name="name1", surname="shev")))
+    assert len(contacts) == 11
+
+
+def test_search_contacts_select(benchmark, session):
+    def search_contacts(user_id, name, surname):
+        stmt = select(Contact).where(Contact.user_id == user_id)
+        stmt = stmt.filter(Contact.name.ilike(f"%{name}%"))
+        stmt = stmt.filter(Contact.surname.ilike(f"%{surname}%"))
+        return session.execute(stmt).scalars().all()
+
+    assert len(benchmark(search_contacts, 1, "name1", "shev")) == 11
+
+
+def test_get_user_by_username_prebuilt(benchmark, session):
+    service = UserService(SyncSessionAdapter(session))
+    user = benchmark(lambda: run_sync(service.get_user_by_username("olena")))
+    assert user.id == 1
+
+
+def test_get_user_by_username_select(benchmark, session):
+    def get_user_by_username(username):
+        return session.execute(select(User).filter_by(name=username)).scalar()
+
+    assert benchmark(get_user_by_username, "olena").id == 1
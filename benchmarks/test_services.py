@@ -0,0 +1,75 @@
+"""
+Micro-benchmarks for service-layer functions.
+
+Run through ``benchmarks/micro.py`` to save a baseline and compare against it,
+or directly with ``pytest benchmarks/test_services.py``.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from _helpers import run_sync
+from app.response.schemas import ContactResponse
+from app.services.auth import Hash, create_access_token, get_email_from_token
+from app.services.contacts import ContactsService
+
+TOKEN_DATA = {"id": 1, "sub": "olena.shevchenko@example.com", "name": "olena"}
+
+
+def test_str_to_date(benchmark):
+    result = benchmark(ContactsService.str_to_date, "1990-05-17")
+    assert result.year == 1990
+
+
+def test_str_to_date_invalid(benchmark):
+    assert benchmark(ContactsService.str_to_date, "not-a-date") is None
+
+
+def test_contact_response_from_orm(benchmark, contact):
+    result = benchmark(ContactResponse.from_orm, contact)
+    assert result.birthdate == "1990-05-17"
+
+
+def test_create_access_token(benchmark):
+    token = benchmark(lambda: run_sync(create_access_token(TOKEN_DATA, 3600)))
+    assert token.count(".") == 2
+
+
+def test_get_email_from_token(benchmark):
+    token = run_sync(create_access_token(TOKEN_DATA, 3600))
+    email = benchmark(lambda: run_sync(get_email_from_token(token)))
+    assert email == TOKEN_DATA["sub"]
+
+
+def test_verify_password(benchmark, password_hash):
+    hash_util = Hash()
+    result = benchmark.pedantic(
+        hash_util.verify_password,
+        args=("benchmark-password", password_hash),
+        rounds=10,
+        iterations=1,
+        warmup_rounds=1,
+    )
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"name": "ole"}, {"name": "ole", "surname": "shev", "email": "example"}],
+    ids=["one_filter", "all_filters"],
+)
+def test_search_contacts_query(benchmark, recording_session, filters):
+    service = ContactsService(recording_session)
+    benchmark(lambda: run_sync(service.search_contacts(1, **filters)))
+    assert recording_session.executed
+
+
+def test_search_contacts_compile(benchmark, recording_session):
+    service = ContactsService(recording_session)
+    dialect = postgresql.asyncpg.dialect()
+
+    def build_and_compile():
+        run_sync(service.search_contacts(1, name="ole", surname="shev"))
+        return recording_session.last_statement.compile(dialect=dialect)
+
+    assert "ILIKE" in str(benchmark(build_and_compile)).upper()
@@ -0,0 +1,51 @@
+"""contact stats
+
+Revision ID: 4d8b6e1f0a93
+Revises: 9c4e2a7d1b58
+Create Date: 2026-10-19 11:03:17.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8b6e1f0a93'
+down_revision: Union[str, None] = '9c4e2a7d1b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'contact_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('facet', sa.String(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'facet', 'key'),
+    )
+    # Backfill the counters from the existing contacts.
+    op.execute(
+        "INSERT INTO contact_stats (user_id, facet, key, count) "
+        "SELECT user_id, 'total', '', count(*) FROM contacts WHERE user_id IS NOT NULL GROUP BY user_id"
+    )
+    op.execute(
+        "INSERT INTO contact_stats (user_id, facet, key, count) "
+        "SELECT user_id, 'birth_month', to_char(birthdate, 'MM'), count(*) "
+        "FROM contacts WHERE user_id IS NOT NULL GROUP BY user_id, to_char(birthdate, 'MM')"
+    )
+    op.execute(
+        "INSERT INTO contact_stats (user_id, facet, key, count) "
+        "SELECT user_id, 'email_domain', lower(split_part(email, '@', 2)), count(*) "
+        "FROM contacts WHERE user_id IS NOT NULL GROUP BY user_id, lower(split_part(email, '@', 2))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('contact_stats')
@@ -0,0 +1,33 @@
+"""contact prefix indexes
+
+Revision ID: 7b2f5c9e3d14
+Revises: 4d8b6e1f0a93
+Create Date: 2026-10-19 14:26:51.630148
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2f5c9e3d14'
+down_revision: Union[str, None] = '4d8b6e1f0a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # text_pattern_ops serves LIKE 'prefix%' regardless of the database collation.
+    op.create_index('ix_contacts_user_id_lower_name', 'contacts', ['user_id', sa.text('lower(name) text_pattern_ops')], unique=False)
+    op.create_index('ix_contacts_user_id_lower_surname', 'contacts', ['user_id', sa.text('lower(surname) text_pattern_ops')], unique=False)
+    op.create_index('ix_contacts_user_id_lower_email', 'contacts', ['user_id', sa.text('lower(email) text_pattern_ops')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_id_lower_email', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_lower_surname', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_lower_name', table_name='contacts')
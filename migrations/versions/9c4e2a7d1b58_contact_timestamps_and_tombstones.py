@@ -0,0 +1,45 @@
+"""contact timestamps and tombstones
+
+Revision ID: 9c4e2a7d1b58
+Revises: e04bdcc35bf8
+Create Date: 2026-10-19 10:12:40.215307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2a7d1b58'
+down_revision: Union[str, None] = 'e04bdcc35bf8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows get the migration time; new rows are stamped by the app.
+    op.add_column('contacts', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.add_column('contacts', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+    op.create_index('ix_contacts_user_id_updated_at', 'contacts', ['user_id', 'updated_at'], unique=False)
+    op.create_table(
+        'contact_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('contact_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_contact_tombstones_user_id_deleted_at', 'contact_tombstones', ['user_id', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contact_tombstones_user_id_deleted_at', table_name='contact_tombstones')
+    op.drop_table('contact_tombstones')
+    op.drop_index('ix_contacts_user_id_updated_at', table_name='contacts')
+    op.drop_column('contacts', 'updated_at')
+    op.drop_column('contacts', 'created_at')
@@ -0,0 +1,82 @@
+"""contact normalized lookup keys
+
+Revision ID: e3a91c6f52d7
+Revises: 7b2f5c9e3d14
+Create Date: 2026-10-19 16:08:42.215307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.normalize import normalize_email, normalize_phone
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a91c6f52d7'
+down_revision: Union[str, None] = '7b2f5c9e3d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+contacts = sa.table(
+    'contacts',
+    sa.column('id', sa.Integer),
+    sa.column('phone', sa.String),
+    sa.column('email', sa.String),
+    sa.column('phone_normalized', sa.String),
+    sa.column('email_normalized', sa.String),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('contacts', sa.Column('phone_normalized', sa.String(), nullable=True))
+    op.add_column('contacts', sa.Column('email_normalized', sa.String(), nullable=True))
+
+    # Backfill in ID order with the same normalization the application uses,
+    # one batch of rows at a time.
+    connection = op.get_bind()
+    update = (
+        contacts.update()
+        .where(contacts.c.id == sa.bindparam('contact_id'))
+        .values(
+            phone_normalized=sa.bindparam('phone_value'),
+            email_normalized=sa.bindparam('email_value'),
+        )
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(contacts.c.id, contacts.c.phone, contacts.c.email)
+            .where(contacts.c.id > last_id)
+            .order_by(contacts.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            update,
+            [
+                {
+                    'contact_id': id,
+                    'phone_value': normalize_phone(phone),
+                    'email_value': normalize_email(email),
+                }
+                for id, phone, email in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index('ix_contacts_user_id_phone_normalized', 'contacts', ['user_id', 'phone_normalized'], unique=False)
+    op.create_index('ix_contacts_user_id_email_normalized', 'contacts', ['user_id', 'email_normalized'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_id_email_normalized', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_phone_normalized', table_name='contacts')
+    op.drop_column('contacts', 'email_normalized')
+    op.drop_column('contacts', 'phone_normalized')
@@ -128,6 +128,363 @@ class Settings(BaseSettings):
     The API secret to use when accessing the cloud storage service.
     """
 
+    REDIS_HOST: str = "localhost"
+    """
+    Redis host.
+
+    The host of the Redis server used for caching.
+    """
+
+    REDIS_PORT: int = 6379
+    """
+    Redis port.
+
+    The port of the Redis server used for caching.
+    """
+
+    APP_HOST: str = "127.0.0.1"
+    """
+    Server host.
+
+    The interface the server binds to.
+    """
+
+    APP_PORT: int = 8000
+    """
+    Server port.
+
+    The port the server binds to.
+    """
+
+    APP_WORKERS: int = 0
+    """
+    Server workers.
+
+    The number of production worker processes. Zero uses the number of available CPUs.
+    """
+
+    APP_KEEP_ALIVE_SECONDS: int = 5
+    """
+    Keep-alive timeout.
+
+    How long idle keep-alive connections are held open, in seconds.
+    """
+
+    APP_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    """
+    Graceful shutdown timeout.
+
+    How long in-flight requests are drained on shutdown before connections are closed, in seconds.
+    """
+
+    APP_BACKLOG: int = 2048
+    """
+    Listen backlog.
+
+    The maximum number of pending connections on the listening socket.
+    """
+
+    APP_REUSE_PORT: bool = True
+    """
+    Reuse port.
+
+    Whether the listening socket is bound with SO_REUSEPORT, so a new release can bind the port while the old one drains.
+    """
+
+    DB_POOL_SIZE: int = 5
+    """
+    Database pool size.
+
+    The number of connections kept open in the database pool. Ignored for SQLite.
+    """
+
+    DB_MAX_OVERFLOW: int = 10
+    """
+    Database pool overflow.
+
+    The number of extra connections the pool may open under load. Ignored for SQLite.
+    """
+
+    DB_QUERY_CACHE_SIZE: int = 500
+    """
+    Compiled statement cache size.
+
+    The number of compiled SQL statements the engine keeps, per engine. Raise it when the cache hit ratio drops under load.
+    """
+
+    WARMUP_ENABLED: bool = True
+    """
+    Warm-up enabled.
+
+    Whether connection pools and statement caches are warmed up at startup before the app reports ready.
+    """
+
+    WARMUP_DB_CONNECTIONS: int = 5
+    """
+    Warm-up database connections.
+
+    The number of pooled database connections opened at startup, capped at DB_POOL_SIZE.
+    """
+
+    WARMUP_REDIS_CONNECTIONS: int = 5
+    """
+    Warm-up Redis connections.
+
+    The number of pooled Redis connections opened at startup.
+    """
+
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 1.0
+    """
+    Health check timeout.
+
+    The time each dependency probe of ``/health/ready`` may take before it is reported as timed out.
+    """
+
+    HEALTH_CHECK_CACHE_SECONDS: float = 2.0
+    """
+    Health check cache interval.
+
+    How long a dependency check result is reused, so that frequent probes do not add load.
+    """
+
+    SQL_ECHO: bool = False
+    """
+    SQL echo.
+
+    Whether the database engine logs every statement.
+    """
+
+    SQL_SLOW_QUERY_MS: int = 200
+    """
+    Slow query threshold.
+
+    Statements running longer than this many milliseconds are logged with their parameters.
+    """
+
+    SQL_EXPLAIN_SLOW_QUERIES: bool = False
+    """
+    Explain slow queries.
+
+    Whether slow statements are logged together with their EXPLAIN plan.
+    """
+
+    SQL_LOG_PARAMETERS: bool = False
+    """
+    Log query parameters.
+
+    Whether slow-query logs include bound parameter values. Off by default because they may hold passwords, tokens or personal data.
+    """
+
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    """
+    N+1 threshold.
+
+    The number of times an identical statement may run in one request before it is reported as a possible N+1.
+    """
+
+    PROFILING_SAMPLE_RATE: float = 0.0
+    """
+    Profiling sample rate.
+
+    The fraction of requests (0.0 - 1.0) to capture a profile for. Profiling is disabled when zero.
+    """
+
+    PROFILING_SECRET: str | None = None
+    """
+    Profiling secret.
+
+    The secret used to sign the debug header that forces profiling of a single request.
+    """
+
+    PROFILING_DIR: str = "profiles"
+    """
+    Profiling directory.
+
+    The directory where captured profiles are written.
+    """
+
+    CONTACTS_BATCH_LIMIT: int = 100
+    """
+    Contacts batch limit.
+
+    The maximum number of contacts a single batch request may read, update or delete.
+    """
+
+    CONTACTS_SYNC_OVERLAP_SECONDS: float = 5.0
+    """
+    Contacts sync overlap.
+
+    How far before the query time a sync token points. Writes whose transaction started before a sync but committed after it are picked up by the next sync; clients must apply changes idempotently.
+    """
+
+    CONTACTS_STREAM_QUEUE_SIZE: int = 100
+    """
+    Contacts stream queue size.
+
+    The number of events buffered per stream connection. A client that falls further behind gets an ``overflow`` event and must resync.
+    """
+
+    CONTACTS_STREAM_KEEPALIVE_SECONDS: float = 15.0
+    """
+    Contacts stream keep-alive interval.
+
+    How often an idle stream sends a comment line, so proxies do not close it.
+    """
+
+    USER_DELETE_CHUNK_SIZE: int = 1000
+    """
+    User deletion chunk size.
+
+    The number of contacts deleted per transaction when a user is deleted in the background, which keeps each lock short.
+    """
+
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    """
+    Default statement timeout.
+
+    The PostgreSQL ``statement_timeout`` in milliseconds applied to every transaction opened for a request. 0 leaves the server default in place.
+    """
+
+    DB_ROUTE_STATEMENT_TIMEOUTS_MS: dict[str, int] = {"/api/contacts/search": 2000}
+    """
+    Per-route statement timeouts.
+
+    Statement timeouts in milliseconds keyed by route template, overriding ``DB_STATEMENT_TIMEOUT_MS`` for routes whose queries can run away. Set as JSON in the environment.
+    """
+
+    ADMISSION_CONTROL_ENABLED: bool = True
+    """
+    Admission control switch.
+
+    Whether requests are admitted through per-route-group concurrency limits and shed with 503 when a group's queue is full.
+    """
+
+    ADMISSION_CONCURRENCY: dict[str, int] = {"search": 8, "auth": 4, "default": 64}
+    """
+    Admission concurrency limits.
+
+    The maximum number of requests served at once per route group. With adaptive limits this is the ceiling the limit grows back to.
+    """
+
+    ADMISSION_QUEUE_SIZE: dict[str, int] = {"search": 16, "auth": 16, "default": 256}
+    """
+    Admission queue sizes.
+
+    The number of requests per route group allowed to wait for a slot. Further requests are rejected straight away.
+    """
+
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    """
+    Admission queue timeout.
+
+    How long a request waits for a slot before it is rejected.
+    """
+
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    """
+    Admission retry delay.
+
+    The ``Retry-After`` value sent with rejected requests.
+    """
+
+    ADMISSION_LATENCY_TARGET_MS: dict[str, float] = {}
+    """
+    Admission latency targets.
+
+    Per route group latency targets that turn on adaptive (AIMD) limits: the limit grows by one per window of requests served within the target and shrinks by ``ADMISSION_BACKOFF`` when one is slower. Groups without a target keep a fixed limit.
+    """
+
+    ADMISSION_BACKOFF: float = 0.9
+    """
+    Admission backoff factor.
+
+    The factor an adaptive limit is multiplied by when a request exceeds the latency target.
+    """
+
+    COMPRESSION_ENABLED: bool = True
+    """
+    Response compression switch.
+
+    Whether responses are compressed with brotli, zstd or gzip, as negotiated with the client. Brotli and zstd need the ``compression`` extra.
+    """
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    """
+    Response compression threshold.
+
+    The smallest response body, in bytes, worth compressing. Streaming responses are always compressed.
+    """
+
+    CONTACTS_SUGGEST_LIMIT: int = 10
+    """
+    Contacts suggestion limit.
+
+    The maximum number of suggestions returned for a prefix.
+    """
+
+    CONTACTS_SUGGEST_HOT_REQUESTS: int = 3
+    """
+    Contacts suggestion hot threshold.
+
+    The number of suggestion requests from a user within ``CONTACTS_SUGGEST_INDEX_TTL_SECONDS`` after which the worker builds an in-memory prefix index for that user.
+    """
+
+    CONTACTS_SUGGEST_INDEX_USERS: int = 1000
+    """
+    Contacts suggestion index capacity.
+
+    The number of users whose prefix index a worker keeps; the least recently used one is evicted first.
+    """
+
+    CONTACTS_SUGGEST_INDEX_MAX_CONTACTS: int = 20000
+    """
+    Contacts suggestion index size limit.
+
+    Users with more contacts than this are always served from the database.
+    """
+
+    CONTACTS_SUGGEST_INDEX_TTL_SECONDS: float = 30.0
+    """
+    Contacts suggestion index lifetime.
+
+    How long a prefix index is used. Writes in the same worker drop it at once; this bounds how stale it can be after a write in another worker.
+    """
+
+    CONTACTS_INDEX_ENABLED: bool = False
+    """
+    Contact index switch.
+
+    Whether search and upcoming birthdays are served from per-user in-memory contact indexes for users with many contacts.
+    """
+
+    CONTACTS_INDEX_MIN_CONTACTS: int = 5000
+    """
+    Contact index threshold.
+
+    The number of contacts a user needs before their contacts are indexed in memory.
+    """
+
+    CONTACTS_INDEX_MEMORY_BYTES: int = 64 * 1024 * 1024
+    """
+    Contact index memory budget.
+
+    The estimated memory all contact indexes of a worker may use; the least recently used index is evicted beyond it.
+    """
+
+    CONTACTS_INDEX_TTL_SECONDS: float = 300.0
+    """
+    Contact index lifetime.
+
+    How long a contact index is used before it is reloaded. Writes keep indexes current and changes from other workers drop them, so this only bounds staleness when events are lost.
+    """
+
+    CONTACTS_PHONE_COUNTRY_CODE: str = ""
+    """
+    Default phone country code.
+
+    The calling code, e.g. ``380``, assumed for contact phone numbers written without an international prefix; a leading trunk ``0`` is dropped. When empty, such numbers are taken to start with their country code.
+    """
+
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
     )
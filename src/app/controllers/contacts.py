@@ -1,7 +1,38 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.contacts import ContactsService
-from app.response.schemas import ContactBase, ContactCreate,ContactUpdate, ContactResponse
+from datetime import datetime, UTC
+
+import time
+
+from collections import Counter
+
+from app.services.contacts import ContactsService, stat_keys
+from app.services.single_flight import SingleFlight, single_flight
+from app.services.suggest import PrefixIndex, suggest_indexes
+from app.config.config import settings
+from app.services.sync import decode_sync_token, next_sync_token
+from app.response.schemas import ContactBase, ContactCreate,ContactUpdate, ContactResponse, ContactBatchUpdateItem
+from app.response.schemas import ContactFieldsResponse
+
+
+contact_reads = SingleFlight()
+"""
+Concurrent identical contact reads, grouped by user.
+
+Writes forget the user's in-flight reads once they complete, so a read that
+started before a write is never shared with a request made after it.
+"""
+
+
+def contacts_changed(user_id: int) -> None:
+    """
+    Drop what this worker holds about a user's contacts after a write.
+
+    Args:
+        user_id (int): The ID of the user.
+    """
+    contact_reads.forget(user_id)
+    suggest_indexes.invalidate(user_id)
 
 
 class ContactsController:
@@ -26,23 +57,48 @@ class ContactsController:
             ContactCreate: The created contact.
         """
         created_contact = await self.db.create_contact(contact)
+        contacts_changed(contact.user_id)
         return ContactResponse.from_orm(created_contact)
 
-    async def get_contacts(self, user_id: int, skip: int = 0, limit: int = 10) -> dict:
+    @single_flight(contact_reads, group="user_id")
+    async def get_contacts(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        include_total: bool = False,
+        facets: list[str] = (),
+        fields: tuple[str, ...] | None = None,
+    ) -> dict:
         """
         Get a list of contacts for a user.
 
+        The total and facet counts come from per-user counters, not from
+        counting rows.
+
         Args:
             user_id (int): The ID of the user.
             skip (int, optional): The number of contacts to skip. Defaults to 0.
             limit (int, optional): The maximum number of contacts to return. Defaults to 10.
+            include_total (bool, optional): Whether to include the total. Defaults to False.
+            facets (list[str], optional): The facets to count. Defaults to none.
+            fields (tuple[str, ...], optional): The fields to return. Defaults to all.
 
         Returns:
-            dict: A dictionary containing the list of contacts.
+            dict: A dictionary containing the list of contacts, and the total and
+                facet counts when requested.
         """
-        contacts = await self.db.get_contacts(user_id, skip, limit)
-        return {"contacts": [ContactResponse.from_orm(contact) for contact in contacts]}
+        contacts = await self.db.get_contacts(user_id, skip, limit, fields)
+        response = {"contacts": self._serialize(contacts, fields)}
+        if include_total or facets:
+            total, counts = await self.db.get_stats(user_id, list(facets))
+            if include_total:
+                response["total"] = total
+            if facets:
+                response["facets"] = counts
+        return response
 
+    @single_flight(contact_reads, group="user_id")
     async def get_by_id(self, user_id: int, id: int) -> ContactResponse | None:
         """
         Get a contact by ID.
@@ -72,6 +128,7 @@ class ContactsController:
             ContactResponse: The updated contact.
         """
         updated_contact = await self.db.update_contact(user_id, id, contact)
+        contacts_changed(user_id)
         return ContactResponse.from_orm(updated_contact)
 
     async def delete_contact(self, user_id: int, id: int) -> ContactBase:
@@ -86,35 +143,224 @@ class ContactsController:
             ContactBase: The deleted contact.
         """
         deleted_contact = await self.db.delete_contact(user_id, id)
+        contacts_changed(user_id)
         return ContactResponse.from_orm(deleted_contact)
 
+    @single_flight(contact_reads, group="user_id")
+    async def get_by_ids(self, user_id: int, ids: list[int]) -> dict:
+        """
+        Get several contacts by ID.
+
+        Args:
+            user_id (int): The ID of the user.
+            ids (list[int]): The IDs of the contacts.
+
+        Returns:
+            dict: A dictionary containing one result per ID, in request order.
+        """
+        contacts = await self.db.get_by_ids(user_id, ids)
+        return self._batch_results(ids, contacts)
+
+    async def update_contacts(
+        self, user_id: int, updates: list[ContactBatchUpdateItem]
+    ) -> dict:
+        """
+        Update several contacts.
+
+        Args:
+            user_id (int): The ID of the user.
+            updates (list[ContactBatchUpdateItem]): The changes, each with its contact ID.
+
+        Returns:
+            dict: A dictionary containing one result per change, in request order.
+        """
+        contacts = await self.db.update_contacts(user_id, updates)
+        contacts_changed(user_id)
+        return self._batch_results([update.id for update in updates], contacts)
+
+    async def delete_contacts(self, user_id: int, ids: list[int]) -> dict:
+        """
+        Delete several contacts.
+
+        Args:
+            user_id (int): The ID of the user.
+            ids (list[int]): The IDs of the contacts.
+
+        Returns:
+            dict: A dictionary containing one result per ID, in request order.
+        """
+        deleted = await self.db.delete_contacts(user_id, ids)
+        contacts_changed(user_id)
+        return {
+            "results": [
+                {"id": id, "status": "ok" if id in deleted else "not_found"}
+                for id in ids
+            ]
+        }
+
+    @staticmethod
+    def _serialize(contacts, fields: tuple[str, ...] | None) -> list:
+        if fields is None:
+            return [ContactResponse.from_orm(contact) for contact in contacts]
+        return [ContactFieldsResponse.from_orm(contact, fields) for contact in contacts]
+
+    @staticmethod
+    def _batch_results(ids: list[int], contacts: dict) -> dict:
+        results = []
+        for id in ids:
+            contact = contacts.get(id)
+            if contact is None:
+                results.append({"id": id, "status": "not_found"})
+            else:
+                results.append(
+                    {"id": id, "status": "ok", "contact": ContactResponse.from_orm(contact)}
+                )
+        return {"results": results}
+
+    @single_flight(contact_reads, group="user_id")
+    async def get_changes(self, user_id: int, since: str | None = None) -> dict:
+        """
+        Get the contacts changed and deleted since a sync token.
+
+        Args:
+            user_id (int): The ID of the user.
+            since (str, optional): The sync token from the previous sync, or None
+                for a full sync.
+
+        Returns:
+            dict: The changed contacts, the deleted IDs and the next sync token.
+
+        Raises:
+            InvalidSyncToken: If the sync token is malformed.
+        """
+        started_at = datetime.now(UTC)
+        changed, deleted = await self.db.get_changes(
+            user_id, decode_sync_token(since) if since else None
+        )
+        return {
+            "changed": [ContactResponse.from_orm(contact) for contact in changed],
+            "deleted": deleted,
+            "next_token": next_sync_token(started_at),
+        }
+
+    @single_flight(contact_reads, group="user_id")
     async def search_contact(
-        self, user_id: int, name: str = None, surname: str = None, email: str = None
+        self,
+        user_id: int,
+        name: str = None,
+        surname: str = None,
+        email: str = None,
+        include_total: bool = False,
+        facets: list[str] = (),
+        fields: tuple[str, ...] | None = None,
     ) -> dict:
         """
         Search for contacts.
 
+        Search results are not paginated, so the total and facet counts are
+        computed from the results without another query.
+
         Args:
             user_id (int): The ID of the user.
             name (str, optional): The name to search for. Defaults to None.
             surname (str, optional): The surname to search for. Defaults to None.
             email (str, optional): The email to search for. Defaults to None.
+            include_total (bool, optional): Whether to include the total. Defaults to False.
+            facets (list[str], optional): The facets to count. Defaults to none.
+            fields (tuple[str, ...], optional): The fields to return. Defaults to all.
 
         Returns:
-            dict: A dictionary containing the list of matching contacts.
+            dict: A dictionary containing the list of matching contacts, and the
+                total and facet counts when requested.
         """
-        contacts = await self.db.search_contacts(user_id, name, surname, email)
-        return {"contacts": [ContactResponse.from_orm(contact) for contact in contacts]}
+        loaded = fields
+        if fields is not None and facets:
+            # Facets are counted from the birthdate and email of each result.
+            loaded = tuple(dict.fromkeys((*fields, "birthdate", "email")))
+        contacts = await self.db.search_contacts(user_id, name, surname, email, loaded)
+        response = {"contacts": self._serialize(contacts, fields)}
+        if include_total:
+            response["total"] = len(contacts)
+        if facets:
+            counts = Counter(
+                key
+                for contact in contacts
+                for key in stat_keys(contact.birthdate, contact.email)
+            )
+            response["facets"] = {facet: {} for facet in facets}
+            for (facet, key), count in counts.items():
+                if facet in response["facets"]:
+                    response["facets"][facet][key] = count
+        return response
 
-    async def get_upcoming_birthdays(self, user_id: int) -> dict:
+    @single_flight(contact_reads, group="user_id")
+    async def lookup(
+        self,
+        user_id: int,
+        phone: str = None,
+        email: str = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> dict:
+        """
+        Find contacts by phone number or email.
+
+        Args:
+            user_id (int): The ID of the user.
+            phone (str, optional): The phone number, in any format.
+            email (str, optional): The email, in any case.
+            fields (tuple[str, ...], optional): The fields to return. Defaults to all.
+
+        Returns:
+            dict: A dictionary containing the matching contacts.
+        """
+        contacts = await self.db.lookup_contacts(user_id, phone, email, fields)
+        return {"contacts": self._serialize(contacts, fields)}
+
+    @single_flight(contact_reads, group="user_id")
+    async def suggest(self, user_id: int, prefix: str, limit: int) -> dict:
+        """
+        Get contacts whose name, surname or email starts with a prefix.
+
+        Hot users are served from an in-memory prefix index, built with one
+        query; everyone else from the prefix indexes in the database.
+
+        Args:
+            user_id (int): The ID of the user.
+            prefix (str): The prefix.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            dict: A dictionary containing the suggested contacts.
+        """
+        index = suggest_indexes.get(user_id)
+        if index is None and suggest_indexes.is_hot(user_id):
+            max_contacts = settings.CONTACTS_SUGGEST_INDEX_MAX_CONTACTS
+            started = time.monotonic()
+            rows = await self.db.get_suggest_entries(user_id, max_contacts + 1)
+            if len(rows) > max_contacts:
+                suggest_indexes.mark_too_large(user_id)
+            else:
+                index = PrefixIndex(rows, built_at=started)
+                suggest_indexes.put(user_id, index)
+        if index is not None:
+            contacts = index.search(prefix, limit)
+        else:
+            contacts = await self.db.suggest_contacts(user_id, prefix, limit)
+        return {"contacts": [ContactFieldsResponse(**contact) for contact in contacts]}
+
+    @single_flight(contact_reads, group="user_id")
+    async def get_upcoming_birthdays(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ) -> dict:
         """
         Get a list of contacts with upcoming birthdays.
 
         Args:
             user_id (int): The ID of the user.
+            fields (tuple[str, ...], optional): The fields to return. Defaults to all.
 
         Returns:
             dict: A dictionary containing the list of contacts with upcoming birthdays.
         """
-        contacts = await self.db.get_upcoming_birthdays(user_id)
-        return {"contacts": [ContactResponse.from_orm(contact) for contact in contacts]}
\ No newline at end of file
+        contacts = await self.db.get_upcoming_birthdays(user_id, fields)
+        return {"contacts": self._serialize(contacts, fields)}
\ No newline at end of file
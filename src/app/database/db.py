@@ -1,12 +1,64 @@
 import contextlib
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 from app.config.config import settings as config
+from app.database.instrumentation import instrument_engine
+
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Enforce foreign keys, and with them ``ON DELETE CASCADE``, on SQLite.
+
+    SQLite ignores foreign keys unless each connection turns them on.
+    Other databases are left alone.
+
+    Args:
+        engine (AsyncEngine): The engine.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _enable_foreign_keys)
+
+
+class TimeoutSession(Session):
+    """
+    Session that applies ``info["statement_timeout_ms"]`` to each transaction.
+    """
+
+
+@event.listens_for(TimeoutSession, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    timeout = session.info.get("statement_timeout_ms")
+    if timeout and connection.dialect.name == "postgresql":
+        # SET LOCAL lasts until the transaction ends, so the pooled
+        # connection goes back without the setting.
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+def statement_timeout(route: str | None) -> int:
+    """
+    Get the statement timeout for a route.
+
+    Args:
+        route (str | None): The route template.
+
+    Returns:
+        int: The timeout in milliseconds, or 0 for none.
+    """
+    return config.DB_ROUTE_STATEMENT_TIMEOUTS_MS.get(route, config.DB_STATEMENT_TIMEOUT_MS)
 
 
 class DatabaseSessionManager:
@@ -23,25 +75,82 @@ class DatabaseSessionManager:
         Args:
             url (str): The URL of the database to connect to.
         """
-        self._engine: AsyncEngine | None = create_async_engine(url)
-        self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
-        )
+        self._url = url
+        self._engine: AsyncEngine | None = None
+        self._session_maker: async_sessionmaker | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        Get the database engine.
+
+        The engine, and with it the database driver, is created on first use
+        so that importing the application stays cheap.
+
+        Returns:
+            AsyncEngine: The database engine.
+        """
+        self._ensure_engine()
+        return self._engine
+
+    def _ensure_engine(self) -> None:
+        """
+        Create the engine and session factory if they do not exist yet.
+
+        Also recreates them after ``close()``, so the manager can be reused.
+        """
+        if self._engine is None:
+            pool_options = {}
+            if not self._url.startswith("sqlite"):
+                pool_options = {
+                    "pool_size": config.DB_POOL_SIZE,
+                    "max_overflow": config.DB_MAX_OVERFLOW,
+                }
+            self._engine = create_async_engine(
+                self._url,
+                echo=config.SQL_ECHO,
+                query_cache_size=config.DB_QUERY_CACHE_SIZE,
+                **pool_options,
+            )
+            instrument_engine(self._engine)
+            enable_sqlite_foreign_keys(self._engine)
+            # Instances stay loaded after commit, so returning a just-written
+            # row does not cost another SELECT.
+            self._session_maker = async_sessionmaker(
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+                bind=self._engine,
+                sync_session_class=TimeoutSession,
+            )
+
+    async def close(self):
+        """
+        Dispose of the engine and close all pooled connections.
+        """
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_maker = None
 
     @contextlib.asynccontextmanager
-    async def session(self):
+    async def session(self, statement_timeout_ms: int = 0):
         """
         Get a database session.
 
         This method yields a database session that can be used to execute queries.
         If an error occurs, the session is rolled back and the error is re-raised.
 
+        Args:
+            statement_timeout_ms (int): The PostgreSQL statement timeout applied to
+                each transaction of the session, or 0 for the server default.
+
         Yields:
             AsyncSession: The database session.
         """
-        if self._session_maker is None:
-            raise Exception("Database session is not initialized")
+        self._ensure_engine()
         session = self._session_maker()
+        session.info["statement_timeout_ms"] = statement_timeout_ms
         try:
             yield session
         except SQLAlchemyError as e:
@@ -54,14 +163,25 @@ class DatabaseSessionManager:
 sessionmanager = DatabaseSessionManager(config.DB_URL)
 
 
-async def get_db():
+async def get_db(request: Request):
     """
     Get a database session.
 
     This function yields a database session that can be used to execute queries.
+    The session is lazy: it checks a connection out of the pool only when the
+    first statement runs, and gives it back when the transaction ends with
+    ``commit()``, ``rollback()`` or ``close()``. A request that never queries,
+    such as one authenticated from the Redis cache, never touches the pool.
+
+    Each transaction gets the statement timeout configured for the route, so a
+    runaway query cannot pin a connection.
+
+    Args:
+        request (Request): The request.
 
     Yields:
         AsyncSession: The database session.
     """
-    async with sessionmanager.session() as session:
+    route = getattr(request.scope.get("route"), "path", None)
+    async with sessionmanager.session(statement_timeout(route)) as session:
         yield session
\ No newline at end of file
@@ -0,0 +1,219 @@
+import contextlib
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.config import settings as config
+from app.services.metrics import DB_QUERY_DURATION
+
+logger = logging.getLogger("app.sql")
+"""
+Logger for slow statements and N+1 warnings.
+"""
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when a block of code executes more SQL statements than allowed.
+    """
+
+
+class QueryLog:
+    """
+    SQL statements executed during a request or a tracked block of code.
+
+    Logs can be nested; a statement is recorded in the current log and every
+    enclosing one.
+    """
+
+    def __init__(self, parent: "QueryLog | None" = None):
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """
+        Record an executed statement.
+
+        Args:
+            statement (str): The SQL statement.
+            elapsed (float): The execution time in seconds.
+        """
+        log = self
+        while log is not None:
+            log.count += 1
+            log.duration += elapsed
+            log.statements[statement] += 1
+            log = log.parent
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Get statements executed at least ``threshold`` times.
+
+        Identical statement text with different parameters is the typical
+        shape of an N+1 query pattern.
+
+        Args:
+            threshold (int): The minimum number of executions.
+
+        Returns:
+            list[tuple[str, int]]: The statements and their execution counts.
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, route: str) -> None:
+        """
+        Log N+1 candidates found in this log.
+
+        Args:
+            route (str): The route the statements were executed for.
+        """
+        for statement, count in self.repeated(config.SQL_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s: statement executed %d times: %s",
+                route,
+                count,
+                statement,
+            )
+
+
+_current_query_log: ContextVar[QueryLog | None] = ContextVar(
+    "current_query_log", default=None
+)
+
+
+def start_query_log() -> tuple[QueryLog, object]:
+    """
+    Start recording SQL statements in the current context.
+
+    Returns:
+        tuple: The query log and the context token used to reset it.
+    """
+    log = QueryLog(parent=_current_query_log.get())
+    return log, _current_query_log.set(log)
+
+
+def finish_query_log(token) -> None:
+    """
+    Stop recording SQL statements in the current context.
+
+    Args:
+        token: The token returned by ``start_query_log``.
+    """
+    _current_query_log.reset(token)
+
+
+@contextlib.contextmanager
+def track_queries():
+    """
+    Record SQL statements executed inside the block.
+
+    Yields:
+        QueryLog: The query log.
+    """
+    log, token = start_query_log()
+    try:
+        yield log
+    finally:
+        finish_query_log(token)
+
+
+@contextlib.contextmanager
+def query_budget(max_queries: int):
+    """
+    Fail when the block executes more than ``max_queries`` SQL statements.
+
+    Args:
+        max_queries (int): The maximum number of statements allowed.
+
+    Yields:
+        QueryLog: The query log.
+
+    Raises:
+        QueryBudgetExceeded: If the budget is exceeded.
+    """
+    with track_queries() as log:
+        yield log
+    if log.count > max_queries:
+        statements = "\n".join(
+            f"  {count}x {statement}" for statement, count in log.statements.items()
+        )
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, got {log.count}:\n{statements}"
+        )
+
+
+def _explain(conn, statement, parameters) -> str | None:
+    """
+    Get the query plan for a statement using a separate cursor.
+
+    The EXPLAIN runs inside a savepoint, so a failing EXPLAIN rolls back to it
+    instead of aborting the transaction the request is still using.
+    """
+    if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+        return None
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT sql_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT sql_explain")
+            return f"EXPLAIN failed: {e}"
+        finally:
+            cursor.execute("RELEASE SAVEPOINT sql_explain")
+        return "\n".join(" ".join(str(col) for col in row) for row in rows)
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed)
+
+    log = _current_query_log.get()
+    if log is not None:
+        log.record(statement, elapsed)
+
+    if elapsed * 1000 >= config.SQL_SLOW_QUERY_MS:
+        plan = None
+        if config.SQL_EXPLAIN_SLOW_QUERIES and not executemany:
+            plan = _explain(conn, statement, parameters)
+        logger.warning(
+            "Slow query (%.1f ms): %s\nParameters: %r%s",
+            elapsed * 1000,
+            statement,
+            parameters if config.SQL_LOG_PARAMETERS else "[redacted]",
+            f"\nPlan:\n{plan}" if plan else "",
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Attach statement timing, query logging and slow-query detection to an engine.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,11 +1,21 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Enum as SqlEnum
-from sqlalchemy.orm import declarative_base, relationship
-from datetime import datetime
-from typing import Optional
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Index, Enum as SqlEnum, func
+from sqlalchemy.orm import declarative_base, deferred, relationship
+from datetime import datetime, UTC
 from enum import Enum
 
 Base = declarative_base()
 
+
+def utcnow() -> datetime:
+    """
+    Get the current time in UTC.
+
+    Returns:
+        datetime: The current time.
+    """
+    return datetime.now(UTC)
+
+
 class UserRole(str, Enum):
     USER = "USER"
     ADMIN = "ADMIN"
@@ -18,6 +28,10 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
+    """
+    Fetch server-generated values with RETURNING when a row is written.
+    """
 
     id = Column(Integer, primary_key=True, index=True)
     """
@@ -61,11 +75,14 @@ class User(Base):
     Whether the user has confirmed their email address.
     """
 
-    contacts = relationship("Contact", back_populates="user", cascade="all, delete")
+    contacts = relationship(
+        "Contact", back_populates="user", cascade="all, delete", passive_deletes=True
+    )
     """
     User contacts.
 
-    The contacts associated with the user.
+    The contacts associated with the user. Deleting a user leaves the
+    contacts to the ``ON DELETE CASCADE`` foreign key instead of loading them.
     """
     role = Column(SqlEnum(UserRole), default=UserRole.USER, nullable=False)
     """
@@ -82,6 +99,21 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_contacts_user_id_phone_normalized", "user_id", "phone_normalized"),
+        Index("ix_contacts_user_id_email_normalized", "user_id", "email_normalized"),
+    )
+    """
+    Table arguments.
+
+    The ``(user_id, updated_at)`` index backs the delta sync query; the
+    indexes on the normalized phone and email back the contact lookup.
+    """
+    __mapper_args__ = {"eager_defaults": True}
+    """
+    Fetch server-generated values with RETURNING when a row is written.
+    """
 
     id = Column(Integer, primary_key=True, index=True)
     """
@@ -118,6 +150,22 @@ class Contact(Base):
     The phone number of the contact.
     """
 
+    phone_normalized = Column(String, nullable=True)
+    """
+    Normalized contact phone.
+
+    The phone number in E.164 form, maintained by ``ContactsService`` on
+    write; None if the number could not be normalized.
+    """
+
+    email_normalized = Column(String, nullable=True)
+    """
+    Normalized contact email.
+
+    The trimmed, lower-cased email address, maintained by ``ContactsService``
+    on write.
+    """
+
     birthdate = Column(Date, nullable=False)
     """
     Contact birthdate.
@@ -125,11 +173,12 @@ class Contact(Base):
     The birthdate of the contact.
     """
 
-    notes: Optional[str] = Column(String, nullable=True)
+    notes = deferred(Column(String, nullable=True))
     """
     Contact notes.
 
-    Any additional notes about the contact.
+    Any additional notes about the contact. The text is unbounded, so it is
+    deferred: queries that return it load it with ``undefer()``.
     """
 
     user_id = Column(
@@ -141,9 +190,127 @@ class Contact(Base):
     The ID of the user who owns the contact.
     """
 
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    """
+    Creation time.
+
+    When the contact was created.
+    """
+
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow
+    )
+    """
+    Update time.
+
+    When the contact was last created or changed. Used by the delta sync.
+    """
+
     user = relationship("User", back_populates="contacts")
     """
     User.
 
     The user who owns the contact.
-    """
\ No newline at end of file
+    """
+
+
+SUGGEST_INDEXES = tuple(
+    Index(
+        f"ix_contacts_user_id_lower_{field}",
+        Contact.user_id,
+        func.lower(getattr(Contact, field)).label(f"lower_{field}"),
+        postgresql_ops={f"lower_{field}": "text_pattern_ops"},
+    )
+    for field in ("name", "surname", "email")
+)
+"""
+Prefix indexes on the lower-cased name, surname and email of a user's contacts.
+
+``text_pattern_ops`` lets PostgreSQL answer ``lower(column) LIKE 'prefix%'``
+with a B-tree range scan whatever the database collation is.
+"""
+
+
+class ContactTombstone(Base):
+    """
+    Contact tombstone model.
+
+    This class records a deleted contact so that the delta sync can report it.
+    """
+
+    __tablename__ = "contact_tombstones"
+    __table_args__ = (
+        Index("ix_contact_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+    """
+    Table arguments.
+
+    The ``(user_id, deleted_at)`` index backs the delta sync query.
+    """
+
+    id = Column(Integer, primary_key=True)
+    """
+    Tombstone ID.
+
+    The unique identifier for the tombstone.
+    """
+
+    contact_id = Column(Integer, nullable=False)
+    """
+    Contact ID.
+
+    The ID of the deleted contact.
+    """
+
+    user_id = Column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    """
+    User ID.
+
+    The ID of the user who owned the contact.
+    """
+
+    deleted_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    """
+    Deletion time.
+
+    When the contact was deleted.
+    """
+
+
+class ContactStat(Base):
+    """
+    Contact statistics model.
+
+    This class holds per-user contact counters, maintained on every write, so
+    that totals and facet counts are read without counting rows.
+    """
+
+    __tablename__ = "contact_stats"
+
+    user_id = Column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    """
+    User ID.
+
+    The ID of the user the counter belongs to.
+    """
+
+    facet = Column(String, primary_key=True)
+    """
+    Facet.
+
+    The counter group: ``total``, ``birth_month`` or ``email_domain``.
+    """
+
+    key = Column(String, primary_key=True)
+    """
+    Facet key.
+
+    The value counted, e.g. ``05`` for May or ``example.com``; empty for ``total``.
+    """
+
+    count = Column(Integer, nullable=False, default=0)
+    """
+    Count.
+
+    The number of the user's contacts with this facet key.
+    """
@@ -1,9 +1,48 @@
 from fastapi import FastAPI
-import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager, suppress
+from importlib.util import find_spec
+import asyncio
 import logging
+import os
+import socket
 
-app = FastAPI()
+from app.config.config import settings
+from app.middleware.admission import AdmissionControlMiddleware, build_limiters
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.disconnect import DisconnectCancelMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.database.db import sessionmanager
+from app.services.cache import redis_client
+from app.services.warmup import warm_up_until_ready
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up pools and caches in the background on startup, and close them on shutdown.
+
+    The app reports ready on ``/health/ready`` only once the warm-up has completed,
+    or immediately when ``WARMUP_ENABLED`` is off.
+    """
+    warmup = None
+    if settings.WARMUP_ENABLED:
+        app.state.ready = False
+        logging.info("Starting warm-up of connection pools and statement caches")
+        warmup = asyncio.create_task(warm_up_until_ready(app, sessionmanager, redis_client))
+    else:
+        app.state.ready = True
+    yield
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    await sessionmanager.close()
+    await redis_client.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 """
 Define the allowed origins for CORS.
@@ -24,24 +63,150 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+"""
+Add admission control middleware to the app. It sits inside the disconnect
+middleware, so a client that gives up also leaves the queue.
+"""
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters=build_limiters(settings),
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+
+"""
+Add disconnect cancellation middleware to the app.
+"""
+app.add_middleware(DisconnectCancelMiddleware)
+
+"""
+Add metrics middleware to the app.
+"""
+app.add_middleware(MetricsMiddleware)
+
+"""
+Add response compression middleware to the app.
+"""
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+    )
+
+"""
+Add profiling middleware to the app when sampling or the debug header is enabled.
+"""
+if settings.PROFILING_SAMPLE_RATE > 0 or settings.PROFILING_SECRET:
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        secret=settings.PROFILING_SECRET,
+        directory=settings.PROFILING_DIR,
+    )
+
 """
 Import and include routers for the app.
 """
-from app.routes import auth, contacts, user 
+from app.routes import auth, contacts, user, metrics, admin, health
 app.include_router(contacts.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(user.router, prefix="/api")
+app.include_router(admin.router, prefix="/api")
+app.include_router(metrics.router)
+app.include_router(health.router)
 
 
 def main():
     """
-    Run the app using uvicorn.
+    Run the app using uvicorn in development mode, with auto-reload.
     """
+    import uvicorn
+
     try:
-        uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=True, workers=2)
+        uvicorn.run(
+            "app.main:app", host=settings.APP_HOST, port=settings.APP_PORT, reload=True
+        )
         logging.info("App started")
     except Exception as e:
         logging.error(f"Error starting app: {e}")
 
+
+def worker_count() -> int:
+    """
+    Get the number of production worker processes.
+
+    Returns:
+        int: ``APP_WORKERS`` if set, otherwise the number of CPUs available to the process.
+    """
+    if settings.APP_WORKERS > 0:
+        return settings.APP_WORKERS
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def bind_socket(host: str, port: int, reuse_port: bool, backlog: int) -> socket.socket:
+    """
+    Bind the listening socket shared by all worker processes.
+
+    Args:
+        host (str): The interface to bind to.
+        port (int): The port to bind to.
+        reuse_port (bool): Whether to set SO_REUSEPORT.
+        backlog (int): The listen backlog.
+
+    Returns:
+        socket.socket: The listening socket.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port and hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve():
+    """
+    Run the app using uvicorn in production mode.
+
+    Starts one worker process per CPU without the reload file watcher, using
+    uvloop and httptools when they are installed. Workers share a single
+    listening socket bound with SO_REUSEPORT and drain in-flight requests on
+    shutdown.
+    """
+    import uvicorn
+    from uvicorn.supervisors import Multiprocess
+
+    workers = worker_count()
+    config = uvicorn.Config(
+        "app.main:app",
+        host=settings.APP_HOST,
+        port=settings.APP_PORT,
+        workers=workers,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        backlog=settings.APP_BACKLOG,
+        timeout_keep_alive=settings.APP_KEEP_ALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.APP_GRACEFUL_SHUTDOWN_SECONDS,
+        access_log=False,
+        proxy_headers=True,
+    )
+    server = uvicorn.Server(config)
+    sock = bind_socket(
+        settings.APP_HOST, settings.APP_PORT, settings.APP_REUSE_PORT, settings.APP_BACKLOG
+    )
+    logging.info(f"Serving on {settings.APP_HOST}:{settings.APP_PORT} with {workers} workers")
+    try:
+        if workers > 1:
+            Multiprocess(config, target=server.run, sockets=[sock]).run()
+        else:
+            server.run(sockets=[sock])
+    finally:
+        sock.close()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import re
+import time
+from collections import deque
+
+from app.services.metrics import ADMISSION_LIMIT, ADMISSION_REJECTED
+
+ROUTE_GROUPS = (
+    ("GET", re.compile(r"^/api/contacts/stream/?$"), None),
+    ("GET", re.compile(r"^/api/contacts/search/?$"), "search"),
+    ("POST", re.compile(r"^/api/auth/(login|register|reset_password)/?$"), "auth"),
+    ("PATCH", re.compile(r"^/api/users/reset/?$"), "auth"),
+    (None, re.compile(r"^/api/"), "default"),
+)
+"""
+Route groups for admission control, matched in order.
+
+Each entry is ``(method, path pattern, group)``; a ``None`` method matches any
+method and a ``None`` group bypasses admission control. Long-lived streams,
+health checks and metrics are never queued.
+"""
+
+
+def route_group(method: str, path: str) -> str | None:
+    """
+    Get the admission group for a request.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The request path.
+
+    Returns:
+        str | None: The group name, or ``None`` if the request is not limited.
+    """
+    for group_method, pattern, group in ROUTE_GROUPS:
+        if (group_method is None or group_method == method) and pattern.match(path):
+            return group
+    return None
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limit with a bounded wait queue for one route group.
+
+    With a latency target the limit adapts using AIMD: every request served
+    within the target grows the limit by ``1 / limit``, so about one slot per
+    window of requests, up to ``max_limit``; a slower request multiplies it by
+    ``backoff``, down to ``min_limit``.
+
+    Args:
+        group (str): The route group name.
+        limit (int): The initial and maximum concurrency limit.
+        queue_size (int): The number of requests allowed to wait.
+        latency_target (float | None): The latency target in seconds, or
+            ``None`` for a fixed limit.
+        backoff (float): The multiplicative decrease factor.
+        min_limit (int): The lowest adaptive limit.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        limit: int,
+        queue_size: int,
+        latency_target: float | None = None,
+        backoff: float = 0.9,
+        min_limit: int = 1,
+    ):
+        self.group = group
+        self.limit = float(limit)
+        self.max_limit = limit
+        self.min_limit = min_limit
+        self.queue_size = queue_size
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        ADMISSION_LIMIT.labels(group).set(limit)
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(int(self.limit), self.min_limit)
+
+    async def acquire(self, timeout: float) -> str | None:
+        """
+        Wait for a slot.
+
+        Args:
+            timeout (float): How long to wait in the queue, in seconds.
+
+        Returns:
+            str | None: ``None`` when admitted, otherwise the rejection reason,
+            ``queue_full`` or ``timeout``.
+        """
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            return None
+        if len(self._waiters) >= self.queue_size:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                # The slot was handed over just as the timeout fired.
+                return None
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            return "timeout"
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+        return None
+
+    def release(self, latency: float | None = None) -> None:
+        """
+        Free a slot and hand it to the next waiting request.
+
+        Args:
+            latency (float | None): How long the request took to serve, in
+                seconds, used to adapt the limit.
+        """
+        self.in_flight -= 1
+        if latency is not None and self.latency_target is not None:
+            if latency > self.latency_target:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            ADMISSION_LIMIT.labels(self.group).set(int(self.limit))
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+def build_limiters(settings) -> dict[str, AdmissionLimiter]:
+    """
+    Create the admission limiters configured in the settings.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        dict[str, AdmissionLimiter]: The limiters keyed by route group.
+    """
+    limiters = {}
+    for group, limit in settings.ADMISSION_CONCURRENCY.items():
+        target = settings.ADMISSION_LATENCY_TARGET_MS.get(group)
+        limiters[group] = AdmissionLimiter(
+            group,
+            limit,
+            settings.ADMISSION_QUEUE_SIZE.get(group, limit),
+            latency_target=target / 1000 if target else None,
+            backoff=settings.ADMISSION_BACKOFF,
+        )
+    return limiters
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware that limits concurrent requests per route group.
+
+    Cheap reads keep their own slots, so expensive searches or password hashing
+    cannot starve them. Requests over the limit wait in a bounded queue; when
+    the queue is full or the wait times out, the request is rejected with 503
+    and ``Retry-After`` instead of timing out later.
+
+    Args:
+        app: The ASGI application to wrap.
+        limiters (dict[str, AdmissionLimiter]): The limiters keyed by route group.
+        queue_timeout (float): How long a request may wait for a slot, in seconds.
+        retry_after (int): The ``Retry-After`` value for rejected requests.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiters: dict[str, AdmissionLimiter],
+        queue_timeout: float,
+        retry_after: int,
+    ):
+        self.app = app
+        self.limiters = limiters
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limiter = self.limiters.get(route_group(scope["method"], scope["path"]))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        reason = await limiter.acquire(self.queue_timeout)
+        if reason is not None:
+            ADMISSION_REJECTED.labels(limiter.group, reason).inc()
+            await self._reject(send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+    async def _reject(self, send):
+        body = json.dumps({"detail": "Service overloaded, retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(self.retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
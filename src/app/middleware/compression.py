@@ -0,0 +1,318 @@
+import zlib
+from importlib import import_module
+from importlib.util import find_spec
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+"""
+Content types worth compressing; images and archives are already compressed.
+"""
+
+
+class GzipStream:
+    """
+    Incremental gzip compressor.
+
+    Args:
+        level (int): The zlib compression level.
+    """
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """
+        Compress a chunk.
+
+        Args:
+            data (bytes): The chunk.
+            flush (bool): Whether to emit everything compressed so far, so the
+                client can decode the chunk without waiting for more.
+
+        Returns:
+            bytes: The compressed output available so far.
+        """
+        output = self._compressor.compress(data)
+        if flush:
+            output += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return output
+
+    def finish(self) -> bytes:
+        """
+        End the stream.
+
+        Returns:
+            bytes: The remaining compressed output.
+        """
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStream:
+    """
+    Incremental brotli compressor, available when ``brotli`` is installed.
+
+    Args:
+        level (int): The brotli quality.
+    """
+
+    def __init__(self, level: int):
+        brotli = import_module("brotli")
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.process(data)
+        if flush:
+            output += self._compressor.flush()
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdStream:
+    """
+    Incremental zstd compressor, available when ``zstandard`` is installed.
+
+    Args:
+        level (int): The zstd compression level.
+    """
+
+    def __init__(self, level: int):
+        self._zstd = import_module("zstandard")
+        self._compressor = self._zstd.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        if flush:
+            output += self._compressor.flush(self._zstd.COMPRESSOBJ_FLUSH_BLOCK)
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(self._zstd.COMPRESSOBJ_FLUSH_FINISH)
+
+
+ENCODINGS = {
+    "br": (BrotliStream, "brotli", 4, 11),
+    "zstd": (ZstdStream, "zstandard", 3, 19),
+    "gzip": (GzipStream, None, 6, 9),
+}
+"""
+Supported encodings in order of preference.
+
+Each entry is ``(compressor, required module, dynamic level, static level)``.
+Responses are compressed at a fast level per request; bodies compressed once
+for a cache use the slower, smaller static level.
+"""
+
+
+def available_encodings() -> list[str]:
+    """
+    Get the encodings whose compressor can be imported.
+
+    Returns:
+        list[str]: The encodings in order of preference.
+    """
+    return [
+        name
+        for name, (_, module, _, _) in ENCODINGS.items()
+        if module is None or find_spec(module) is not None
+    ]
+
+
+def negotiate(accept_encoding: str, encodings: list[str]) -> str | None:
+    """
+    Pick a content encoding from an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding (str): The header value.
+        encodings (list[str]): The encodings to choose from, in order of
+            preference.
+
+    Returns:
+        str | None: The encoding with the highest quality, ties going to the
+        preferred one, or ``None`` if the client accepts none of them.
+    """
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            qualities[name.strip()] = quality
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compressor(encoding: str, static: bool = False):
+    """
+    Create a compressor for an encoding.
+
+    Args:
+        encoding (str): The content encoding.
+        static (bool): Whether to use the static level.
+
+    Returns:
+        GzipStream | BrotliStream | ZstdStream: The compressor.
+    """
+    stream, _, dynamic_level, static_level = ENCODINGS[encoding]
+    return stream(static_level if static else dynamic_level)
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """
+    Compress a whole body.
+
+    Args:
+        body (bytes): The body.
+        encoding (str): The content encoding.
+        static (bool): Whether to use the static level.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    stream = compressor(encoding, static)
+    return stream.compress(body) + stream.finish()
+
+
+def precompress(body: bytes, minimum_size: int = 0) -> dict[str, bytes]:
+    """
+    Compress a body with every available encoding, for storing in a cache.
+
+    A cache that stores these variants serves hits through
+    ``PrecompressedResponse`` without compressing them again.
+
+    Args:
+        body (bytes): The uncompressed body.
+        minimum_size (int): Bodies smaller than this are stored uncompressed only.
+
+    Returns:
+        dict[str, bytes]: The bodies keyed by content encoding, ``identity``
+        being the uncompressed one.
+    """
+    variants = {"identity": body}
+    if len(body) >= minimum_size:
+        for encoding in available_encodings():
+            variants[encoding] = compress(body, encoding, static=True)
+    return variants
+
+
+class PrecompressedResponse(Response):
+    """
+    Response that serves a stored variant from ``precompress``.
+
+    The compression middleware leaves it alone, since it already carries a
+    ``Content-Encoding``.
+
+    Args:
+        variants (dict[str, bytes]): The bodies keyed by content encoding.
+        accept_encoding (str): The request's ``Accept-Encoding`` header.
+        **kwargs: Other ``Response`` arguments.
+    """
+
+    def __init__(self, variants: dict[str, bytes], accept_encoding: str, **kwargs):
+        kwargs.setdefault("media_type", "application/json")
+        encodings = [name for name in variants if name != "identity"]
+        encoding = negotiate(accept_encoding, encodings)
+        super().__init__(variants[encoding or "identity"], **kwargs)
+        self.headers["vary"] = "Accept-Encoding"
+        if encoding is not None:
+            self.headers["content-encoding"] = encoding
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses with brotli, zstd or gzip.
+
+    The encoding is negotiated from ``Accept-Encoding`` among the available
+    ones. Whole bodies below ``minimum_size`` are sent as they are. Streaming
+    responses are compressed chunk by chunk and flushed after each one, so
+    server-sent events still reach the client immediately.
+
+    Args:
+        app: The ASGI application to wrap.
+        minimum_size (int): The smallest body worth compressing, in bytes.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        stream = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, stream, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = "content-encoding" in headers or not content_type.startswith(
+                    COMPRESSIBLE_TYPES
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if stream is None:
+                headers = MutableHeaders(raw=start["headers"])
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                stream = compressor(encoding)
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    body = stream.compress(body) + stream.finish()
+                    headers["content-length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                del headers["content-length"]
+                await send(start)
+
+            if more_body:
+                body = stream.compress(body, flush=True)
+            else:
+                body = stream.compress(body) + stream.finish()
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
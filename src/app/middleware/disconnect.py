@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+logger = logging.getLogger("app.disconnect")
+"""
+Logger for requests cancelled because the client went away.
+"""
+
+
+class DisconnectCancelMiddleware:
+    """
+    ASGI middleware that cancels a request once its client disconnects.
+
+    The request runs in its own task while the middleware watches for
+    ``http.disconnect``. If the client leaves before the response is complete,
+    the task is cancelled, which with asyncpg also cancels the running query
+    on the server and frees the pooled connection. Only safe methods are
+    cancelled, so an abandoned write is never left half done; a request whose
+    response has been sent is never cancelled.
+
+    Args:
+        app: The ASGI application to wrap.
+        methods (tuple[str, ...]): The HTTP methods that may be cancelled.
+    """
+
+    def __init__(self, app, methods: tuple[str, ...] = ("GET", "HEAD")):
+        self.app = app
+        self.methods = methods
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue = asyncio.Queue()
+        response_complete = False
+
+        async def send_wrapper(message):
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_complete = True
+            await send(message)
+
+        async def watch():
+            # The application reads the same messages through the queue, so it
+            # still sees the request body and the disconnect.
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        request = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+        watcher = asyncio.create_task(watch())
+        try:
+            await asyncio.wait({request, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not request.done() and not response_complete:
+                logger.info("Client disconnected, cancelling %s %s", scope["method"], scope["path"])
+                request.cancel()
+                try:
+                    await request
+                except asyncio.CancelledError:
+                    if asyncio.current_task().cancelling():
+                        raise
+                return
+            await request
+        finally:
+            watcher.cancel()
+            request.cancel()
@@ -0,0 +1,71 @@
+import time
+
+from app.database.instrumentation import start_query_log, finish_query_log
+from app.services.metrics import (
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_TIME_PER_REQUEST,
+)
+
+
+def route_template(scope) -> str:
+    """
+    Get the route template that served a request.
+
+    Args:
+        scope (dict): The ASGI scope after routing.
+
+    Returns:
+        str: The route path template, or ``unmatched`` if no route matched.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records request latency, in-flight requests and
+    per-request SQL statistics, and reports N+1 candidates.
+
+    Args:
+        app: The ASGI application to wrap.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+        finished = None
+
+        async def send_wrapper(message):
+            nonlocal status_code, finished
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finished = time.perf_counter()
+            await send(message)
+
+        query_log, token = start_query_log()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            finish_query_log(token)
+            route = route_template(scope)
+            elapsed = (finished or time.perf_counter()) - started
+            REQUEST_LATENCY.labels(scope["method"], route, str(status_code)).observe(
+                elapsed
+            )
+            DB_QUERIES_PER_REQUEST.labels(route).observe(query_log.count)
+            DB_QUERY_TIME_PER_REQUEST.labels(route).observe(query_log.duration)
+            query_log.report(route)
@@ -0,0 +1,115 @@
+import asyncio
+import cProfile
+import hashlib
+import hmac
+import os
+import random
+import re
+import time
+from datetime import datetime, UTC
+
+PROFILE_HEADER = b"x-debug-profile"
+"""
+Header that forces profiling of a single request.
+
+The value has the form ``<expires>:<signature>`` where ``expires`` is a unix
+timestamp and ``signature`` is produced by ``sign_profile_request``.
+"""
+
+
+def sign_profile_request(secret: str, path: str, expires: int) -> str:
+    """
+    Build a debug header value that forces profiling of a request.
+
+    Args:
+        secret (str): The profiling secret.
+        path (str): The request path to profile.
+        expires (int): The unix timestamp after which the header is rejected.
+
+    Returns:
+        str: The header value.
+    """
+    signature = hmac.new(
+        secret.encode(), f"{expires}:{path}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"{expires}:{signature}"
+
+
+def verify_profile_header(secret: str, path: str, value: str) -> bool:
+    """
+    Check a debug header value.
+
+    Args:
+        secret (str): The profiling secret.
+        path (str): The request path.
+        value (str): The header value.
+
+    Returns:
+        bool: Whether the header is valid and not expired.
+    """
+    expires, _, signature = value.partition(":")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = sign_profile_request(secret, path, int(expires))
+    return hmac.compare_digest(expected, value)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that captures cProfile profiles for a sample of requests.
+
+    A request is profiled when it is randomly sampled or carries a valid signed
+    debug header. Profiles are written as ``pstats`` files that can be rendered
+    as flamegraphs with ``flameprof`` or ``snakeviz``. The profiler is global to
+    the thread, so concurrent requests show up in the same profile.
+
+    Args:
+        app: The ASGI application to wrap.
+        sample_rate (float): The fraction of requests to profile.
+        secret (str | None): The secret for the signed debug header.
+        directory (str): The directory to write profiles to.
+    """
+
+    def __init__(self, app, sample_rate: float, secret: str | None, directory: str):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.directory = directory
+        self._active = False
+        os.makedirs(directory, exist_ok=True)
+
+    def _should_profile(self, scope) -> bool:
+        if self._active:
+            return False
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return verify_profile_header(
+                        self.secret, scope["path"], value.decode("latin-1")
+                    )
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            path = os.path.join(self.directory, self._filename(scope, elapsed_ms))
+            await asyncio.to_thread(profiler.dump_stats, path)
+
+    @staticmethod
+    def _filename(scope, elapsed_ms: int) -> str:
+        route = getattr(scope.get("route"), "path", scope["path"])
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+        return f"{stamp}-{scope['method']}-{slug}-{elapsed_ms}ms.prof"
@@ -1,5 +1,5 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Dict, Optional, List, Union
+from pydantic import BaseModel, Field, model_serializer
 
 
 class ContactBase(BaseModel):
@@ -115,6 +115,54 @@ class ContactResponse(ContactCreate):
     
 
 
+class ContactFieldsResponse(BaseModel):
+    """
+    Partial contact response model.
+
+    This class represents a contact narrowed to the requested fields. Fields
+    that were not requested are left out of the response.
+    """
+
+    id: int
+    """
+    Contact ID.
+
+    The ID of the contact.
+    """
+
+    name: Optional[str] = None
+    surname: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    birthdate: Optional[str] = None
+    notes: Optional[str] = None
+    user_id: Optional[int] = None
+
+    @model_serializer(mode="wrap")
+    def _requested_fields(self, handler):
+        data = handler(self)
+        return {key: value for key, value in data.items() if key in self.model_fields_set}
+
+    @classmethod
+    def from_orm(cls, obj, fields):
+        """
+        Create an instance with some fields of an ORM object.
+
+        Args:
+            obj: The ORM object to create the instance from.
+            fields: The names of the fields to include besides the ID.
+
+        Returns:
+            ContactFieldsResponse: The created instance.
+        """
+        values = {"id": obj.id}
+        for field in fields:
+            values[field] = getattr(obj, field)
+        if values.get("birthdate") is not None:
+            values["birthdate"] = values["birthdate"].strftime("%Y-%m-%d")
+        return cls(**values)
+
+
 class ContactListResponse(BaseModel):
     """
     Contact list response model.
@@ -122,11 +170,128 @@ class ContactListResponse(BaseModel):
     This class represents a list of contacts.
     """
 
-    contacts: List[ContactResponse]
+    contacts: List[Union[ContactResponse, ContactFieldsResponse]]
+    """
+    Contacts.
+
+    The list of contacts, narrowed to the requested fields if any.
+    """
+
+    total: Optional[int] = None
+    """
+    Total.
+
+    The number of contacts across all pages, when requested.
+    """
+
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+    """
+    Facets.
+
+    The number of contacts per key of each requested facet, e.g. per birth month.
+    """
+
+
+class ContactBatchUpdateItem(ContactUpdate):
+    """
+    Contact batch update item model.
+
+    This class represents the changes to one contact in a batch update.
+    """
+
+    id: int
+    """
+    Contact ID.
+
+    The ID of the contact to update.
+    """
+
+
+class ContactBatchUpdate(BaseModel):
+    """
+    Contact batch update model.
+
+    This class represents the changes to several contacts.
+    """
+
+    contacts: List[ContactBatchUpdateItem]
     """
     Contacts.
 
-    The list of contacts.
+    The changes, one item per contact.
+    """
+
+
+class ContactBatchItem(BaseModel):
+    """
+    Contact batch item model.
+
+    This class represents the outcome of a batch operation for one contact.
+    """
+
+    id: int
+    """
+    Contact ID.
+
+    The ID of the contact.
+    """
+
+    status: str
+    """
+    Status.
+
+    ``ok`` if the operation succeeded, ``not_found`` if the user has no contact with this ID.
+    """
+
+    contact: Optional[ContactResponse] = None
+    """
+    Contact.
+
+    The contact, when it was found.
+    """
+
+
+class ContactBatchResponse(BaseModel):
+    """
+    Contact batch response model.
+
+    This class represents the outcome of a batch operation, in request order.
+    """
+
+    results: List[ContactBatchItem]
+    """
+    Results.
+
+    One result per requested contact.
+    """
+
+
+class ContactChangesResponse(BaseModel):
+    """
+    Contact changes response model.
+
+    This class represents the contacts changed and deleted since a sync token.
+    """
+
+    changed: List[ContactResponse]
+    """
+    Changed contacts.
+
+    The contacts created or updated since the sync token, oldest change first.
+    """
+
+    deleted: List[int]
+    """
+    Deleted contacts.
+
+    The IDs of the contacts deleted since the sync token.
+    """
+
+    next_token: str
+    """
+    Next sync token.
+
+    The token to pass as ``since`` on the next sync.
     """
 
 
@@ -0,0 +1,109 @@
+import os
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.config import settings
+from app.controllers.user import UserController
+from app.database.db import get_db
+from app.database.models import UserRole
+from app.response.schemas import User
+from app.services.current_user import get_current_user
+from app.services.user_deletion import delete_user_in_background
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+"""
+API router for admin endpoints.
+"""
+
+
+def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    """
+    Get the current user and make sure they are an admin.
+
+    Args:
+        user (User): The current user.
+
+    Returns:
+        User: The current user.
+
+    Raises:
+        HTTPException: If the user is not an admin.
+    """
+    if user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
+        )
+    return user
+
+
+@router.get("/profiles", response_model=list[str])
+async def list_profiles(user: User = Depends(get_admin_user)):
+    """
+    List captured profiles.
+
+    This endpoint returns the names of captured request profiles, newest first.
+
+    Args:
+        user (User): The current admin user.
+
+    Returns:
+        list[str]: The profile file names.
+    """
+    if not os.path.isdir(settings.PROFILING_DIR):
+        return []
+    names = [name for name in os.listdir(settings.PROFILING_DIR) if name.endswith(".prof")]
+    return sorted(names, reverse=True)
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str, user: User = Depends(get_admin_user)):
+    """
+    Download a captured profile.
+
+    This endpoint returns a ``pstats`` profile file.
+
+    Args:
+        name (str): The profile file name.
+        user (User): The current admin user.
+
+    Returns:
+        FileResponse: The profile file.
+    """
+    path = os.path.join(settings.PROFILING_DIR, os.path.basename(name))
+    if not name.endswith(".prof") or not os.path.isfile(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
+
+
+@router.delete("/users/{user_id}", status_code=status.HTTP_202_ACCEPTED)
+async def delete_user(
+    user_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_admin_user),
+):
+    """
+    Delete a user and all their contacts.
+
+    This endpoint schedules the deletion and returns at once; the contacts
+    are deleted in chunks in the background.
+
+    Args:
+        user_id (int): The ID of the user to delete.
+        background_tasks (BackgroundTasks): The background tasks.
+        db (AsyncSession): The database session.
+        user (User): The current admin user.
+
+    Returns:
+        dict: The deletion status.
+    """
+    if await UserController(db).get_user_by_id(user_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    background_tasks.add_task(delete_user_in_background, user_id)
+    return {"status": "scheduled"}
@@ -16,7 +16,7 @@ from app.response.schemas import UserCreate, Token, ConfirmResponse
 from app.services.auth import create_access_token
 from app.controllers.user import UserController
 from app.services.auth import Hash
-from app.services.email import send_email
+from app.services.email_queue import enqueue_email
 from app.services.auth import get_email_from_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -108,10 +108,15 @@ async def register_user(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Role must be ADMIN or USER",
             )
+        if user_data.role == "ADMIN":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Cannot register as ADMIN",
+            )
     user_data.password = Hash().get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_email, new_user.email, new_user.name, request.base_url, "confirmation"
+    enqueue_email(
+        background_tasks, new_user.email, new_user.name, request.base_url, "confirmation"
     )
     return new_user
 
@@ -166,7 +171,5 @@ async def reset_password(request: Request, background_tasks: BackgroundTasks, em
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="User not found"
         )
-    background_tasks.add_task(
-        send_email, user.email, user.name, request.base_url, "reset"
-    )
+    enqueue_email(background_tasks, user.email, user.name, request.base_url, "reset")
     return {"message": "We`ll send you an email to reset your password"}
\ No newline at end of file
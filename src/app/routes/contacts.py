@@ -1,9 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, Union
 
+from app.config.config import settings
 from app.database.db import get_db
 from app.response.schemas import ContactBase, ContactCreate, ContactResponse, ContactListResponse, ContactUpdate
+from app.response.schemas import ContactBatchResponse, ContactBatchUpdate, ContactChangesResponse
+from app.services.sync import InvalidSyncToken
+from app.services.events import contact_events
+from app.services.contacts import CONTACT_FIELDS, FACETS
 from app.controllers.contacts import ContactsController
 from app.services.current_user import get_current_user
 from app.response.schemas import User
@@ -14,29 +23,137 @@ API router for contact endpoints.
 """
 
 
-@router.get("/", response_model=ContactListResponse)
+def parse_ids(ids: str) -> list[int]:
+    """
+    Parse a comma-separated list of contact IDs.
+
+    Duplicates are dropped; the order of first occurrence is kept.
+
+    Args:
+        ids (str): The IDs, e.g. ``1,2,3``.
+
+    Returns:
+        list[int]: The IDs.
+
+    Raises:
+        HTTPException: If an ID is not an integer or there are too many IDs.
+    """
+    try:
+        parsed = list(dict.fromkeys(int(id) for id in ids.split(",") if id.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="ids must be a comma-separated list of integers",
+        )
+    check_batch_size(len(parsed))
+    return parsed
+
+
+def parse_facets(facets: Optional[str]) -> list[str]:
+    """
+    Parse a comma-separated list of facet names.
+
+    Args:
+        facets (str | None): The facets, e.g. ``birth_month,email_domain``.
+
+    Returns:
+        list[str]: The facets.
+
+    Raises:
+        HTTPException: If a facet is unknown.
+    """
+    if not facets:
+        return []
+    parsed = list(dict.fromkeys(facet.strip() for facet in facets.split(",") if facet.strip()))
+    unknown = [facet for facet in parsed if facet not in FACETS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown facets: {', '.join(unknown)}. Available: {', '.join(FACETS)}",
+        )
+    return parsed
+
+
+def parse_fields(fields: Optional[str]) -> tuple[str, ...] | None:
+    """
+    Parse a comma-separated list of contact fields.
+
+    Args:
+        fields (str | None): The fields, e.g. ``name,phone``.
+
+    Returns:
+        tuple[str, ...] | None: The fields, or None for all of them.
+
+    Raises:
+        HTTPException: If a field is unknown.
+    """
+    if not fields:
+        return None
+    parsed = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in parsed if field not in CONTACT_FIELDS and field != "id"]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(CONTACT_FIELDS)}",
+        )
+    return tuple(field for field in parsed if field != "id")
+
+
+def check_batch_size(size: int):
+    """
+    Reject batches larger than ``CONTACTS_BATCH_LIMIT``.
+
+    Args:
+        size (int): The number of contacts in the batch.
+
+    Raises:
+        HTTPException: If the batch is too large.
+    """
+    if size > settings.CONTACTS_BATCH_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.CONTACTS_BATCH_LIMIT} contacts per batch",
+        )
+
+
+@router.get("/", response_model=Union[ContactListResponse, ContactBatchResponse])
 async def read_contacts(
     skip: int = 0,
     limit: int = 10,
+    ids: Optional[str] = None,
+    total: bool = False,
+    facets: Optional[str] = None,
+    fields: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get a list of contacts.
 
-    This endpoint returns a list of contacts for the current user.
+    This endpoint returns a list of contacts for the current user. When ``ids``
+    is given, it returns those contacts instead, fetched with one query, with
+    a status per requested ID.
 
     Args:
         skip (int): The number of contacts to skip.
         limit (int): The maximum number of contacts to return.
+        ids (str): Comma-separated contact IDs, e.g. ``1,2,3``.
+        total (bool): Whether to include the total number of contacts.
+        facets (str): Comma-separated facets to count, e.g. ``birth_month,email_domain``.
+        fields (str): Comma-separated fields to return, e.g. ``name,phone``.
         db (AsyncSession): The database session.
         current_user (User): The current user.
 
     Returns:
-        ContactListResponse: The list of contacts.
+        ContactListResponse | ContactBatchResponse: The list of contacts, or the
+            result per ID.
     """
     contacts = ContactsController(db)
-    return await contacts.get_contacts(current_user.id, skip, limit)
+    if ids is not None:
+        return await contacts.get_by_ids(current_user.id, parse_ids(ids))
+    return await contacts.get_contacts(
+        current_user.id, skip, limit, total, parse_facets(facets), parse_fields(fields)
+    )
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
@@ -69,6 +186,145 @@ async def create_contact(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+async def event_stream(queue: asyncio.Queue, request: Request):
+    """
+    Format queued contact events as server-sent events.
+
+    A comment line is sent when no event arrives for
+    ``CONTACTS_STREAM_KEEPALIVE_SECONDS``, and the stream ends once the client
+    has disconnected.
+
+    Args:
+        queue (asyncio.Queue): The queue events are delivered to.
+        request (Request): The request, used to detect disconnects.
+
+    Yields:
+        str: The server-sent event lines.
+    """
+    while not await request.is_disconnected():
+        try:
+            event = await asyncio.wait_for(
+                queue.get(), settings.CONTACTS_STREAM_KEEPALIVE_SECONDS
+            )
+        except asyncio.TimeoutError:
+            yield ": keep-alive\n\n"
+            continue
+        event.pop("user_id", None)
+        yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream contact changes.
+
+    This endpoint keeps the connection open and pushes a server-sent event
+    for every contact of the current user that is created, updated or
+    deleted, from any worker. An ``overflow`` event means events were dropped
+    because the client fell behind; the client should resync through
+    ``/changes``.
+
+    Args:
+        request (Request): The request.
+        current_user (User): The current user.
+
+    Returns:
+        StreamingResponse: The event stream.
+    """
+    async def stream():
+        async with contact_events.subscribe(current_user.id) as queue:
+            async for chunk in event_stream(queue, request):
+                yield chunk
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/changes", response_model=ContactChangesResponse)
+async def read_changes(
+    since: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get contact changes since the last sync.
+
+    This endpoint returns the contacts created or updated and the IDs of the
+    contacts deleted since ``since``, plus the token for the next sync. Without
+    ``since`` it returns every contact. A change may be returned twice across
+    consecutive syncs, so clients must apply changes idempotently.
+
+    Args:
+        since (str): The sync token returned by the previous sync.
+        db (AsyncSession): The database session.
+        current_user (User): The current user.
+
+    Returns:
+        ContactChangesResponse: The changes and the next sync token.
+    """
+    contact_controller = ContactsController(db)
+    try:
+        return await contact_controller.get_changes(current_user.id, since)
+    except InvalidSyncToken as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.patch("/batch", response_model=ContactBatchResponse)
+async def update_contacts(
+    body: ContactBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Update several contacts.
+
+    This endpoint updates several contacts of the current user in one
+    transaction and returns a status per contact.
+
+    Args:
+        body (ContactBatchUpdate): The changes, each with its contact ID.
+        db (AsyncSession): The database session.
+        current_user (User): The current user.
+
+    Returns:
+        ContactBatchResponse: The result per contact, in request order.
+    """
+    check_batch_size(len(body.contacts))
+    contact_controller = ContactsController(db)
+    return await contact_controller.update_contacts(current_user.id, body.contacts)
+
+
+@router.delete("/batch", response_model=ContactBatchResponse)
+async def remove_contacts(
+    ids: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Delete several contacts.
+
+    This endpoint deletes several contacts of the current user with one
+    statement and returns a status per ID. It is declared before
+    ``/{contact_id}`` so that ``batch`` is not parsed as an ID.
+
+    Args:
+        ids (str): Comma-separated contact IDs, e.g. ``1,2,3``.
+        db (AsyncSession): The database session.
+        current_user (User): The current user.
+
+    Returns:
+        ContactBatchResponse: The result per ID, in request order.
+    """
+    contact_controller = ContactsController(db)
+    return await contact_controller.delete_contacts(current_user.id, parse_ids(ids))
+
+
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     body: ContactUpdate,
@@ -135,6 +391,9 @@ async def search_contacts(
     name: Optional[str] = None,
     surname: Optional[str] = None,
     email: Optional[str] = None,
+    total: bool = False,
+    facets: Optional[str] = None,
+    fields: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -147,6 +406,9 @@ async def search_contacts(
         name (str): The name to search for.
         surname (str): The surname to search for.
         email (str): The email to search for.
+        total (bool): Whether to include the number of matching contacts.
+        facets (str): Comma-separated facets to count, e.g. ``birth_month,email_domain``.
+        fields (str): Comma-separated fields to return, e.g. ``name,phone``.
         db (AsyncSession): The database session.
         current_user (User): The current user.
 
@@ -155,14 +417,85 @@ async def search_contacts(
     """
     contact_controller = ContactsController(db)
     contact = await contact_controller.search_contact(
-        user_id=current_user.id, name=name, surname=surname, email=email
+        user_id=current_user.id,
+        name=name,
+        surname=surname,
+        email=email,
+        include_total=total,
+        facets=parse_facets(facets),
+        fields=parse_fields(fields),
     )
     return contact
 
 
+@router.get("/lookup", response_model=ContactListResponse)
+async def lookup_contacts(
+    phone: Optional[str] = Query(None, max_length=32),
+    email: Optional[str] = Query(None, max_length=254),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Find contacts by phone number or email.
+
+    This endpoint resolves an exact phone number, in any format, or an email,
+    in any case, to the current user's contacts, e.g. for caller ID.
+
+    Args:
+        phone (str): The phone number to find.
+        email (str): The email to find.
+        fields (str): Comma-separated fields to return, e.g. ``name,phone``.
+        db (AsyncSession): The database session.
+        current_user (User): The current user.
+
+    Returns:
+        ContactListResponse: The matching contacts.
+
+    Raises:
+        HTTPException: If neither a phone number nor an email is given.
+    """
+    if not phone and not email:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Provide a phone number or an email",
+        )
+    contact_controller = ContactsController(db)
+    return await contact_controller.lookup(current_user.id, phone, email, parse_fields(fields))
+
+
+@router.get("/suggest", response_model=ContactListResponse)
+async def suggest_contacts(
+    prefix: str = Query(min_length=1, max_length=50),
+    limit: int = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Suggest contacts as the user types.
+
+    This endpoint returns contacts whose name, surname or email starts with
+    the prefix, with their ID, name, surname and email only.
+
+    Args:
+        prefix (str): The prefix to complete.
+        limit (int): The maximum number of suggestions, capped at ``CONTACTS_SUGGEST_LIMIT``.
+        db (AsyncSession): The database session.
+        current_user (User): The current user.
+
+    Returns:
+        ContactListResponse: The suggested contacts.
+    """
+    limit = min(limit or settings.CONTACTS_SUGGEST_LIMIT, settings.CONTACTS_SUGGEST_LIMIT)
+    contact_controller = ContactsController(db)
+    return await contact_controller.suggest(current_user.id, prefix, limit)
+
+
 @router.get("/upcoming-birthdays", response_model=ContactListResponse)
 async def upcoming_birthdays(
-    db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Get upcoming birthdays.
@@ -170,6 +503,7 @@ async def upcoming_birthdays(
     This endpoint returns a list of contacts with upcoming birthdays.
 
     Args:
+        fields (str): Comma-separated fields to return, e.g. ``name,phone``.
         db (AsyncSession): The database session.
         current_user (User): The current user.
 
@@ -177,7 +511,9 @@ async def upcoming_birthdays(
         List[ContactResponse]: The list of contacts with upcoming birthdays.
     """
     contact_controller = ContactsController(db)
-    birthdays = await contact_controller.get_upcoming_birthdays(user_id=current_user.id)
+    birthdays = await contact_controller.get_upcoming_birthdays(
+        user_id=current_user.id, fields=parse_fields(fields)
+    )
     return birthdays
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Request, Response, status
+
+from app.services.health import health_checker
+
+router = APIRouter(prefix="/health", tags=["health"])
+"""
+API router for health endpoints.
+"""
+
+
+@router.get("/live")
+async def live():
+    """
+    Report liveness.
+
+    This endpoint checks no dependencies: it only shows that the process is
+    serving requests.
+
+    Returns:
+        dict: The liveness status.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def ready(request: Request, response: Response):
+    """
+    Report readiness.
+
+    This endpoint returns 503 until startup warm-up has completed, so a load
+    balancer does not route traffic to a cold instance. After that it probes
+    the database, Redis and the SMTP server in parallel and reports the
+    latency of each; it returns 503 when the database or Redis is unavailable.
+
+    Args:
+        request (Request): The request.
+        response (Response): The response.
+
+    Returns:
+        dict: The readiness status and the dependency checks.
+    """
+    if not getattr(request.app.state, "ready", False):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming_up"}
+    result = await health_checker.check()
+    if result["status"] == "unavailable":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
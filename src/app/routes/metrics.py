@@ -0,0 +1,34 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+router = APIRouter(tags=["metrics"])
+"""
+API router for the metrics endpoint.
+"""
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Expose metrics.
+
+    This endpoint returns all collected metrics in the Prometheus text format.
+    When ``PROMETHEUS_MULTIPROC_DIR`` is set, metrics of all worker processes
+    are aggregated.
+
+    Returns:
+        Response: The metrics exposition.
+    """
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
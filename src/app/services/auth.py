@@ -1,15 +1,31 @@
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 from datetime import datetime, timedelta, UTC
-from jose import JWTError, jwt
 from typing import Optional
 from app.config.config import settings
+from app.services.metrics import BCRYPT_DURATION
 
 class Hash:
     """
     Password hashing utility class.
+
+    The passlib context, and with it the bcrypt backend, is loaded on first use.
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+    _shared_context = None
+
+    @property
+    def pwd_context(self):
+        """
+        Get the passlib context shared by all instances.
+
+        Returns:
+            CryptContext: The password hashing context.
+        """
+        if Hash._shared_context is None:
+            from passlib.context import CryptContext
+
+            Hash._shared_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        return Hash._shared_context
 
     def verify_password(self, plain_password, hashed_password):
         """
@@ -22,7 +38,8 @@ class Hash:
         Returns:
             bool: Whether the passwords match.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        with BCRYPT_DURATION.labels("verify").time():
+            return self.pwd_context.verify(plain_password, hashed_password)
 
     def get_password_hash(self, password: str):
         """
@@ -34,7 +51,8 @@ class Hash:
         Returns:
             str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        with BCRYPT_DURATION.labels("hash").time():
+            return self.pwd_context.hash(password)
 
 
 async def create_access_token(data: dict, expires_delta: Optional[float] = None):
@@ -48,6 +66,8 @@ async def create_access_token(data: dict, expires_delta: Optional[float] = None)
     Returns:
         str: The access token.
     """
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
@@ -69,6 +89,8 @@ def create_email_token(data: dict):
     Returns:
         str: The email token.
     """
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=7)
     to_encode.update({"iat": datetime.now(UTC), "exp": expire})
@@ -89,6 +111,8 @@ async def get_email_from_token(token: str):
     Raises:
         HTTPException: If the token is invalid.
     """
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
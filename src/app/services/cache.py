@@ -0,0 +1,50 @@
+from app.config.config import settings
+
+
+class LazyRedis:
+    """
+    Redis client that is created on first use.
+
+    Attribute access is forwarded to a ``redis.asyncio.Redis`` client, which is
+    imported and constructed the first time it is needed.
+
+    Args:
+        **kwargs: Arguments for ``redis.asyncio.Redis``.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Get the underlying Redis client.
+
+        Returns:
+            redis.asyncio.Redis: The Redis client.
+        """
+        if self._client is None:
+            import redis.asyncio as aioredis
+
+            self._client = aioredis.Redis(**self._kwargs)
+        return self._client
+
+    async def close(self):
+        """
+        Close the client and its connection pool, if it was created.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+redis_client = LazyRedis(
+    host=settings.REDIS_HOST, port=settings.REDIS_PORT, decode_responses=True
+)
+"""
+Redis client used for caching.
+"""
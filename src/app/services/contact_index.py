@@ -0,0 +1,419 @@
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from app.config.config import settings
+from app.services.events import WORKER_ID, contact_events
+from app.services.single_flight import SingleFlight
+
+SEARCH_COLUMNS = ("name", "surname", "email")
+"""
+Columns that support substring search; their text is held twice, once as is
+and once lower-cased for searching.
+"""
+
+_ROW_OVERHEAD = 120
+"""
+Approximate bytes per contact besides its strings: array slots, list pointers
+and the position map entry.
+"""
+
+
+def birthday_key(month: int, day: int) -> int:
+    """
+    Get a sortable day-of-year key for a birthday, independent of leap years.
+
+    Args:
+        month (int): The month.
+        day (int): The day of the month.
+
+    Returns:
+        int: The key.
+    """
+    return month * 32 + day
+
+
+class IndexedContact:
+    """
+    Contact served from a ``ContactIndex``, without the notes.
+    """
+
+    __slots__ = ("id", "name", "surname", "email", "phone", "birthdate", "user_id")
+
+    def __init__(self, id, name, surname, email, phone, birthdate, user_id):
+        self.id = id
+        self.name = name
+        self.surname = surname
+        self.email = email
+        self.phone = phone
+        self.birthdate = birthdate
+        self.user_id = user_id
+
+
+class ContactIndex:
+    """
+    In-memory column store of one user's contacts.
+
+    Each column is a compact array or list indexed by row. Substring search
+    scans one lower-cased string per column with ``str.find``; it is rebuilt
+    lazily after a change. Birthdays are kept as day-of-year keys.
+
+    Args:
+        user_id (int): The ID of the user.
+        rows: The ID, name, surname, email, phone and birthdate of each contact.
+        built_at (float | None): The monotonic time the rows were read at.
+            Defaults to now.
+    """
+
+    def __init__(self, user_id: int, rows, built_at: float | None = None):
+        self.user_id = user_id
+        self.built_at = time.monotonic() if built_at is None else built_at
+        self.ids = array("q")
+        self.birthdates = array("l")
+        self.birthdays = array("H")
+        self.columns = {"name": [], "surname": [], "email": [], "phone": []}
+        self._rows: dict[int, int] = {}
+        self._haystacks: dict[str, tuple[str, array]] = {}
+        self.nbytes = 0
+        for id, name, surname, email, phone, birthdate in rows:
+            self.upsert(id, name, surname, email, phone, birthdate)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def upsert(self, id: int, name, surname, email, phone, birthdate) -> None:
+        """
+        Add a contact, or replace it if it is already indexed.
+
+        Args:
+            id (int): The contact ID.
+            name (str): The name.
+            surname (str): The surname.
+            email (str): The email.
+            phone (str): The phone.
+            birthdate (date): The birthdate.
+        """
+        values = {"name": name, "surname": surname, "email": email, "phone": phone}
+        row = self._rows.get(id)
+        if row is None:
+            row = len(self.ids)
+            self._rows[id] = row
+            self.ids.append(id)
+            self.birthdates.append(0)
+            self.birthdays.append(0)
+            for field, column in self.columns.items():
+                column.append("")
+                self.nbytes += self._size(field, "")
+            self.nbytes += _ROW_OVERHEAD
+        for field, value in values.items():
+            value = value or ""
+            self.nbytes += self._size(field, value) - self._size(field, self.columns[field][row])
+            self.columns[field][row] = value
+        self.birthdates[row] = birthdate.toordinal() if birthdate else 0
+        self.birthdays[row] = birthday_key(birthdate.month, birthdate.day) if birthdate else 0
+        self._haystacks.clear()
+
+    def remove(self, id: int) -> None:
+        """
+        Remove a contact, moving the last row into its place.
+
+        Args:
+            id (int): The contact ID.
+        """
+        row = self._rows.pop(id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        self.nbytes -= _ROW_OVERHEAD + sum(
+            self._size(field, column[row]) for field, column in self.columns.items()
+        )
+        if row != last:
+            self.ids[row] = self.ids[last]
+            self.birthdates[row] = self.birthdates[last]
+            self.birthdays[row] = self.birthdays[last]
+            for column in self.columns.values():
+                column[row] = column[last]
+            self._rows[self.ids[row]] = row
+        for values in (self.ids, self.birthdates, self.birthdays, *self.columns.values()):
+            values.pop()
+        self._haystacks.clear()
+
+    @staticmethod
+    def _size(field: str, value: str) -> int:
+        size = sys.getsizeof(value)
+        return 2 * size if field in SEARCH_COLUMNS else size
+
+    def _haystack(self, field: str) -> tuple[str, array]:
+        haystack = self._haystacks.get(field)
+        if haystack is None:
+            values = [value.lower().replace("\0", " ") for value in self.columns[field]]
+            offsets = array("q")
+            position = 0
+            for value in values:
+                offsets.append(position)
+                position += len(value) + 1
+            haystack = ("\0".join(values), offsets)
+            self._haystacks[field] = haystack
+        return haystack
+
+    def _matching_rows(self, field: str, needle: str) -> set[int]:
+        text, offsets = self._haystack(field)
+        needle = needle.lower()
+        rows = set()
+        if "\0" in needle:
+            return rows
+        start = text.find(needle)
+        while start != -1:
+            row = bisect_right(offsets, start) - 1
+            rows.add(row)
+            if row + 1 >= len(offsets):
+                break
+            start = text.find(needle, offsets[row + 1])
+        return rows
+
+    def search(self, name: str = None, surname: str = None, email: str = None) -> list[int]:
+        """
+        Get contacts whose columns contain all the given substrings.
+
+        Matching is case-insensitive, like ``ContactsService.search_contacts``.
+
+        Args:
+            name (str, optional): The substring of the name.
+            surname (str, optional): The substring of the surname.
+            email (str, optional): The substring of the email.
+
+        Returns:
+            list[int]: The contact IDs in ascending order.
+        """
+        rows = None
+        for field, needle in zip(SEARCH_COLUMNS, (name, surname, email)):
+            if needle:
+                matches = self._matching_rows(field, needle)
+                rows = matches if rows is None else rows & matches
+        if rows is None:
+            rows = range(len(self.ids))
+        return sorted(self.ids[row] for row in rows)
+
+    def upcoming_birthdays(self, today: date, days: int = 7) -> list[int]:
+        """
+        Get contacts whose birthday falls within the next days.
+
+        Args:
+            today (date): The first day of the window.
+            days (int): The length of the window.
+
+        Returns:
+            list[int]: The contact IDs in ascending order.
+        """
+        start = birthday_key(today.month, today.day)
+        end_date = today + timedelta(days=days)
+        end = birthday_key(end_date.month, end_date.day)
+        if start <= end and days < 365:
+            rows = (row for row, key in enumerate(self.birthdays) if start <= key < end)
+        else:
+            rows = (row for row, key in enumerate(self.birthdays) if key and (key >= start or key < end))
+        return sorted(self.ids[row] for row in rows)
+
+    def contact(self, id: int) -> IndexedContact:
+        """
+        Get an indexed contact.
+
+        Args:
+            id (int): The contact ID.
+
+        Returns:
+            IndexedContact: The contact, without its notes.
+        """
+        row = self._rows[id]
+        ordinal = self.birthdates[row]
+        return IndexedContact(
+            id,
+            self.columns["name"][row] or None,
+            self.columns["surname"][row] or None,
+            self.columns["email"][row] or None,
+            self.columns["phone"][row] or None,
+            date.fromordinal(ordinal) if ordinal else None,
+            self.user_id,
+        )
+
+
+class ContactIndexCache:
+    """
+    Contact indexes of a worker's most active power users.
+
+    Indexes are loaded lazily, kept current by local writes, and dropped when
+    another worker changes the user's contacts, as announced over the Redis
+    contact event channel. The least recently used index is evicted while the
+    total estimated size exceeds ``max_bytes``.
+
+    Args:
+        max_bytes (int): The memory budget for all indexes.
+        min_contacts (int): The number of contacts a user needs to be indexed.
+        ttl (float): How long an index, or a decision not to build one, is
+            kept, in seconds. Bounds staleness if events are lost.
+    """
+
+    def __init__(self, max_bytes: int, min_contacts: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.min_contacts = min_contacts
+        self.ttl = ttl
+        self.nbytes = 0
+        self._indexes: OrderedDict[int, ContactIndex] = OrderedDict()
+        self._skipped: dict[int, float] = {}
+        self._changed: dict[int, float] = {}
+        self._loads = SingleFlight()
+
+    def get(self, user_id: int) -> ContactIndex | None:
+        """
+        Get a user's index if it is loaded and fresh.
+
+        Args:
+            user_id (int): The user ID.
+
+        Returns:
+            ContactIndex | None: The index, or None.
+        """
+        index = self._indexes.get(user_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.built_at > self.ttl:
+            self._drop(user_id)
+            return None
+        self._indexes.move_to_end(user_id)
+        return index
+
+    async def load(self, user_id: int, count, rows) -> ContactIndex | None:
+        """
+        Get a user's index, loading it if the user has enough contacts.
+
+        Concurrent loads for a user share one query.
+
+        Args:
+            user_id (int): The user ID.
+            count: A coroutine function returning the user's number of contacts.
+            rows: A coroutine function returning the rows for ``ContactIndex``.
+
+        Returns:
+            ContactIndex | None: The index, or None if the user is not indexed.
+        """
+        index = self.get(user_id)
+        if index is not None:
+            return index
+        skipped = self._skipped.get(user_id)
+        if skipped is not None and time.monotonic() - skipped <= self.ttl:
+            return None
+
+        async def build():
+            if await count() < self.min_contacts:
+                self._skipped = self._recent(self._skipped)
+                self._skipped[user_id] = time.monotonic()
+                return None
+            started = time.monotonic()
+            index = ContactIndex(user_id, await rows(), built_at=started)
+            self._put(index)
+            return index
+
+        return await self._loads.do(user_id, "load", build)
+
+    def _put(self, index: ContactIndex) -> None:
+        user_id = index.user_id
+        if self._changed.get(user_id, float("-inf")) >= index.built_at:
+            # Contacts changed while the rows were read.
+            return
+        self._drop(user_id)
+        self._indexes[user_id] = index
+        self.nbytes += index.nbytes
+        self._skipped.pop(user_id, None)
+        contact_events.add_listener(self.handle_event)
+        self._evict()
+
+    def _drop(self, user_id: int) -> None:
+        index = self._indexes.pop(user_id, None)
+        if index is not None:
+            self.nbytes -= index.nbytes
+
+    def _recent(self, times: dict[int, float]) -> dict[int, float]:
+        # Keep per-user timestamps bounded: once there are many, forget the
+        # ones older than the TTL, which no longer affect any decision.
+        if len(times) <= 4 * max(len(self._indexes), 256):
+            return times
+        now = time.monotonic()
+        return {id: at for id, at in times.items() if now - at <= self.ttl}
+
+    def _mark_changed(self, user_id: int) -> None:
+        self._changed = self._recent(self._changed)
+        self._changed[user_id] = time.monotonic()
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and self._indexes:
+            user_id, index = self._indexes.popitem(last=False)
+            self.nbytes -= index.nbytes
+
+    def apply(self, user_id: int, id: int, contact=None) -> None:
+        """
+        Apply a write made by this worker.
+
+        Args:
+            user_id (int): The ID of the contact owner.
+            id (int): The contact ID.
+            contact (Contact, optional): The contact after the write, or None if
+                it was deleted.
+        """
+        self._mark_changed(user_id)
+        self._skipped.pop(user_id, None)
+        index = self._indexes.get(user_id)
+        if index is None:
+            return
+        before = index.nbytes
+        if contact is None:
+            index.remove(id)
+        else:
+            index.upsert(
+                id, contact.name, contact.surname, contact.email, contact.phone, contact.birthdate
+            )
+        self.nbytes += index.nbytes - before
+        self._evict()
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's index after their contacts changed elsewhere.
+
+        Args:
+            user_id (int): The user ID.
+        """
+        self._mark_changed(user_id)
+        self._drop(user_id)
+
+    def handle_event(self, event: dict, origin: str | None) -> None:
+        """
+        Drop the index of a user whose contacts another worker changed.
+
+        Args:
+            event (dict): The contact event.
+            origin (str | None): The ID of the worker that published it.
+        """
+        if origin != WORKER_ID and "user_id" in event:
+            self.invalidate(event["user_id"])
+
+    def clear(self) -> None:
+        """
+        Drop every index and stop listening for events.
+        """
+        self._indexes.clear()
+        self._skipped.clear()
+        self._changed.clear()
+        self.nbytes = 0
+        contact_events.remove_listener(self.handle_event)
+
+
+contact_indexes = ContactIndexCache(
+    max_bytes=settings.CONTACTS_INDEX_MEMORY_BYTES,
+    min_contacts=settings.CONTACTS_INDEX_MIN_CONTACTS,
+    ttl=settings.CONTACTS_INDEX_TTL_SECONDS,
+)
+"""
+Contact indexes of this worker's power users.
+"""
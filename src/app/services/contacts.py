@@ -1,14 +1,259 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, extract, and_
+from collections import Counter
+from functools import cache
+
+from sqlalchemy import select, delete, insert, extract, and_, bindparam, func, union_all
+from sqlalchemy.dialects.postgresql import insert as upsert
+from sqlalchemy.orm import load_only, undefer
 from datetime import datetime, timedelta, timezone
 
-from app.database.models import Contact
-from app.response.schemas import ContactBase, ContactCreate, ContactUpdate
+from app.database.models import Contact, ContactStat, ContactTombstone
+from app.config.config import settings
+from app.services.contact_index import contact_indexes
+from app.services.events import contact_events
+from app.services.normalize import normalize_email, normalize_phone
+from app.response.schemas import ContactBase, ContactCreate, ContactUpdate, ContactBatchUpdateItem
+
+CONTACTS_PAGE = (
+    select(Contact)
+    .where(Contact.user_id == bindparam("user_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+"""
+A page of a user's contacts.
+
+Hot statements are built once with bound parameters, so a request only binds
+values and hits the engine's compiled cache instead of rebuilding the
+statement and its cache key.
+"""
+
+CONTACT_BY_ID = (
+    select(Contact)
+    .where(Contact.user_id == bindparam("user_id"), Contact.id == bindparam("id"))
+    .options(undefer(Contact.notes))
+)
+"""
+A user's contact by ID.
+"""
+
+
+CONTACTS_BY_IDS = (
+    select(Contact)
+    .where(
+        Contact.user_id == bindparam("user_id"),
+        Contact.id.in_(bindparam("ids", expanding=True)),
+    )
+    .options(undefer(Contact.notes))
+)
+"""
+A user's contacts by a list of IDs.
+"""
+
+
+CONTACT_CHANGES = (
+    select(Contact)
+    .where(
+        Contact.user_id == bindparam("user_id"),
+        Contact.updated_at > bindparam("since"),
+    )
+    .order_by(Contact.updated_at)
+    .options(undefer(Contact.notes))
+)
+"""
+A user's contacts changed after a point in time.
+"""
+
+CONTACT_DELETIONS = select(ContactTombstone.contact_id).where(
+    ContactTombstone.user_id == bindparam("user_id"),
+    ContactTombstone.deleted_at > bindparam("since"),
+)
+"""
+IDs of a user's contacts deleted after a point in time.
+"""
+
+
+CONTACT_FIELDS = ("name", "surname", "email", "phone", "birthdate", "notes", "user_id")
+"""
+Contact fields a list request can narrow its response to; the ID is always included.
+"""
+
+
+@cache
+def field_options(fields: tuple[str, ...] | None = None) -> tuple:
+    """
+    Get the loader options that load a set of contact fields.
+
+    Args:
+        fields (tuple[str, ...] | None): The fields from ``CONTACT_FIELDS``, or
+            None for every field including the deferred notes.
+
+    Returns:
+        tuple: The options for ``Select.options()``. Unloaded fields raise on
+        access instead of issuing a query per contact.
+    """
+    if fields is None:
+        return (undefer(Contact.notes),)
+    return (load_only(*(getattr(Contact, field) for field in fields), raiseload=True),)
+
+
+@cache
+def with_fields(stmt, fields: tuple[str, ...] | None = None):
+    """
+    Get a prebuilt statement narrowed to a set of contact fields.
+
+    The result is cached, so repeated requests for the same fields reuse one
+    statement. Only pass module-level statements, never per-request ones.
+
+    Args:
+        stmt (Select): The prebuilt statement.
+        fields (tuple[str, ...] | None): The fields, or None for all.
+
+    Returns:
+        Select: The statement with the loader options of ``field_options``.
+    """
+    return stmt.options(*field_options(fields))
+
+
+def _suggest_branch(column):
+    key = func.lower(column)
+    return (
+        select(Contact.id, key.label("key"), Contact.name, Contact.surname, Contact.email)
+        .where(
+            Contact.user_id == bindparam("user_id"),
+            key.like(bindparam("pattern"), escape="\\"),
+        )
+        .order_by(key, Contact.id)
+        .limit(bindparam("limit"))
+        .subquery()
+    )
+
+
+SUGGEST_CONTACTS = union_all(
+    *(select(_suggest_branch(column)) for column in (Contact.name, Contact.surname, Contact.email))
+)
+"""
+A user's contacts whose name, surname or email starts with a prefix.
+
+Each branch is a range scan of one of the ``SUGGEST_INDEXES`` returning at most
+``limit`` rows in key order, which is enough to merge the first ``limit``
+distinct contacts.
+"""
+
+SUGGEST_ENTRIES = (
+    select(Contact.id, Contact.name, Contact.surname, Contact.email)
+    .where(Contact.user_id == bindparam("user_id"))
+    .limit(bindparam("limit"))
+)
+"""
+The name, surname and email of a user's contacts, for building a prefix index.
+"""
+
+INDEX_ROWS = select(
+    Contact.id, Contact.name, Contact.surname, Contact.email, Contact.phone, Contact.birthdate
+).where(Contact.user_id == bindparam("user_id"))
+"""
+The columns of a user's contacts held by a ``ContactIndex``.
+"""
+
+INDEX_FETCH_CHUNK = 1000
+"""
+The most IDs fetched per query when loading contacts found in an index.
+"""
+
+
+FACETS = ("birth_month", "email_domain")
+"""
+Facets counted per user, besides the total.
+"""
+
+_stats_upsert = upsert(ContactStat)
+ADJUST_STATS = _stats_upsert.on_conflict_do_update(
+    index_elements=[ContactStat.user_id, ContactStat.facet, ContactStat.key],
+    set_={"count": ContactStat.count + _stats_upsert.excluded.count},
+)
+"""
+Add a delta to per-user contact counters, creating missing ones.
+
+``INSERT ... ON CONFLICT DO UPDATE`` has the same syntax on PostgreSQL and
+SQLite, so the PostgreSQL construct serves both.
+"""
+
+USER_STATS = select(ContactStat.facet, ContactStat.key, ContactStat.count).where(
+    ContactStat.user_id == bindparam("user_id"),
+    ContactStat.facet.in_(bindparam("facets", expanding=True)),
+    ContactStat.count > 0,
+)
+"""
+A user's contact counters for some facets.
+"""
+
+
+def stat_keys(birthdate, email) -> list[tuple[str, str]]:
+    """
+    Get the counters a contact contributes to.
+
+    Args:
+        birthdate (date | None): The contact birthdate.
+        email (str | None): The contact email.
+
+    Returns:
+        list[tuple[str, str]]: The facet and key of each counter.
+    """
+    month = f"{birthdate.month:02d}" if birthdate else ""
+    domain = email.rsplit("@", 1)[-1].lower() if email and "@" in email else ""
+    return [("total", ""), ("birth_month", month), ("email_domain", domain)]
+
+
+@cache
+def search_statement(name: bool, surname: bool, email: bool):
+    """
+    Get the prebuilt search statement for a combination of filters.
+
+    Args:
+        name (bool): Whether to filter by name.
+        surname (bool): Whether to filter by surname.
+        email (bool): Whether to filter by email.
+
+    Returns:
+        Select: The statement, with ``user_id`` and a pattern parameter per filter.
+    """
+    stmt = select(Contact).where(Contact.user_id == bindparam("user_id"))
+    if name:
+        stmt = stmt.filter(Contact.name.ilike(bindparam("name")))
+    if surname:
+        stmt = stmt.filter(Contact.surname.ilike(bindparam("surname")))
+    if email:
+        stmt = stmt.filter(Contact.email.ilike(bindparam("email")))
+    return stmt
+
+
+@cache
+def lookup_statement(phone: bool, email: bool):
+    """
+    Get the prebuilt lookup statement for a combination of keys.
+
+    Args:
+        phone (bool): Whether to match the normalized phone.
+        email (bool): Whether to match the normalized email.
+
+    Returns:
+        Select: The statement, with ``user_id`` and a parameter per key, each an
+        equality on an indexed normalized column.
+    """
+    stmt = select(Contact).where(Contact.user_id == bindparam("user_id"))
+    if phone:
+        stmt = stmt.filter(Contact.phone_normalized == bindparam("phone"))
+    if email:
+        stmt = stmt.filter(Contact.email_normalized == bindparam("email"))
+    return stmt.order_by(Contact.id)
 
 
 class ContactsService:
     """
     Service class for managing contacts.
+
+    Writes publish change events through ``contact_events`` once committed.
     """
 
     def __init__(self, session: AsyncSession):
@@ -41,20 +286,33 @@ class ContactsService:
             surname=contact.surname,
             email=contact.email,
             phone=contact.phone,
+            phone_normalized=normalize_phone(contact.phone),
+            email_normalized=normalize_email(contact.email),
             birthdate=self.str_to_date(contact.birthdate),
             notes=contact.notes,
             user_id=contact.user_id,
         )
         try:
             self.session.add(new_contact)
+            await self.adjust_stats(
+                contact.user_id,
+                Counter(stat_keys(new_contact.birthdate, new_contact.email)),
+            )
             await self.session.commit()
-            await self.session.refresh(new_contact)
         except Exception as e:
             await self.session.rollback()
             raise RuntimeError(f"An error occurred while creating the contact: {e}")
+        contact_indexes.apply(new_contact.user_id, new_contact.id, new_contact)
+        await contact_events.publish(new_contact.user_id, "created", new_contact.id, new_contact)
         return new_contact
 
-    async def get_contacts(self, user_id: int, skip: int = 0, limit: int = 10):
+    async def get_contacts(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        fields: tuple[str, ...] | None = None,
+    ):
         """
         Get a list of contacts for a user.
 
@@ -62,6 +320,7 @@ class ContactsService:
             user_id (int): The user ID.
             skip (int): The number of contacts to skip.
             limit (int): The maximum number of contacts to return.
+            fields (tuple[str, ...] | None): The fields to load, or None for all.
 
         Returns:
             List[Contact]: The list of contacts.
@@ -69,10 +328,10 @@ class ContactsService:
         Raises:
             ValueError: If no contacts are found.
         """
-        stmt = (
-            select(Contact).where(Contact.user_id == user_id).offset(skip).limit(limit)
+        result = await self.session.execute(
+            with_fields(CONTACTS_PAGE, fields),
+            {"user_id": user_id, "skip": skip, "limit": limit},
         )
-        result = await self.session.execute(stmt)
         if result is None:
             raise ValueError("No contacts found.")
         return result.scalars().all()
@@ -91,8 +350,9 @@ class ContactsService:
         Raises:
             ValueError: If the contact is not found.
         """
-        stmt = select(Contact).where(user_id == Contact.user_id, Contact.id == id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            CONTACT_BY_ID, {"user_id": user_id, "id": id}
+        )
         contact = result.scalar_one_or_none()
         if result is None:
             raise ValueError(f"Contact with the given ID {id} does not exist.")
@@ -118,26 +378,20 @@ class ContactsService:
         if existing_contact is None:
             raise ValueError("Contact with the given ID does not exist.")
 
-        if contact.name:
-            existing_contact.name = contact.name
-        if contact.surname:
-            existing_contact.surname = contact.surname
-        if contact.email:
-            existing_contact.email = contact.email
-        if contact.phone:
-            existing_contact.phone = contact.phone
-        if contact.birthdate:
-            existing_contact.birthdate = self.str_to_date(contact.birthdate)
-        if contact.notes:
-            existing_contact.notes = contact.notes
+        deltas = Counter()
+        deltas.subtract(stat_keys(existing_contact.birthdate, existing_contact.email))
+        self.apply_update(existing_contact, contact)
+        deltas.update(stat_keys(existing_contact.birthdate, existing_contact.email))
         try:
             self.session.add(existing_contact)
+            await self.adjust_stats(user_id, deltas)
             await self.session.commit()
-            await self.session.refresh(existing_contact)
         except Exception as e:
             await self.session.rollback()
             raise RuntimeError(f"Failed to update contact: {e}")
 
+        contact_indexes.apply(user_id, id, existing_contact)
+        await contact_events.publish(user_id, "updated", id, existing_contact)
         return existing_contact
     
     async def delete_contact(self, user_id: int, id: int):
@@ -160,14 +414,189 @@ class ContactsService:
             if contact is None:
                 raise ValueError(f"Contact with the given ID {id} does not exist.")
             await self.session.delete(contact)
+            self.session.add(ContactTombstone(contact_id=contact.id, user_id=user_id))
+            deltas = Counter()
+            deltas.subtract(stat_keys(contact.birthdate, contact.email))
+            await self.adjust_stats(user_id, deltas)
             await self.session.commit()
-            return contact
         except Exception as e:
             await self.session.rollback()
             raise RuntimeError(f"Failed to delete contact. {e}")
+        contact_indexes.apply(user_id, id)
+        await contact_events.publish(user_id, "deleted", id)
+        return contact
+
+    async def get_by_ids(self, user_id: int, ids: list[int]) -> dict[int, Contact]:
+        """
+        Get several contacts by ID in one query.
+
+        Args:
+            user_id (int): The user ID.
+            ids (list[int]): The contact IDs.
+
+        Returns:
+            dict[int, Contact]: The contacts found, by ID.
+        """
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            CONTACTS_BY_IDS, {"user_id": user_id, "ids": list(ids)}
+        )
+        return {contact.id: contact for contact in result.scalars().all()}
+
+    async def update_contacts(
+        self, user_id: int, updates: list[ContactBatchUpdateItem]
+    ) -> dict[int, Contact]:
+        """
+        Update several contacts in one transaction.
+
+        The contacts are loaded with one query and the changes are flushed
+        together on commit.
+
+        Args:
+            user_id (int): The user ID.
+            updates (list[ContactBatchUpdateItem]): The changes, each with its contact ID.
+
+        Returns:
+            dict[int, Contact]: The updated contacts, by ID. Contacts that were not
+                found are missing.
+
+        Raises:
+            RuntimeError: If an error occurs during update.
+        """
+        contacts = await self.get_by_ids(user_id, [update.id for update in updates])
+        deltas = Counter()
+        for update in updates:
+            if update.id in contacts:
+                existing = contacts[update.id]
+                deltas.subtract(stat_keys(existing.birthdate, existing.email))
+                self.apply_update(existing, update)
+                deltas.update(stat_keys(existing.birthdate, existing.email))
+        try:
+            await self.adjust_stats(user_id, deltas)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise RuntimeError(f"Failed to update contacts: {e}")
+        for id, contact in contacts.items():
+            contact_indexes.apply(user_id, id, contact)
+        await contact_events.publish_many(user_id, "updated", contacts)
+        return contacts
+
+    async def delete_contacts(self, user_id: int, ids: list[int]) -> set[int]:
+        """
+        Delete several contacts with one statement and record their tombstones.
+
+        Args:
+            user_id (int): The user ID.
+            ids (list[int]): The contact IDs.
+
+        Returns:
+            set[int]: The IDs of the deleted contacts.
+
+        Raises:
+            RuntimeError: If an error occurs during deletion.
+        """
+        if not ids:
+            return set()
+        stmt = (
+            delete(Contact)
+            .where(Contact.user_id == user_id, Contact.id.in_(ids))
+            .returning(Contact.id, Contact.birthdate, Contact.email)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            deleted = set()
+            deltas = Counter()
+            for id, birthdate, email in result.all():
+                deleted.add(id)
+                deltas.subtract(stat_keys(birthdate, email))
+            await self.adjust_stats(user_id, deltas)
+            if deleted:
+                await self.session.execute(
+                    insert(ContactTombstone),
+                    [{"contact_id": id, "user_id": user_id} for id in deleted],
+                )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise RuntimeError(f"Failed to delete contacts: {e}")
+        for id in deleted:
+            contact_indexes.apply(user_id, id)
+        await contact_events.publish_many(user_id, "deleted", dict.fromkeys(deleted))
+        return deleted
+
+    async def adjust_stats(self, user_id: int, deltas: Counter):
+        """
+        Apply changes to a user's contact counters in the current transaction.
+
+        Args:
+            user_id (int): The user ID.
+            deltas (Counter): The change of each ``(facet, key)`` counter.
+        """
+        rows = [
+            {"user_id": user_id, "facet": facet, "key": key, "count": delta}
+            for (facet, key), delta in deltas.items()
+            if delta
+        ]
+        if rows:
+            await self.session.execute(ADJUST_STATS, rows)
+
+    async def get_stats(self, user_id: int, facets: list[str]) -> tuple[int, dict]:
+        """
+        Get a user's contact total and facet counts from the counters.
+
+        Args:
+            user_id (int): The user ID.
+            facets (list[str]): The facets to count, from ``FACETS``.
+
+        Returns:
+            tuple[int, dict]: The total and the count per key of each facet.
+        """
+        result = await self.session.execute(
+            USER_STATS, {"user_id": user_id, "facets": ["total", *facets]}
+        )
+        total = 0
+        counts = {facet: {} for facet in facets}
+        for facet, key, count in result.all():
+            if facet == "total":
+                total = count
+            else:
+                counts[facet][key] = count
+        return total, counts
+
+    async def get_changes(self, user_id: int, since: datetime | None):
+        """
+        Get the contacts changed and deleted after a point in time.
+
+        Args:
+            user_id (int): The user ID.
+            since (datetime | None): The point in time, or None for a full sync.
+
+        Returns:
+            tuple[list[Contact], list[int]]: The changed contacts, oldest change
+                first, and the IDs of the deleted contacts.
+        """
+        if since is None:
+            result = await self.session.execute(
+                select(Contact)
+                .where(Contact.user_id == user_id)
+                .order_by(Contact.updated_at)
+                .options(undefer(Contact.notes))
+            )
+            return result.scalars().all(), []
+        params = {"user_id": user_id, "since": since}
+        changed = await self.session.execute(CONTACT_CHANGES, params)
+        deleted = await self.session.execute(CONTACT_DELETIONS, params)
+        return changed.scalars().all(), sorted(set(deleted.scalars().all()))
 
     async def search_contacts(
-        self, user_id: int, name: str = None, surname: str = None, email: str = None
+        self,
+        user_id: int,
+        name: str = None,
+        surname: str = None,
+        email: str = None,
+        fields: tuple[str, ...] | None = None,
     ):
         """
         Search for contacts.
@@ -177,28 +606,116 @@ class ContactsService:
             name (str): The name to search for.
             surname (str): The surname to search for.
             email (str): The email to search for.
+            fields (tuple[str, ...] | None): The fields to load, or None for all.
 
         Returns:
             List[Contact]: The list of matching contacts.
         """
-        stmt = select(Contact).where(user_id == Contact.user_id)
+        needles = [value for value in (name, surname, email) if value]
+        # The index matches substrings literally; LIKE wildcards go to the database.
+        if not any("%" in value or "_" in value for value in needles):
+            index = await self.get_index(user_id)
+            if index is not None:
+                return await self.from_index(
+                    user_id, index, index.search(name, surname, email), fields
+                )
 
+        params = {"user_id": user_id}
         if name:
-            stmt = stmt.filter(Contact.name.ilike(f"%{name}%"))
+            params["name"] = f"%{name}%"
         if surname:
-            stmt = stmt.filter(Contact.surname.ilike(f"%{surname}%"))
+            params["surname"] = f"%{surname}%"
         if email:
-            stmt = stmt.filter(Contact.email.ilike(f"%{email}%"))
+            params["email"] = f"%{email}%"
 
-        result = await self.session.execute(stmt)
+        stmt = search_statement(bool(name), bool(surname), bool(email))
+        result = await self.session.execute(with_fields(stmt, fields), params)
         return result.scalars().all()
 
-    async def get_upcoming_birthdays(self, user_id: int):
+    async def lookup_contacts(
+        self,
+        user_id: int,
+        phone: str = None,
+        email: str = None,
+        fields: tuple[str, ...] | None = None,
+    ):
+        """
+        Find contacts by exact phone number or email, whatever their formatting.
+
+        Args:
+            user_id (int): The user ID.
+            phone (str): The phone number, normalized to E.164 before matching.
+            email (str): The email, matched case-insensitively.
+            fields (tuple[str, ...] | None): The fields to load, or None for all.
+
+        Returns:
+            List[Contact]: The matching contacts, by ID.
+        """
+        params = {"user_id": user_id}
+        if phone:
+            params["phone"] = normalize_phone(phone)
+        if email:
+            params["email"] = normalize_email(email)
+        if None in params.values():
+            return []
+
+        stmt = lookup_statement(bool(phone), bool(email))
+        result = await self.session.execute(with_fields(stmt, fields), params)
+        return result.scalars().all()
+
+    async def suggest_contacts(self, user_id: int, prefix: str, limit: int) -> list[dict]:
+        """
+        Get contacts whose name, surname or email starts with a prefix.
+
+        Args:
+            user_id (int): The user ID.
+            prefix (str): The prefix, matched case-insensitively.
+            limit (int): The maximum number of contacts to return.
+
+        Returns:
+            list[dict]: The ID, name, surname and email of each contact, ordered
+                by the matching value.
+        """
+        escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        result = await self.session.execute(
+            SUGGEST_CONTACTS,
+            {"user_id": user_id, "pattern": f"{escaped}%", "limit": limit},
+        )
+        suggestions = {}
+        for row in sorted(result.all(), key=lambda row: (row.key, row.id)):
+            if row.id not in suggestions:
+                suggestions[row.id] = {
+                    "id": row.id, "name": row.name, "surname": row.surname, "email": row.email
+                }
+                if len(suggestions) == limit:
+                    break
+        return list(suggestions.values())
+
+    async def get_suggest_entries(self, user_id: int, limit: int) -> list[tuple]:
+        """
+        Get the name, surname and email of a user's contacts.
+
+        Args:
+            user_id (int): The user ID.
+            limit (int): The maximum number of contacts to return.
+
+        Returns:
+            list[tuple]: The ID, name, surname and email of each contact.
+        """
+        result = await self.session.execute(
+            SUGGEST_ENTRIES, {"user_id": user_id, "limit": limit}
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_upcoming_birthdays(
+        self, user_id: int, fields: tuple[str, ...] | None = None
+    ):
         """
         Get upcoming birthdays.
 
         Args:
             user_id (int): The user ID.
+            fields (tuple[str, ...] | None): The fields to load, or None for all.
 
         Returns:
             List[Contact]: The list of contacts with upcoming birthdays.
@@ -206,25 +723,103 @@ class ContactsService:
         today = datetime.now(timezone.utc).date()
         next_week = today + timedelta(days=7)
 
+        index = await self.get_index(user_id)
+        if index is not None:
+            return await self.from_index(
+                user_id, index, index.upcoming_birthdays(today, 7), fields
+            )
+
+        month = extract("month", Contact.birthdate)
+        day = extract("day", Contact.birthdate)
+        if today.month == next_week.month:
+            window = and_(month == today.month, day >= today.day, day < next_week.day)
+        else:
+            window = and_(month == today.month, day >= today.day) | and_(
+                month == next_week.month, day < next_week.day
+            )
         query = (
             select(Contact)
             .where(user_id == Contact.user_id)
-            .filter(
-                and_(
-                    extract("month", Contact.birthdate) == today.month,
-                    extract("day", Contact.birthdate) >= today.day,
-                    extract("day", Contact.birthdate) < next_week.day,
-                )
-                | and_(
-                    extract("month", Contact.birthdate) == next_week.month,
-                    extract("day", Contact.birthdate) < next_week.day,
-                )
-            )
+            .filter(window)
+            .options(*field_options(fields))
         )
 
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_index(self, user_id: int):
+        """
+        Get a user's in-memory contact index, loading it if they have enough contacts.
+
+        Args:
+            user_id (int): The user ID.
+
+        Returns:
+            ContactIndex | None: The index, or None if indexes are disabled or
+                the user has too few contacts.
+        """
+        if not settings.CONTACTS_INDEX_ENABLED:
+            return None
+
+        async def count():
+            total, _ = await self.get_stats(user_id, [])
+            return total
+
+        async def rows():
+            result = await self.session.execute(INDEX_ROWS, {"user_id": user_id})
+            return result.all()
+
+        return await contact_indexes.load(user_id, count, rows)
+
+    async def from_index(
+        self, user_id: int, index, ids: list[int], fields: tuple[str, ...] | None
+    ) -> list:
+        """
+        Get the contacts an index query found.
+
+        Without notes they are served from the index itself; otherwise they
+        are fetched by ID.
+
+        Args:
+            user_id (int): The user ID.
+            index (ContactIndex): The index.
+            ids (list[int]): The contact IDs, in result order.
+            fields (tuple[str, ...] | None): The fields to load, or None for all.
+
+        Returns:
+            list: The contacts, in the order of ``ids``.
+        """
+        if fields is not None and "notes" not in fields:
+            return [index.contact(id) for id in ids]
+        contacts = {}
+        for start in range(0, len(ids), INDEX_FETCH_CHUNK):
+            contacts.update(await self.get_by_ids(user_id, ids[start:start + INDEX_FETCH_CHUNK]))
+        return [contacts[id] for id in ids if id in contacts]
+
+    @classmethod
+    def apply_update(cls, existing_contact: Contact, contact: ContactUpdate):
+        """
+        Copy the fields set in an update onto a contact.
+
+        Args:
+            existing_contact (Contact): The contact to change.
+            contact (ContactUpdate): The updated contact data.
+        """
+        if contact.name:
+            existing_contact.name = contact.name
+        if contact.surname:
+            existing_contact.surname = contact.surname
+        if contact.email:
+            existing_contact.email = contact.email
+            existing_contact.email_normalized = normalize_email(contact.email)
+        if contact.phone:
+            existing_contact.phone = contact.phone
+            existing_contact.phone_normalized = normalize_phone(contact.phone)
+        if contact.birthdate:
+            existing_contact.birthdate = cls.str_to_date(contact.birthdate)
+        if contact.notes:
+            existing_contact.notes = contact.notes
+
     @staticmethod
     def str_to_date(date_str):
         """
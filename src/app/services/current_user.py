@@ -1,24 +1,32 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-import redis.asyncio as aioredis
 import json
 
 from app.database.db import get_db
 from app.services.user import UserService
 from app.config.config import settings
 from app.response.schemas import User
+from app.services.metrics import USER_CACHE_REQUESTS
+from app.services.cache import redis_client
+from app.services.single_flight import SingleFlight, single_flight
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-redis_client = aioredis.Redis(host="localhost", port=6379, decode_responses=True)
 
+current_users = SingleFlight()
+"""
+Concurrent lookups of the same token.
+"""
+
+@single_flight(current_users, group="token", exclude=("db",))
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ):
     """
     Get the current user from the token.
 
+    Concurrent requests with the same token share one cache and database lookup.
+
     Args:
         token (str): The token to validate.
         db (AsyncSession): The database session.
@@ -36,10 +44,11 @@ async def get_current_user(
     )
     cached_user = await redis_client.get(f"user:{token}")
     if cached_user:
-        print("!!!!!!!!!!!!!!!!!!!")
-        print(cached_user)
-        print("!!!!!!!!!!!!!!!!!!!")
+        USER_CACHE_REQUESTS.labels("hit").inc()
         return User(**json.loads(cached_user))
+    USER_CACHE_REQUESTS.labels("miss").inc()
+    from jose import JWTError, jwt
+
     try:
         """
         Decode the token and extract the username.
@@ -66,6 +75,13 @@ async def get_current_user(
     """
 
     user = await user_service.get_user_by_username(username)
+
+    """
+    Give the connection back to the pool now rather than at the end of the
+    request; the route opens a new transaction if it needs the database.
+    """
+    await db.close()
+
     if user is None:
         """
         Raise an exception if the user is not found.
@@ -81,4 +97,4 @@ async def get_current_user(
     }
     
     await redis_client.setex(f"user:{token}", 3600, json.dumps(user_data))
-    return user
\ No newline at end of file
+    return User(**user_data)
\ No newline at end of file
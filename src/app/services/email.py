@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 from typing import Literal
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
@@ -7,19 +8,28 @@ from pydantic import EmailStr
 from app.services.auth import create_email_token
 from app.config.config import settings
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-    VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
-)
+
+@cache
+def get_connection_config() -> ConnectionConfig:
+    """
+    Get the mail connection configuration, built on first use.
+
+    Returns:
+        ConnectionConfig: The mail connection configuration.
+    """
+    return ConnectionConfig(
+        MAIL_USERNAME=settings.MAIL_USERNAME,
+        MAIL_PASSWORD=settings.MAIL_PASSWORD,
+        MAIL_FROM=settings.MAIL_FROM,
+        MAIL_PORT=settings.MAIL_PORT,
+        MAIL_SERVER=settings.MAIL_SERVER,
+        MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
+        MAIL_STARTTLS=settings.MAIL_STARTTLS,
+        MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
+        USE_CREDENTIALS=settings.USE_CREDENTIALS,
+        VALIDATE_CERTS=settings.VALIDATE_CERTS,
+        TEMPLATE_FOLDER=Path(__file__).parent / "templates",
+    )
 
 
 async def send_email(
@@ -51,7 +61,7 @@ async def send_email(
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
+        fm = FastMail(get_connection_config())
         await fm.send_message(message, template_name=template_name)
     except ConnectionErrors as err:
-        print(f"Email send error: {err}")
\ No newline at end of file
+        print(f"Email send error: {err}")
@@ -0,0 +1,41 @@
+from typing import Literal
+from fastapi import BackgroundTasks
+from pydantic import EmailStr
+
+from app.services.metrics import EMAIL_QUEUE_DEPTH
+
+
+async def _send_queued_email(*args):
+    """
+    Send a queued email and remove it from the queue depth gauge.
+
+    The mail integration is imported here, on first send, rather than when the
+    routes are imported.
+    """
+    from app.services.email import send_email
+
+    try:
+        await send_email(*args)
+    finally:
+        EMAIL_QUEUE_DEPTH.dec()
+
+
+def enqueue_email(
+    background_tasks: BackgroundTasks,
+    email: EmailStr,
+    username: str,
+    host: str,
+    type: Literal["confirmation", "reset"] = "confirmation",
+):
+    """
+    Queue an email to be sent after the response.
+
+    Args:
+        background_tasks (BackgroundTasks): The request background tasks.
+        email (EmailStr): The recipient email.
+        username (str): The recipient name.
+        host (str): The base URL used in the email links.
+        type (str): The email type, ``confirmation`` or ``reset``.
+    """
+    EMAIL_QUEUE_DEPTH.inc()
+    background_tasks.add_task(_send_queued_email, email, username, host, type)
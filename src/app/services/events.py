@@ -0,0 +1,195 @@
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from collections import defaultdict
+
+from app.config.config import settings
+from app.response.schemas import ContactResponse
+from app.services.cache import redis_client
+
+CONTACT_EVENTS_CHANNEL = "contact-events"
+"""
+Redis pub/sub channel carrying contact change events between workers.
+"""
+
+WORKER_ID = uuid.uuid4().hex
+"""
+Identifier of this worker process, sent with its events so it can recognise them.
+"""
+
+logger = logging.getLogger("app.events")
+"""
+Logger for event publishing and delivery problems.
+"""
+
+
+class ContactEventBroker:
+    """
+    Fan-out of contact change events to stream connections.
+
+    Events are published to a Redis channel so that every worker receives
+    them. Each worker runs a single subscriber while it has open streams or
+    listeners, delivers events to the bounded queues of the owner's
+    connections and passes them to the listeners.
+
+    Args:
+        redis: The Redis client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._queues: dict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._callbacks: list = []
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, user_id: int, type: str, id: int, contact=None):
+        """
+        Publish a contact change event.
+
+        Errors are logged and swallowed: a write must not fail because its
+        notification could not be sent.
+
+        Args:
+            user_id (int): The ID of the contact owner.
+            type (str): The event type, ``created``, ``updated`` or ``deleted``.
+            id (int): The contact ID.
+            contact (Contact, optional): The contact, for created and updated contacts.
+        """
+        await self.publish_many(user_id, type, {id: contact})
+
+    async def publish_many(self, user_id: int, type: str, contacts: dict):
+        """
+        Publish change events of the same type for several contacts in one round trip.
+
+        Args:
+            user_id (int): The ID of the contacts owner.
+            type (str): The event type, ``created``, ``updated`` or ``deleted``.
+            contacts (dict): The contacts by ID; values are None for deleted contacts.
+        """
+        if not contacts:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for id, contact in contacts.items():
+                    event = self._event(user_id, type, id, contact)
+                    pipe.publish(CONTACT_EVENTS_CHANNEL, json.dumps(event))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish contact events: {e}")
+
+    @staticmethod
+    def _event(user_id: int, type: str, id: int, contact) -> dict:
+        return {
+            "user_id": user_id,
+            "type": type,
+            "id": id,
+            "contact": ContactResponse.from_orm(contact).model_dump() if contact else None,
+            "origin": WORKER_ID,
+        }
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, user_id: int):
+        """
+        Receive the contact events of a user.
+
+        Args:
+            user_id (int): The user ID.
+
+        Yields:
+            asyncio.Queue: The queue events are delivered to.
+        """
+        queue = asyncio.Queue(maxsize=settings.CONTACTS_STREAM_QUEUE_SIZE)
+        self._queues[user_id].add(queue)
+        self._start_listener()
+        try:
+            yield queue
+        finally:
+            self._queues[user_id].discard(queue)
+            if not self._queues[user_id]:
+                del self._queues[user_id]
+            self._stop_listener()
+
+    def add_listener(self, callback):
+        """
+        Call a function with every event published by any worker.
+
+        Args:
+            callback: A function taking the event and the ID of the worker that
+                published it.
+        """
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+        self._start_listener()
+
+    def remove_listener(self, callback):
+        """
+        Stop calling a function added with ``add_listener``.
+
+        Args:
+            callback: The function.
+        """
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+        self._stop_listener()
+
+    def _start_listener(self):
+        listener = self._listener
+        if (
+            listener is None
+            or listener.done()
+            or listener.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._listener = asyncio.create_task(self._listen())
+
+    def _stop_listener(self):
+        if not self._queues and not self._callbacks and self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    def dispatch(self, event: dict):
+        """
+        Deliver an event to the connections of its owner.
+
+        A connection whose queue is full loses its buffered events and gets an
+        ``overflow`` event instead, telling the client to resync through
+        ``/api/contacts/changes``. A slow client never blocks the others.
+
+        Args:
+            event (dict): The event.
+        """
+        for queue in self._queues.get(event["user_id"], ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"user_id": event["user_id"], "type": "overflow"})
+
+    async def _listen(self):
+        delay = 0.5
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CONTACT_EVENTS_CHANNEL)
+                    delay = 0.5
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            event = json.loads(message["data"])
+                            origin = event.pop("origin", None)
+                            for callback in self._callbacks:
+                                callback(event, origin)
+                            self.dispatch(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Contact event subscription failed, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10)
+
+
+contact_events = ContactEventBroker(redis_client)
+"""
+Shared contact event broker.
+"""
@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.config.config import settings
+from app.database.db import sessionmanager
+from app.services.cache import redis_client
+from app.services.metrics import EMAIL_QUEUE_DEPTH
+
+CRITICAL_DEPENDENCIES = ("database", "redis")
+"""
+Dependencies the app cannot serve requests without.
+
+A failing SMTP server only delays emails, so it degrades the status without
+failing readiness.
+"""
+
+
+async def _check_database():
+    async with sessionmanager.session() as session:
+        await session.execute(text("SELECT 1"))
+
+
+async def _check_redis():
+    await redis_client.ping()
+
+
+async def _check_smtp():
+    _, writer = await asyncio.open_connection(settings.MAIL_SERVER, settings.MAIL_PORT)
+    writer.close()
+    await writer.wait_closed()
+
+
+CHECKS = {
+    "database": _check_database,
+    "redis": _check_redis,
+    "smtp": _check_smtp,
+}
+"""
+Dependency probes by name.
+"""
+
+
+async def _probe(check) -> dict:
+    """
+    Run a dependency probe with a timeout and measure its latency.
+
+    Args:
+        check: The probe coroutine function.
+
+    Returns:
+        dict: The probe status, latency and error, if any.
+    """
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(check(), settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+        result = {"status": "ok"}
+    except asyncio.TimeoutError:
+        result = {"status": "timeout"}
+    except Exception as e:
+        result = {"status": "error", "error": type(e).__name__}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+class HealthChecker:
+    """
+    Dependency checker that caches its result for a short interval.
+
+    Concurrent callers share one run of the probes.
+    """
+
+    def __init__(self):
+        self._result: dict | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def check(self) -> dict:
+        """
+        Probe all dependencies in parallel, or return the cached result.
+
+        Returns:
+            dict: The overall status and the result of every probe.
+        """
+        async with self._lock:
+            if (
+                self._result is None
+                or time.monotonic() - self._checked_at >= settings.HEALTH_CHECK_CACHE_SECONDS
+            ):
+                self._result = await self._run()
+                self._checked_at = time.monotonic()
+            return self._result
+
+    def reset(self) -> None:
+        """
+        Drop the cached result.
+        """
+        self._result = None
+
+    @staticmethod
+    async def _run() -> dict:
+        results = await asyncio.gather(*(_probe(check) for check in CHECKS.values()))
+        checks = dict(zip(CHECKS, results))
+        checks["smtp"]["queue_depth"] = int(EMAIL_QUEUE_DEPTH._value.get())
+
+        if any(checks[name]["status"] != "ok" for name in CRITICAL_DEPENDENCIES):
+            status = "unavailable"
+        elif any(check["status"] != "ok" for check in checks.values()):
+            status = "degraded"
+        else:
+            status = "ok"
+        return {"status": status, "checks": checks}
+
+
+health_checker = HealthChecker()
+"""
+Shared dependency checker.
+"""
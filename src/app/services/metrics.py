@@ -0,0 +1,97 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10),
+)
+"""
+Request latency histogram.
+
+Labelled by the route template (e.g. ``/api/contacts/{contact_id}``) rather than
+the raw path, so the number of series stays bounded.
+"""
+
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+"""
+In-flight requests gauge.
+"""
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Number of SQL statements executed per HTTP request.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+"""
+Per-request SQL statement count histogram.
+"""
+
+DB_QUERY_TIME_PER_REQUEST = Histogram(
+    "db_query_time_per_request_seconds",
+    "Total time spent in SQL statements per HTTP request.",
+    ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+"""
+Per-request SQL time histogram.
+"""
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of individual SQL statements.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+"""
+Single SQL statement duration histogram.
+"""
+
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total", "Redis user cache lookups.", ["result"]
+)
+"""
+User cache lookups counter, labelled ``hit`` or ``miss``.
+"""
+
+BCRYPT_DURATION = Histogram(
+    "bcrypt_duration_seconds",
+    "Time spent hashing and verifying passwords.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2),
+)
+"""
+Password hashing histogram, labelled ``hash`` or ``verify``.
+"""
+
+EMAIL_QUEUE_DEPTH = Gauge(
+    "email_queue_depth",
+    "Number of emails queued as background tasks and not yet sent.",
+    multiprocess_mode="livesum",
+)
+"""
+Email queue depth gauge.
+"""
+
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "Requests shed by admission control.",
+    ["group", "reason"],
+)
+"""
+Shed requests counter, labelled by route group and ``queue_full`` or ``timeout``.
+"""
+
+ADMISSION_LIMIT = Gauge(
+    "admission_concurrency_limit",
+    "Current admission concurrency limit.",
+    ["group"],
+    multiprocess_mode="liveall",
+)
+"""
+Admission concurrency limit gauge, per route group.
+"""
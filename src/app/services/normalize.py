@@ -0,0 +1,61 @@
+import re
+
+from app.config.config import settings
+
+_NON_DIGITS = re.compile(r"\D")
+
+E164_MAX_DIGITS = 15
+"""
+The most digits an E.164 number has, country code included.
+"""
+
+
+def normalize_phone(phone: str | None, country_code: str | None = None) -> str | None:
+    """
+    Normalize a free-form phone number to E.164.
+
+    Separators are dropped. A number starting with ``+`` or ``00`` already
+    carries its country code; any other number gets ``country_code``, after
+    dropping a trunk ``0``.
+
+    Args:
+        phone (str | None): The phone number as entered.
+        country_code (str | None): The calling code for national numbers.
+            Defaults to ``CONTACTS_PHONE_COUNTRY_CODE``.
+
+    Returns:
+        str | None: The number, e.g. ``+380501234567``, or None if it has no
+        digits or too many.
+    """
+    if not phone:
+        return None
+    if country_code is None:
+        country_code = settings.CONTACTS_PHONE_COUNTRY_CODE
+    phone = phone.strip()
+    digits = _NON_DIGITS.sub("", phone)
+    if not digits:
+        return None
+    if phone.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif country_code:
+        digits = country_code + digits.removeprefix("0")
+    if not digits or len(digits) > E164_MAX_DIGITS:
+        return None
+    return f"+{digits}"
+
+
+def normalize_email(email: str | None) -> str | None:
+    """
+    Normalize an email address for lookups.
+
+    Args:
+        email (str | None): The email as entered.
+
+    Returns:
+        str | None: The trimmed, lower-cased email, or None if it is empty.
+    """
+    if not email:
+        return None
+    return email.strip().lower() or None
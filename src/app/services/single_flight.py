@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import inspect
+from collections.abc import Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight wait for the same result or exception instead of repeating the
+    work. Keys belong to a group, usually a user, so a write can ``forget`` the
+    group's in-flight reads and later readers never join a read that started
+    before the write.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, dict[Hashable, asyncio.Future]] = {}
+
+    async def do(self, group: Hashable, key: Hashable, call):
+        """
+        Run a call, or wait for the identical call already in flight.
+
+        If the caller running the call is cancelled, a waiting caller runs it
+        again instead of being cancelled too.
+
+        Args:
+            group (Hashable): The group the key belongs to.
+            key (Hashable): The key identifying identical calls.
+            call: A function without arguments returning the awaitable to run.
+
+        Returns:
+            The result of the call.
+        """
+        while True:
+            calls = self._calls.setdefault(group, {})
+            future = calls.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        calls[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve it, so a call nobody waited for is not reported as an
+            # unhandled exception.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._release(group, key, future)
+
+    def forget(self, group: Hashable) -> None:
+        """
+        Stop coalescing with the calls currently in flight for a group.
+
+        Callers already waiting still get their results.
+
+        Args:
+            group (Hashable): The group.
+        """
+        self._calls.pop(group, None)
+
+    def _release(self, group, key, future):
+        calls = self._calls.get(group)
+        if calls is not None and calls.get(key) is future:
+            del calls[key]
+            if not calls:
+                del self._calls[group]
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def single_flight(flight: SingleFlight, group: str, exclude: tuple[str, ...] = ("self",)):
+    """
+    Coalesce concurrent identical calls of an async function.
+
+    Calls are identical when all their arguments, except the excluded ones, are
+    equal, whether passed by position or by keyword.
+
+    Args:
+        flight (SingleFlight): The coalescing registry.
+        group (str): The argument that names the key's group.
+        exclude (tuple[str, ...]): Arguments that are not part of the key, such
+            as ``self`` or a database session.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(function):
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (function.__qualname__,) + tuple(
+                (name, _freeze(value))
+                for name, value in bound.arguments.items()
+                if name not in exclude
+            )
+            return await flight.do(
+                bound.arguments[group], key, lambda: function(*args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,176 @@
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+
+from app.config.config import settings
+
+
+class PrefixIndex:
+    """
+    Sorted prefix index over one user's contact names, surnames and emails.
+
+    Every lower-cased value is kept in one sorted list, so a prefix lookup is a
+    binary search followed by a short scan, ordered the same way as
+    ``ContactsService.suggest_contacts``.
+
+    Args:
+        rows: The ID, name, surname and email of each contact.
+        built_at (float | None): The monotonic time the rows were read at.
+            Defaults to now.
+    """
+
+    def __init__(self, rows, built_at: float | None = None):
+        self.contacts = {}
+        entries = []
+        for id, name, surname, email in rows:
+            self.contacts[id] = {"id": id, "name": name, "surname": surname, "email": email}
+            for value in (name, surname, email):
+                if value:
+                    entries.append((value.lower(), id))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._ids = [id for _, id in entries]
+        self.built_at = time.monotonic() if built_at is None else built_at
+
+    def search(self, prefix: str, limit: int) -> list[dict]:
+        """
+        Get contacts with a value starting with a prefix.
+
+        Args:
+            prefix (str): The prefix, matched case-insensitively.
+            limit (int): The maximum number of contacts to return.
+
+        Returns:
+            list[dict]: The ID, name, surname and email of each contact.
+        """
+        prefix = prefix.lower()
+        found = {}
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[position].startswith(prefix) or len(found) == limit:
+                break
+            id = self._ids[position]
+            if id not in found:
+                found[id] = self.contacts[id]
+        return list(found.values())
+
+
+class SuggestIndexCache:
+    """
+    Prefix indexes of the users who request suggestions most, per worker.
+
+    A user gets an index once they make ``hot_requests`` suggestion requests
+    within ``ttl`` seconds. Indexes live for ``ttl`` seconds and the least
+    recently used one is evicted when there are more than ``max_users``.
+
+    Args:
+        max_users (int): The maximum number of indexes kept.
+        hot_requests (int): The number of requests that makes a user hot.
+        ttl (float): The lifetime of an index and of the request counts, in seconds.
+    """
+
+    def __init__(self, max_users: int, hot_requests: int, ttl: float):
+        self.max_users = max_users
+        self.hot_requests = hot_requests
+        self.ttl = ttl
+        self._indexes: OrderedDict[int, PrefixIndex] = OrderedDict()
+        self._requests: Counter[int] = Counter()
+        self._too_large: set[int] = set()
+        self._invalidated: dict[int, float] = {}
+        self._window_started = time.monotonic()
+
+    def get(self, user_id: int) -> PrefixIndex | None:
+        """
+        Get a user's index if it is still fresh.
+
+        Args:
+            user_id (int): The user ID.
+
+        Returns:
+            PrefixIndex | None: The index, or None.
+        """
+        index = self._indexes.get(user_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.built_at > self.ttl:
+            del self._indexes[user_id]
+            return None
+        self._indexes.move_to_end(user_id)
+        return index
+
+    def is_hot(self, user_id: int) -> bool:
+        """
+        Count a suggestion request that missed the index.
+
+        Args:
+            user_id (int): The user ID.
+
+        Returns:
+            bool: Whether an index should be built for the user.
+        """
+        now = time.monotonic()
+        if now - self._window_started > self.ttl:
+            self._requests.clear()
+            self._too_large.clear()
+            self._invalidated = {
+                id: at for id, at in self._invalidated.items() if now - at <= self.ttl
+            }
+            self._window_started = now
+        if user_id in self._too_large:
+            return False
+        self._requests[user_id] += 1
+        return self._requests[user_id] >= self.hot_requests
+
+    def put(self, user_id: int, index: PrefixIndex) -> None:
+        """
+        Store a user's index, evicting the least recently used one if full.
+
+        An index read before the user's last write is dropped instead.
+
+        Args:
+            user_id (int): The user ID.
+            index (PrefixIndex): The index.
+        """
+        if self._invalidated.get(user_id, float("-inf")) >= index.built_at:
+            return
+        self._indexes[user_id] = index
+        self._indexes.move_to_end(user_id)
+        while len(self._indexes) > self.max_users:
+            self._indexes.popitem(last=False)
+
+    def mark_too_large(self, user_id: int) -> None:
+        """
+        Serve a user from the database until the request counts reset.
+
+        Args:
+            user_id (int): The user ID.
+        """
+        self._too_large.add(user_id)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's index after their contacts changed.
+
+        Args:
+            user_id (int): The user ID.
+        """
+        self._indexes.pop(user_id, None)
+        self._invalidated[user_id] = time.monotonic()
+
+    def clear(self) -> None:
+        """
+        Drop every index and request count.
+        """
+        self._indexes.clear()
+        self._requests.clear()
+        self._too_large.clear()
+        self._invalidated.clear()
+
+
+suggest_indexes = SuggestIndexCache(
+    max_users=settings.CONTACTS_SUGGEST_INDEX_USERS,
+    hot_requests=settings.CONTACTS_SUGGEST_HOT_REQUESTS,
+    ttl=settings.CONTACTS_SUGGEST_INDEX_TTL_SECONDS,
+)
+"""
+Prefix indexes of this worker's hot users.
+"""
@@ -0,0 +1,68 @@
+import base64
+from datetime import datetime, timedelta, UTC
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+"""
+Start of Unix time; tokens count microseconds from it.
+"""
+
+from app.config.config import settings
+
+
+class InvalidSyncToken(ValueError):
+    """
+    Raised when a sync token cannot be decoded.
+    """
+
+
+def encode_sync_token(moment: datetime) -> str:
+    """
+    Encode a point in time as an opaque sync token.
+
+    Args:
+        moment (datetime): The point in time.
+
+    Returns:
+        str: The sync token.
+    """
+    micros = (moment - EPOCH) // timedelta(microseconds=1)
+    return base64.urlsafe_b64encode(str(micros).encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    """
+    Decode a sync token.
+
+    Args:
+        token (str): The sync token.
+
+    Returns:
+        datetime: The point in time, in UTC.
+
+    Raises:
+        InvalidSyncToken: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        micros = int(base64.urlsafe_b64decode(padded.encode()).decode())
+        return EPOCH + timedelta(microseconds=micros)
+    except (ValueError, UnicodeDecodeError, OverflowError, OSError) as e:
+        raise InvalidSyncToken(f"Invalid sync token: {token!r}") from e
+
+
+def next_sync_token(started_at: datetime) -> str:
+    """
+    Get the token to hand out after a sync that started at ``started_at``.
+
+    The token points ``CONTACTS_SYNC_OVERLAP_SECONDS`` before the query, so a
+    write committed after the query but stamped before it is not missed.
+
+    Args:
+        started_at (datetime): When the sync query started.
+
+    Returns:
+        str: The sync token.
+    """
+    return encode_sync_token(
+        started_at - timedelta(seconds=settings.CONTACTS_SYNC_OVERLAP_SECONDS)
+    )
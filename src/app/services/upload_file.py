@@ -1,10 +1,8 @@
-import cloudinary
-import cloudinary.uploader
-
-
 class UploadFileService:
     """
     Service class for uploading files to Cloudinary.
+
+    The Cloudinary SDK is imported on first use.
     """
 
     def __init__(self, cloud_name, api_key, api_secret):
@@ -19,6 +17,8 @@ class UploadFileService:
         self.cloud_name = cloud_name
         self.api_key = api_key
         self.api_secret = api_secret
+        import cloudinary
+
         cloudinary.config(
             cloud_name=self.cloud_name,
             api_key=self.api_key,
@@ -38,6 +38,9 @@ class UploadFileService:
         Returns:
             str: The URL of the uploaded image.
         """
+        import cloudinary
+        import cloudinary.uploader
+
         public_id = f"py_avatar/{username}"
         r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
         src_url = cloudinary.CloudinaryImage(public_id).build_url(
@@ -1,7 +1,24 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models import User
 from app.response.schemas import UserCreate, UserUpdate
-from sqlalchemy import select
+from sqlalchemy import select, delete, bindparam
+
+from app.database.models import Contact
+
+USER_BY_ID = select(User).where(User.id == bindparam("value"))
+"""
+A user by ID, prebuilt so lookups only bind a value.
+"""
+
+USER_BY_NAME = select(User).where(User.name == bindparam("value"))
+"""
+A user by username.
+"""
+
+USER_BY_EMAIL = select(User).where(User.email == bindparam("value"))
+"""
+A user by email.
+"""
 
 
 class UserService:
@@ -28,8 +45,7 @@ class UserService:
         Returns:
             User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(USER_BY_ID, {"value": user_id})
         return user.scalar()
 
     async def get_user_by_username(self, username: str) -> User | None:
@@ -42,8 +58,7 @@ class UserService:
         Returns:
             User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(name=username)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(USER_BY_NAME, {"value": username})
         return user.scalar()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -56,8 +71,7 @@ class UserService:
         Returns:
             User | None: The user if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(USER_BY_EMAIL, {"value": email})
         return user.scalar()
 
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
@@ -74,13 +88,16 @@ class UserService:
         user = User(**body.model_dump(exclude_unset=True), avatar=avatar)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def delete_user(self, user_id: int):
         """
         Delete a user by their ID.
 
+        The contacts are removed by the database through ``ON DELETE CASCADE``
+        in the same statement, without being loaded. For users with many
+        contacts, call ``delete_contacts_in_chunks`` first to keep locks short.
+
         Args:
             user_id (int): The ID of the user.
         """
@@ -91,6 +108,32 @@ class UserService:
             await self.db.commit()
         return user
 
+    async def delete_contacts_in_chunks(self, user_id: int, chunk_size: int) -> int:
+        """
+        Delete all contacts of a user, ``chunk_size`` rows per transaction.
+
+        Args:
+            user_id (int): The ID of the user.
+            chunk_size (int): The number of contacts deleted per transaction.
+
+        Returns:
+            int: The number of deleted contacts.
+        """
+        chunk = (
+            select(Contact.id)
+            .where(Contact.user_id == user_id)
+            .limit(chunk_size)
+            .scalar_subquery()
+        )
+        stmt = delete(Contact).where(Contact.id.in_(chunk))
+        deleted = 0
+        while True:
+            result = await self.db.execute(stmt)
+            await self.db.commit()
+            deleted += result.rowcount
+            if result.rowcount < chunk_size:
+                return deleted
+
     async def confirm_email(self, email: str):
         """
         Confirm a user's email.
@@ -101,7 +144,6 @@ class UserService:
         user = await self.get_user_by_email(email)
         user.confirmed = True
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def update_user(self, user_id: int, updated_user: UserUpdate) -> User:
@@ -120,5 +162,4 @@ class UserService:
             if value is not None:
                 setattr(user, var, value)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
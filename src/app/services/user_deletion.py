@@ -0,0 +1,31 @@
+import logging
+
+from app.config.config import settings
+from app.database.db import DatabaseSessionManager, sessionmanager
+from app.services.user import UserService
+
+
+async def delete_user_in_background(
+    user_id: int, manager: DatabaseSessionManager = sessionmanager
+):
+    """
+    Delete a user and their contacts in chunks, outside the request.
+
+    Contacts are deleted ``USER_DELETE_CHUNK_SIZE`` rows per transaction so
+    that no single transaction locks a large account's rows for long; the user
+    row, and with it the remaining dependent rows, goes last.
+
+    Args:
+        user_id (int): The ID of the user.
+        manager (DatabaseSessionManager): The session manager to use.
+    """
+    try:
+        async with manager.session() as session:
+            service = UserService(session)
+            deleted = await service.delete_contacts_in_chunks(
+                user_id, settings.USER_DELETE_CHUNK_SIZE
+            )
+            await service.delete_user(user_id)
+        logging.info(f"Deleted user {user_id} and {deleted} contacts")
+    except Exception as e:
+        logging.error(f"Failed to delete user {user_id}: {e}")
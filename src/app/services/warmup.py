@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.config.config import settings
+from app.database.db import DatabaseSessionManager
+from app.services.auth import Hash
+from app.services.contacts import ContactsService
+from app.services.user import UserService
+
+WARMUP_PASSWORD_HASH = "$2b$12$h/jtbmUPxXBcjADWtK8kweAO7.YAL4mC.RJT/i1W0jz8ufD4jvBmm"
+"""
+Bcrypt hash verified once at startup to load the hashing backend.
+"""
+
+
+async def _open_db_connections(manager: DatabaseSessionManager, count: int):
+    """
+    Open ``count`` pooled connections at the same time so the pool keeps them.
+
+    ``count`` is capped at the pool size: connections above it are overflow and
+    would be closed on return, and asking for more than the pool can hand out
+    would block until the pool timeout.
+    """
+    count = min(count, settings.DB_POOL_SIZE)
+
+    async def ping():
+        async with manager.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(count)))
+
+
+async def _open_redis_connections(redis, count: int):
+    """
+    Open ``count`` pooled Redis connections at the same time.
+    """
+    await asyncio.gather(*(redis.ping() for _ in range(count)))
+
+
+async def _compile_statements(manager: DatabaseSessionManager):
+    """
+    Run every hot statement once so its compiled form is cached by the engine.
+
+    IDs that never exist are used, so no rows are read or written.
+    """
+    async with manager.session() as session:
+        users = UserService(session)
+        await users.get_user_by_id(0)
+        await users.get_user_by_username("")
+        await users.get_user_by_email("")
+
+        contacts = ContactsService(session)
+        await contacts.get_contacts(0)
+        await contacts.get_by_id(0, 0)
+        await contacts.search_contacts(0, name="-", surname="-", email="-")
+        for field in ("name", "surname", "email"):
+            await contacts.search_contacts(0, **{field: "-"})
+        await contacts.get_upcoming_birthdays(0)
+        await session.rollback()
+
+
+def _prime_libraries():
+    """
+    Load the bcrypt backend and build the mail configuration.
+    """
+    from app.services.email import get_connection_config
+
+    Hash().verify_password("warm-up", WARMUP_PASSWORD_HASH)
+    get_connection_config()
+
+
+async def warm_up(manager: DatabaseSessionManager, redis) -> dict[str, float]:
+    """
+    Warm up connection pools, statement caches and libraries.
+
+    Args:
+        manager (DatabaseSessionManager): The database session manager.
+        redis: The Redis client.
+
+    Returns:
+        dict[str, float]: The duration of each warm-up step in seconds.
+    """
+    steps = {
+        "db_connections": lambda: _open_db_connections(
+            manager, settings.WARMUP_DB_CONNECTIONS
+        ),
+        "redis_connections": lambda: _open_redis_connections(
+            redis, settings.WARMUP_REDIS_CONNECTIONS
+        ),
+        "statements": lambda: _compile_statements(manager),
+        "libraries": lambda: asyncio.to_thread(_prime_libraries),
+    }
+    timings = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        await step()
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+async def warm_up_until_ready(app, manager: DatabaseSessionManager, redis):
+    """
+    Run the warm-up, retrying until it succeeds, then mark the app as ready.
+
+    Args:
+        app (FastAPI): The application; ``app.state.ready`` is set when done.
+        manager (DatabaseSessionManager): The database session manager.
+        redis: The Redis client.
+    """
+    delay = 0.5
+    while True:
+        try:
+            timings = await warm_up(manager, redis)
+        except Exception as e:
+            logging.warning(f"Warm-up failed, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 10)
+            continue
+        logging.info(
+            "Warm-up complete: "
+            + ", ".join(f"{name} {elapsed * 1000:.0f} ms" for name, elapsed in timings.items())
+        )
+        app.state.ready = True
+        return
@@ -0,0 +1,15 @@
+LAZY_MODULES = [
+    "asyncpg",
+    "aiosqlite",
+    "cloudinary",
+    "fastapi_mail",
+    "jose",
+    "passlib",
+    "redis",
+    "uvicorn",
+]
+"""
+Integrations that must not be imported by ``import app.main``.
+
+They are imported on first use instead, so that worker start-up stays cheap.
+"""
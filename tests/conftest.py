@@ -11,7 +11,8 @@ import redis.asyncio as aioredis
 
 from app.config.config import settings
 from app.database.models import Base, User
-from app.database.db import get_db
+from app.database.db import enable_sqlite_foreign_keys, get_db
+from app.database.instrumentation import instrument_engine
 from app.services.auth import Hash
 from app.services.user import UserService
 from app.services.contacts import ContactsService
@@ -21,6 +22,8 @@ from app.main import app
 DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+instrument_engine(engine)
+enable_sqlite_foreign_keys(engine)
 TestingSessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
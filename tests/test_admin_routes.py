@@ -0,0 +1,28 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.main import app
+from app.response.schemas import User
+from app.services.current_user import get_current_user
+
+
+@pytest.fixture
+def admin():
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, name="admin", email="admin@example.com", avatar=None, role="ADMIN"
+    )
+    yield
+    del app.dependency_overrides[get_current_user]
+
+
+@pytest.mark.asyncio
+async def test_delete_user_is_scheduled(client, admin, monkeypatch):
+    job = AsyncMock()
+    monkeypatch.setattr("app.routes.admin.delete_user_in_background", job)
+
+    response = await client.delete("/api/admin/users/1")
+    assert response.status_code == 202
+    job.assert_awaited_once_with(1)
+
+    response = await client.delete("/api/admin/users/999999")
+    assert response.status_code == 404
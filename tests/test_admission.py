@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.middleware.admission import (
+    AdmissionControlMiddleware,
+    AdmissionLimiter,
+    route_group,
+)
+
+
+def test_route_groups():
+    assert route_group("GET", "/api/contacts/search") == "search"
+    assert route_group("POST", "/api/auth/register") == "auth"
+    assert route_group("PATCH", "/api/users/reset") == "auth"
+    assert route_group("GET", "/api/contacts/12") == "default"
+    assert route_group("GET", "/api/contacts/stream") is None
+    assert route_group("GET", "/health/ready") is None
+
+
+def make_client(limiter, release: asyncio.Event):
+    test_app = FastAPI()
+
+    @test_app.get("/api/contacts/search")
+    async def search():
+        await release.wait()
+        return {"ok": True}
+
+    test_app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters={"search": limiter},
+        queue_timeout=1.0,
+        retry_after=3,
+    )
+    return AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_shed_with_retry_after():
+    release = asyncio.Event()
+    limiter = AdmissionLimiter("search", limit=1, queue_size=1)
+    async with make_client(limiter, release) as client:
+        running = asyncio.create_task(client.get("/api/contacts/search"))
+        queued = asyncio.create_task(client.get("/api/contacts/search"))
+        await asyncio.sleep(0.05)
+        assert (limiter.in_flight, len(limiter._waiters)) == (1, 1)
+
+        response = await client.get("/api/contacts/search")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+
+        release.set()
+        assert [(await running).status_code, (await queued).status_code] == [200, 200]
+    assert (limiter.in_flight, len(limiter._waiters)) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout():
+    limiter = AdmissionLimiter("search", limit=1, queue_size=1)
+    assert await limiter.acquire(0.01) is None
+    assert await limiter.acquire(0.01) == "timeout"
+    assert not limiter._waiters
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = AdmissionLimiter("search", limit=1, queue_size=1)
+    await limiter.acquire(1)
+    waiting = asyncio.create_task(limiter.acquire(1))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    limiter.release()
+    assert (limiter.in_flight, len(limiter._waiters)) == (0, 0)
+
+
+def test_aimd_limit():
+    limiter = AdmissionLimiter("search", limit=4, queue_size=0, latency_target=0.1, backoff=0.5)
+    limiter.in_flight = 3
+    limiter.release(latency=1.0)
+    limiter.release(latency=1.0)
+    limiter.release(latency=1.0)
+    assert limiter.limit == 1
+
+    for _ in range(20):
+        limiter.in_flight = 1
+        limiter.release(latency=0.01)
+    assert limiter.limit == 4
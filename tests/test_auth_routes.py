@@ -29,6 +29,14 @@ async def test_register_user(client):
     response = await client.post("/api/auth/register", json=new_user)
     assert response.status_code == 409
 
+@pytest.mark.asyncio
+async def test_register_user_cannot_assign_admin(client):
+    response = await client.post(
+        "/api/auth/register",
+        json={"name": "mallory", "email": "mallory@example.com", "password": "pass", "role": "admin"},
+    )
+    assert response.status_code == 403
+
 @pytest.mark.asyncio
 async def test_confirm_email(client):
 
@@ -0,0 +1,112 @@
+import gzip
+import zlib
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from httpx import AsyncClient, ASGITransport
+
+from app.middleware.compression import (
+    CompressionMiddleware,
+    PrecompressedResponse,
+    negotiate,
+    precompress,
+)
+
+BIG = [{"id": i, "name": "contact", "email": f"c{i}@example.com"} for i in range(100)]
+
+
+def make_client():
+    test_app = FastAPI()
+
+    @test_app.get("/big")
+    async def big():
+        return BIG
+
+    @test_app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @test_app.get("/image")
+    async def image():
+        return Response(b"x" * 4096, media_type="image/png")
+
+    variants = precompress(b"[" + b'{"cached": true},' * 200 + b"{}]")
+
+    @test_app.get("/cached")
+    async def cached(request: Request):
+        return PrecompressedResponse(variants, request.headers.get("accept-encoding", ""))
+
+    test_app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test")
+
+
+def test_negotiate():
+    assert negotiate("gzip, deflate, br", ["br", "zstd", "gzip"]) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert negotiate("identity", ["br", "gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_compressed():
+    async with make_client() as client:
+        response = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == BIG
+
+
+@pytest.mark.asyncio
+async def test_small_and_binary_bodies_are_not_compressed():
+    async with make_client() as client:
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        image = await client.get("/image", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/big", headers={"Accept-Encoding": "identity"})
+    for response in (small, image, plain):
+        assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_stream_is_compressed_per_chunk():
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream")],
+        })
+        for i in range(3):
+            await send({"type": "http.response.body", "body": f"data: {i}\n\n".encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    await CompressionMiddleware(app, minimum_size=500)(scope, None, send)
+
+    assert dict(sent[0]["headers"])[b"content-encoding"] == b"gzip"
+    decompressor = zlib.decompressobj(31)
+    chunks = [decompressor.decompress(message["body"]) for message in sent[1:]]
+    # Every chunk decodes on its own, so events are not held back.
+    assert chunks[:3] == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n"]
+    assert decompressor.eof
+
+
+@pytest.mark.asyncio
+async def test_precompressed_variant_is_served_as_is():
+    async with make_client() as client:
+        response = await client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/cached", headers={"Accept-Encoding": "identity"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == plain.json()
+    assert "content-encoding" not in plain.headers
+
+
+def test_precompress_uses_static_level():
+    body = b"contact " * 1000
+    variants = precompress(body)
+    assert gzip.decompress(variants["gzip"]) == body
+    assert precompress(b"tiny", minimum_size=100) == {"identity": b"tiny"}
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from datetime import date
+
+import pytest
+
+from app.services.contact_index import ContactIndex, ContactIndexCache
+from app.services.events import WORKER_ID
+
+ROWS = [
+    (1, "Olena", "Koval", "olena@example.com", "+380501234567", date(1990, 5, 17)),
+    (2, "Oleh", "Bondar", "oleh@work.org", None, date(1985, 12, 30)),
+    (3, "Taras", "Olenko", "taras@example.com", "+380671112233", None),
+]
+
+
+def test_search_matches_substrings_case_insensitively():
+    index = ContactIndex(1, ROWS)
+    assert index.search(name="OLE") == [1, 2]
+    assert index.search(surname="olen") == [3]
+    assert index.search(name="ole", email="example") == [1]
+    assert index.search(email="@") == [1, 2, 3]
+    assert index.search(name="x") == []
+    assert index.search() == [1, 2, 3]
+
+
+def test_upcoming_birthdays_wrap_around_the_year():
+    index = ContactIndex(1, ROWS)
+    assert index.upcoming_birthdays(date(2024, 5, 12)) == [1]
+    assert index.upcoming_birthdays(date(2024, 5, 17), days=0) == []
+    assert index.upcoming_birthdays(date(2024, 12, 28)) == [2]
+    assert index.upcoming_birthdays(date(2025, 1, 1)) == []
+    assert index.upcoming_birthdays(date(2025, 1, 1), days=365) == [1, 2]
+
+
+def test_upsert_and_remove_keep_columns_aligned():
+    index = ContactIndex(1, ROWS)
+    size = index.nbytes
+    index.upsert(2, "Oleh", "Bondarenko", "oleh@work.org", None, date(1985, 6, 1))
+    assert index.search(surname="bondarenko") == [2]
+    assert index.nbytes > size
+
+    index.remove(1)
+    assert len(index) == 2
+    assert index.search(name="ole") == [2]
+    contact = index.contact(3)
+    assert (contact.name, contact.phone, contact.birthdate) == ("Taras", "+380671112233", None)
+    assert index.contact(2).phone is None
+
+    index.remove(2)
+    index.remove(3)
+    assert len(index) == 0 and index.nbytes == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_once_and_skips_small_users():
+    cache = ContactIndexCache(max_bytes=10**6, min_contacts=3, ttl=60)
+    loads = 0
+
+    async def count():
+        return len(ROWS)
+
+    async def rows():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0)
+        return ROWS
+
+    first, second = await asyncio.gather(cache.load(1, count, rows), cache.load(1, count, rows))
+    assert first is second and loads == 1
+    assert cache.nbytes == first.nbytes
+
+    async def few():
+        return 2
+
+    assert await cache.load(2, few, rows) is None
+    assert loads == 1
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_by_size():
+    size = ContactIndex(1, ROWS).nbytes
+    cache = ContactIndexCache(max_bytes=2 * size, min_contacts=1, ttl=60)
+    for user_id in (1, 2):
+        cache._put(ContactIndex(user_id, ROWS))
+    cache.get(1)
+    cache._put(ContactIndex(3, ROWS))
+    assert cache.get(2) is None
+    assert cache.get(1) is not None and cache.get(3) is not None
+    assert cache.nbytes == 2 * size
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_applies_local_writes_and_drops_on_remote_events():
+    cache = ContactIndexCache(max_bytes=10**6, min_contacts=1, ttl=60)
+    started = time.monotonic()
+    cache.apply(1, 4)
+    # Rows read before a write must not be cached after it.
+    cache._put(ContactIndex(1, ROWS, built_at=started))
+    assert cache.get(1) is None
+
+    cache._put(ContactIndex(1, ROWS))
+    cache.apply(1, 1)
+    assert cache.get(1).search(name="olena") == []
+
+    cache.handle_event({"user_id": 1, "type": "deleted", "id": 2}, WORKER_ID)
+    assert cache.get(1) is not None
+    cache.handle_event({"user_id": 1, "type": "deleted", "id": 2}, "other")
+    assert cache.get(1) is None
+    assert cache.nbytes == 0
+    cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_expired_index_is_dropped():
+    cache = ContactIndexCache(max_bytes=10**6, min_contacts=1, ttl=60)
+    cache._put(ContactIndex(1, ROWS, built_at=time.monotonic() - 61))
+    assert cache.get(1) is None
+    cache.clear()
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+from app.database.instrumentation import query_budget, track_queries
 
 @pytest.mark.asyncio
 async def test_create_contact(client, auth_headers):
@@ -73,4 +74,320 @@ async def test_upcoming_birthdays(client, auth_headers):
     await asyncio.sleep(0) 
     response = await client.get("/api/contacts/upcoming-birthdays", headers=auth_headers)
     assert response.status_code == 200
-    assert isinstance(response.json()["contacts"], list)
\ No newline at end of file
+    assert isinstance(response.json()["contacts"], list)
+
+@pytest.mark.asyncio
+async def test_read_contacts_query_budget(client, auth_headers):
+    with query_budget(2):
+        response = await client.get("/api/contacts/", headers=auth_headers)
+    assert response.status_code == 200
+
+async def create_contacts(client, auth_headers, count):
+    ids = []
+    for i in range(count):
+        response = await client.post(
+            "/api/contacts/",
+            json={
+                "name": f"Batch{i}",
+                "surname": "Doe",
+                "email": f"batch{i}@example.com",
+                "phone": "1234567890",
+                "birthdate": "1990-01-01",
+            },
+            headers=auth_headers,
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+@pytest.mark.asyncio
+async def test_read_contacts_by_ids(client, auth_headers):
+    first, second = await create_contacts(client, auth_headers, 2)
+
+    with query_budget(2):
+        response = await client.get(
+            f"/api/contacts/?ids={second},999999,{first}", headers=auth_headers
+        )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(item["id"], item["status"]) for item in results] == [
+        (second, "ok"), (999999, "not_found"), (first, "ok")
+    ]
+    assert results[0]["contact"]["name"] == "Batch1"
+    assert results[1]["contact"] is None
+
+    response = await client.get("/api/contacts/?ids=1,x", headers=auth_headers)
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_update_contacts_batch(client, auth_headers):
+    first, second = await create_contacts(client, auth_headers, 2)
+
+    response = await client.patch(
+        "/api/contacts/batch",
+        json={"contacts": [
+            {"id": first, "notes": "first"},
+            {"id": second, "surname": "Roe"},
+            {"id": 999999, "notes": "missing"},
+        ]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["status"] for item in results] == ["ok", "ok", "not_found"]
+    assert results[0]["contact"]["notes"] == "first"
+    assert results[1]["contact"]["surname"] == "Roe"
+
+@pytest.mark.asyncio
+async def test_delete_contacts_batch(client, auth_headers):
+    first, second = await create_contacts(client, auth_headers, 2)
+
+    response = await client.delete(
+        f"/api/contacts/batch?ids={first},{second},999999", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["results"]] == ["ok", "ok", "not_found"]
+
+    response = await client.get(f"/api/contacts/{first}", headers=auth_headers)
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_batch_size_limit(client, auth_headers, monkeypatch):
+    monkeypatch.setattr("app.routes.contacts.settings.CONTACTS_BATCH_LIMIT", 2)
+    response = await client.delete("/api/contacts/batch?ids=1,2,3", headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_contact_changes(client, auth_headers, monkeypatch):
+    monkeypatch.setattr("app.services.sync.settings.CONTACTS_SYNC_OVERLAP_SECONDS", 0)
+    first, second = await create_contacts(client, auth_headers, 2)
+
+    response = await client.get("/api/contacts/changes", headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert {first, second} <= {contact["id"] for contact in body["changed"]}
+    token = body["next_token"]
+
+    await client.put(f"/api/contacts/{first}", json={"notes": "changed"}, headers=auth_headers)
+    await client.delete(f"/api/contacts/{second}", headers=auth_headers)
+
+    with query_budget(2):
+        response = await client.get(f"/api/contacts/changes?since={token}", headers=auth_headers)
+    body = response.json()
+    assert [contact["id"] for contact in body["changed"]] == [first]
+    assert body["changed"][0]["notes"] == "changed"
+    assert body["deleted"] == [second]
+
+    response = await client.get(
+        f"/api/contacts/changes?since={body['next_token']}", headers=auth_headers
+    )
+    assert response.json()["changed"] == []
+    assert response.json()["deleted"] == []
+
+    response = await client.get("/api/contacts/changes?since=not-a-token", headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_contacts_total_and_facets(client, auth_headers):
+    response = await client.get("/api/contacts/?total=true&facets=birth_month", headers=auth_headers)
+    before = response.json()
+    await create_contacts(client, auth_headers, 2)
+
+    with query_budget(2):
+        response = await client.get(
+            "/api/contacts/?limit=1&total=true&facets=birth_month,email_domain",
+            headers=auth_headers,
+        )
+    body = response.json()
+    assert len(body["contacts"]) == 1
+    assert body["total"] == before["total"] + 2
+    assert body["facets"]["birth_month"]["01"] == before["facets"]["birth_month"].get("01", 0) + 2
+    assert body["facets"]["email_domain"]["example.com"] >= 2
+
+    response = await client.get("/api/contacts/", headers=auth_headers)
+    assert response.json()["total"] is None
+
+    response = await client.get("/api/contacts/?facets=colour", headers=auth_headers)
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_counters_follow_updates_and_deletes(client, auth_headers):
+    first, second = await create_contacts(client, auth_headers, 2)
+    response = await client.get("/api/contacts/?total=true&facets=birth_month", headers=auth_headers)
+    before = response.json()
+
+    await client.put(f"/api/contacts/{first}", json={"birthdate": "1990-05-17"}, headers=auth_headers)
+    await client.delete(f"/api/contacts/batch?ids={second}", headers=auth_headers)
+
+    response = await client.get("/api/contacts/?total=true&facets=birth_month", headers=auth_headers)
+    after = response.json()
+    assert after["total"] == before["total"] - 1
+    assert after["facets"]["birth_month"].get("01", 0) == before["facets"]["birth_month"]["01"] - 2
+    assert after["facets"]["birth_month"]["05"] == before["facets"]["birth_month"].get("05", 0) + 1
+
+@pytest.mark.asyncio
+async def test_search_total_and_facets(client, auth_headers):
+    await create_contacts(client, auth_headers, 1)
+    response = await client.get(
+        "/api/contacts/search?name=Batch&total=true&facets=email_domain", headers=auth_headers
+    )
+    body = response.json()
+    assert body["total"] == len(body["contacts"])
+    assert body["facets"]["email_domain"]["example.com"] == body["total"]
+
+@pytest.mark.asyncio
+async def test_sparse_fieldsets(client, auth_headers):
+    await create_contacts(client, auth_headers, 1)
+    with track_queries() as log:
+        response = await client.get("/api/contacts/?fields=name,phone", headers=auth_headers)
+    assert response.status_code == 200
+    assert set(response.json()["contacts"][0]) == {"id", "name", "phone"}
+    select = next(statement for statement in log.statements if "FROM contacts" in statement)
+    assert "contacts.phone" in select
+    assert "contacts.notes" not in select and "contacts.email" not in select
+
+    response = await client.get(
+        "/api/contacts/search?name=Batch&fields=name&facets=email_domain", headers=auth_headers
+    )
+    body = response.json()
+    assert set(body["contacts"][0]) == {"id", "name"}
+    assert body["facets"]["email_domain"]["example.com"] == len(body["contacts"])
+
+    response = await client.get("/api/contacts/upcoming-birthdays?fields=birthdate", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await client.get("/api/contacts/?fields=password", headers=auth_headers)
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_notes_deferred_but_returned_in_full(client, auth_headers):
+    response = await client.post(
+        "/api/contacts/",
+        json={"name": "Noted", "surname": "Doe", "email": "noted@example.com",
+              "phone": "1", "birthdate": "1990-01-01", "notes": "long text"},
+        headers=auth_headers,
+    )
+    contact_id = response.json()["id"]
+    response = await client.get(f"/api/contacts/{contact_id}", headers=auth_headers)
+    assert response.json()["notes"] == "long text"
+    response = await client.get("/api/contacts/search?name=Noted", headers=auth_headers)
+    assert response.json()["contacts"][0]["notes"] == "long text"
+
+@pytest.mark.asyncio
+async def test_suggest_from_database_and_index(client, auth_headers):
+    from app.services.suggest import suggest_indexes
+
+    suggest_indexes.clear()
+    await create_contacts(client, auth_headers, 3)
+    response = await client.get("/api/contacts/suggest?prefix=batch&limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    from_database = response.json()["contacts"]
+    assert len(from_database) == 2
+    assert set(from_database[0]) == {"id", "name", "surname", "email"}
+    assert all(contact["name"].lower().startswith("batch") for contact in from_database)
+
+    for _ in range(3):
+        response = await client.get("/api/contacts/suggest?prefix=batch&limit=2", headers=auth_headers)
+    assert suggest_indexes._indexes
+    with track_queries() as log:
+        response = await client.get("/api/contacts/suggest?prefix=batch&limit=2", headers=auth_headers)
+    assert response.json()["contacts"] == from_database
+    assert not any("FROM contacts" in statement for statement in log.statements)
+
+    await create_contacts(client, auth_headers, 1)
+    assert not suggest_indexes._indexes
+
+    response = await client.get("/api/contacts/suggest?prefix=%25", headers=auth_headers)
+    assert response.json()["contacts"] == []
+    response = await client.get("/api/contacts/suggest?prefix=", headers=auth_headers)
+    assert response.status_code == 422
+    suggest_indexes.clear()
+
+@pytest.mark.asyncio
+async def test_search_and_birthdays_from_contact_index(client, auth_headers, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from app.config.config import settings
+    from app.services.contact_index import contact_indexes
+
+    monkeypatch.setattr(settings, "CONTACTS_INDEX_ENABLED", True)
+    monkeypatch.setattr(contact_indexes, "min_contacts", 1)
+    contact_indexes.clear()
+    birthday = datetime.now(timezone.utc).date() + timedelta(days=2)
+    response = await client.post(
+        "/api/contacts/",
+        json={
+            "name": "Indexed",
+            "surname": "Power",
+            "email": "indexed@example.com",
+            "phone": "1234567890",
+            "birthdate": f"1990-{birthday.month:02d}-{birthday.day:02d}",
+            "notes": "kept in the database",
+        },
+        headers=auth_headers,
+    )
+    contact_id = response.json()["id"]
+
+    response = await client.get("/api/contacts/search?name=indexed", headers=auth_headers)
+    assert [contact["id"] for contact in response.json()["contacts"]] == [contact_id]
+    assert response.json()["contacts"][0]["notes"] == "kept in the database"
+    assert contact_indexes._indexes
+
+    with track_queries() as log:
+        response = await client.get(
+            "/api/contacts/search?name=INDEX&fields=name,phone", headers=auth_headers
+        )
+        birthdays = await client.get(
+            "/api/contacts/upcoming-birthdays?fields=name", headers=auth_headers
+        )
+    assert response.json()["contacts"] == [
+        {"id": contact_id, "name": "Indexed", "phone": "1234567890"}
+    ]
+    assert contact_id in [contact["id"] for contact in birthdays.json()["contacts"]]
+    assert not any("FROM contacts" in statement for statement in log.statements)
+
+    await client.put(
+        f"/api/contacts/{contact_id}", json={"name": "Renamed"}, headers=auth_headers
+    )
+    response = await client.get("/api/contacts/search?name=indexed&fields=name", headers=auth_headers)
+    assert response.json()["contacts"] == []
+    await client.delete(f"/api/contacts/{contact_id}", headers=auth_headers)
+    response = await client.get("/api/contacts/search?name=renamed&fields=name", headers=auth_headers)
+    assert response.json()["contacts"] == []
+    contact_indexes.clear()
+
+@pytest.mark.asyncio
+async def test_lookup_by_normalized_phone_and_email(client, auth_headers):
+    response = await client.post(
+        "/api/contacts/",
+        json={
+            "name": "Caller",
+            "surname": "Id",
+            "email": "Caller.Id@Example.com",
+            "phone": "+1 (555) 010-9999",
+            "birthdate": "1990-01-01",
+        },
+        headers=auth_headers,
+    )
+    contact_id = response.json()["id"]
+
+    with track_queries() as log:
+        response = await client.get("/api/contacts/lookup?phone=%2B15550109999", headers=auth_headers)
+    assert [contact["id"] for contact in response.json()["contacts"]] == [contact_id]
+    assert any("phone_normalized" in statement for statement in log.statements)
+
+    response = await client.get(
+        "/api/contacts/lookup?email=caller.id@EXAMPLE.com&fields=name", headers=auth_headers
+    )
+    assert response.json()["contacts"] == [{"id": contact_id, "name": "Caller"}]
+
+    await client.put(
+        f"/api/contacts/{contact_id}", json={"phone": "555 010 0000"}, headers=auth_headers
+    )
+    response = await client.get("/api/contacts/lookup?phone=555-010-9999", headers=auth_headers)
+    assert response.json()["contacts"] == []
+    response = await client.get("/api/contacts/lookup?phone=5550100000", headers=auth_headers)
+    assert [contact["id"] for contact in response.json()["contacts"]] == [contact_id]
+
+    response = await client.get("/api/contacts/lookup?phone=n/a", headers=auth_headers)
+    assert response.json()["contacts"] == []
+    response = await client.get("/api/contacts/lookup", headers=auth_headers)
+    assert response.status_code == 422
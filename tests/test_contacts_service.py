@@ -20,9 +20,11 @@ async def test_create_contact(contacts_service, mock_db_session):
 
     assert contact.name == "John"
     assert contact.email == "john.doe@example.com"
+    assert contact.phone_normalized == "+1234567890"
+    assert contact.email_normalized == "john.doe@example.com"
     mock_db_session.add.assert_called_once()
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once()
+    mock_db_session.refresh.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_get_contacts():
@@ -53,15 +55,17 @@ async def test_update_contact(contacts_service, mock_db_session):
     mock_scalars = MagicMock()
     mock_scalars.all.return_value = mock_contact
     mock_result.scalars.return_value = mock_scalars
+    mock_result.scalar_one_or_none.return_value = mock_contact
     mock_db_session.execute.return_value = mock_result
 
-    updated_data = ContactUpdate(name="Johnny", email="johnny.doe@example.com")
+    updated_data = ContactUpdate(name="Johnny", email="Johnny.Doe@Example.com")
     contact = await contacts_service.update_contact(user_id=1, id=1, contact=updated_data)
 
     assert contact.name == "Johnny"
-    assert contact.email == "johnny.doe@example.com"
+    assert contact.email == "Johnny.Doe@Example.com"
+    assert contact.email_normalized == "johnny.doe@example.com"
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once()
+    mock_db_session.refresh.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_delete_contact(contacts_service, mock_db_session):
@@ -107,4 +111,14 @@ async def test_get_upcoming_birthdays(contacts_service, mock_db_session):
 
     assert len(contacts) == 1
     assert contacts[0].name == "John"
-    mock_db_session.execute.assert_called_once()
\ No newline at end of file
+    mock_db_session.execute.assert_called_once()
+@pytest.mark.asyncio
+async def test_search_contacts_reuses_prebuilt_statement(contacts_service, mock_db_session):
+    mock_db_session.execute.return_value = MagicMock()
+    await contacts_service.search_contacts(user_id=1, name="jo")
+    await contacts_service.search_contacts(user_id=2, name="ja")
+
+    first, second = mock_db_session.execute.call_args_list
+    assert first.args[0] is second.args[0]
+    assert first.args[1] == {"user_id": 1, "name": "%jo%"}
+    assert second.args[1] == {"user_id": 2, "name": "%ja%"}
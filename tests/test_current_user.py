@@ -20,7 +20,7 @@ async def test_get_current_user_valid_token(mock_db_session, token):
 
     with patch("app.services.current_user.redis_client.get", new_callable=AsyncMock, return_value=None), \
          patch("app.services.current_user.redis_client.setex", new_callable=AsyncMock, return_value=True), \
-         patch("app.services.current_user.jwt.decode", return_value={"name": "testuser"}), \
+         patch("jose.jwt.decode", return_value={"name": "testuser"}), \
          patch("app.services.current_user.UserService") as MockUserService:
 
         mock_user_service_instance = MockUserService.return_value
@@ -35,7 +35,7 @@ async def test_get_current_user_valid_token(mock_db_session, token):
 @pytest.mark.asyncio
 async def test_get_current_user_invalid_token(mock_db_session):
     with patch('app.services.current_user.redis_client.get', new_callable=AsyncMock, return_value=None), \
-         patch('app.services.current_user.jwt.decode', side_effect=HTTPException(status_code=401)):
+         patch('jose.jwt.decode', side_effect=HTTPException(status_code=401)):
         
         with pytest.raises(HTTPException):
             await get_current_user("invalid_token", mock_db_session)
@@ -47,7 +47,7 @@ async def test_get_current_user_user_not_found(mock_db_session, token):
     valid_token = token(name="nonexistentuser")
 
     with patch("app.services.current_user.redis_client.get", new_callable=AsyncMock, return_value=None), \
-         patch("app.services.current_user.jwt.decode", return_value={"name": "nonexistentuser"}), \
+         patch("jose.jwt.decode", return_value={"name": "nonexistentuser"}), \
          patch("app.services.current_user.UserService") as MockUserService:
 
         mock_user_service_instance = MockUserService.return_value
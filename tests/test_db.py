@@ -0,0 +1,201 @@
+import json
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.config.config import settings
+from app.database.db import DatabaseSessionManager
+from app.database.instrumentation import track_queries
+from app.database.models import Base
+from app.response.schemas import ContactCreate, ContactUpdate, UserCreate, UserUpdate
+from app.services.contacts import ContactsService
+from app.services.user import UserService
+from app.services.user_deletion import delete_user_in_background
+
+
+@pytest_asyncio.fixture
+async def manager(tmp_path):
+    manager = DatabaseSessionManager(f"sqlite+aiosqlite:///{tmp_path}/db.db")
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_session_after_close_recreates_engine(manager):
+    async with manager.session() as session:
+        await session.execute(text("SELECT 1"))
+    await manager.close()
+
+    async with manager.session() as session:
+        result = await session.execute(text("SELECT 1"))
+        assert result.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_user_writes_need_no_refresh(manager):
+    async with manager.session() as session:
+        service = UserService(session)
+        with track_queries() as log:
+            user = await service.create_user(
+                UserCreate(name="olena", email="olena@example.com", password="x")
+            )
+            assert (user.id, user.confirmed, user.role) == (1, False, "USER")
+        assert log.count == 1
+
+        with track_queries() as log:
+            user = await service.confirm_email("olena@example.com")
+            assert user.confirmed is True
+        assert log.count == 2
+
+        with track_queries() as log:
+            user = await service.update_user(user.id, UserUpdate(avatar="avatar.png"))
+            assert user.avatar == "avatar.png"
+        assert log.count == 2
+
+
+@pytest.mark.asyncio
+async def test_contact_writes_need_no_refresh(manager):
+    async with manager.session() as session:
+        user = await UserService(session).create_user(
+            UserCreate(name="olena", email="olena@example.com", password="x")
+        )
+        service = ContactsService(session)
+
+        with track_queries() as log:
+            contact = await service.create_contact(
+                ContactCreate(
+                    name="Taras",
+                    surname="Shevchenko",
+                    email="taras@example.com",
+                    phone="+380501234567",
+                    birthdate="1990-05-17",
+                    user_id=user.id,
+                )
+            )
+            assert contact.id == 1
+            assert contact.name == "Taras"
+        # The INSERT and the contact counters upsert.
+        assert log.count == 2
+
+        with track_queries() as log:
+            contact = await service.update_contact(
+                user.id, contact.id, ContactUpdate(notes="Poet")
+            )
+            assert contact.notes == "Poet"
+            assert contact.surname == "Shevchenko"
+        assert log.count == 2
+
+
+async def create_user_with_contacts(session, count):
+    user = await UserService(session).create_user(
+        UserCreate(name="olena", email="olena@example.com", password="x")
+    )
+    for i in range(count):
+        await ContactsService(session).create_contact(
+            ContactCreate(
+                name=f"Contact{i}",
+                surname="Shevchenko",
+                email=f"contact{i}@example.com",
+                phone="+380501234567",
+                birthdate="1990-05-17",
+                user_id=user.id,
+            )
+        )
+    return user
+
+
+@pytest.mark.asyncio
+async def test_delete_user_relies_on_database_cascade(manager):
+    async with manager.session() as session:
+        user = await create_user_with_contacts(session, 3)
+
+        with track_queries() as log:
+            await UserService(session).delete_user(user.id)
+
+        assert not any("FROM contacts" in statement for statement in log.statements)
+        remaining = await session.execute(text("SELECT count(*) FROM contacts"))
+        assert remaining.scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_user_in_background_in_chunks(manager, monkeypatch):
+    monkeypatch.setattr(settings, "USER_DELETE_CHUNK_SIZE", 2)
+    async with manager.session() as session:
+        user = await create_user_with_contacts(session, 5)
+
+    with track_queries() as log:
+        await delete_user_in_background(user.id, manager)
+
+    contact_deletes = [
+        count for statement, count in log.statements.items()
+        if statement.startswith("DELETE FROM contacts")
+    ]
+    assert contact_deletes == [3]
+    async with manager.session() as session:
+        assert await UserService(session).get_user_by_id(user.id) is None
+        remaining = await session.execute(text("SELECT count(*) FROM contact_stats"))
+        assert remaining.scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_current_user_releases_connection_after_lookup(manager, monkeypatch):
+    from unittest.mock import AsyncMock
+    from jose import jwt
+    from app.services import current_user as current_user_module
+
+    async with manager.session() as session:
+        await UserService(session).create_user(
+            UserCreate(name="olena", email="olena@example.com", password="x")
+        )
+    token = jwt.encode({"name": "olena"}, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    monkeypatch.setattr(current_user_module.redis_client, "get", AsyncMock(return_value=None))
+    monkeypatch.setattr(current_user_module.redis_client, "setex", AsyncMock())
+
+    async with manager.session() as session:
+        assert manager.engine.pool.checkedout() == 0
+        user = await current_user_module.get_current_user(token, session)
+        assert user.name == "olena"
+        assert manager.engine.pool.checkedout() == 0
+
+        cached = json.dumps(user.model_dump())
+        monkeypatch.setattr(current_user_module.redis_client, "get", AsyncMock(return_value=cached))
+        with track_queries() as log:
+            assert (await current_user_module.get_current_user(token, session)).id == user.id
+        assert log.count == 0
+        assert manager.engine.pool.checkedout() == 0
+
+
+def test_statement_timeout_per_route(monkeypatch):
+    from app.database.db import statement_timeout
+
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 500)
+    monkeypatch.setattr(settings, "DB_ROUTE_STATEMENT_TIMEOUTS_MS", {"/api/contacts/search": 2000})
+    assert statement_timeout("/api/contacts/search") == 2000
+    assert statement_timeout("/api/contacts/") == 500
+    assert statement_timeout(None) == 500
+
+
+def test_statement_timeout_set_locally_on_postgres():
+    from unittest.mock import MagicMock
+    from app.database.db import TimeoutSession, _apply_statement_timeout
+
+    session = TimeoutSession()
+    session.info["statement_timeout_ms"] = 2000
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+    _apply_statement_timeout(session, None, connection)
+    connection.exec_driver_sql.assert_called_once_with("SET LOCAL statement_timeout = 2000")
+
+    connection = MagicMock()
+    connection.dialect.name = "sqlite"
+    _apply_statement_timeout(session, None, connection)
+    connection.exec_driver_sql.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_session_carries_statement_timeout(manager):
+    async with manager.session(statement_timeout_ms=1500) as session:
+        assert session.info["statement_timeout_ms"] == 1500
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
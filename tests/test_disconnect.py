@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+
+from app.middleware.disconnect import DisconnectCancelMiddleware
+
+
+def make_receive():
+    disconnected = asyncio.Event()
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    return receive, disconnected
+
+
+async def run(app, method, disconnect_after=0.01):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    receive, disconnected = make_receive()
+    scope = {"type": "http", "method": method, "path": "/slow"}
+    asyncio.get_running_loop().call_later(disconnect_after, disconnected.set)
+    await asyncio.wait_for(DisconnectCancelMiddleware(app)(scope, receive, send), 1)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_get_is_cancelled_on_disconnect():
+    state = {}
+
+    async def app(scope, receive, send):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    sent = await run(app, "GET")
+    assert state == {"cancelled": True}
+    assert sent == []
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_cancelled():
+    async def app(scope, receive, send):
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"done"})
+
+    sent = await run(app, "POST")
+    assert sent[0]["status"] == 201
+
+
+@pytest.mark.asyncio
+async def test_completed_response_is_not_cancelled():
+    state = {}
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+        # Work after the response, like background tasks, must still finish.
+        await asyncio.sleep(0.05)
+        state["finished"] = True
+
+    await run(app, "GET")
+    assert state == {"finished": True}
+
+
+@pytest.mark.asyncio
+async def test_app_still_receives_request_and_disconnect():
+    received = []
+
+    async def app(scope, receive, send):
+        received.append((await receive())["type"])
+        received.append((await receive())["type"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    await run(app, "GET")
+    assert received == ["http.request", "http.disconnect"]
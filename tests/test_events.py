@@ -0,0 +1,143 @@
+import asyncio
+import json
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+from app.config.config import settings
+from app.database.models import Contact
+from app.routes.contacts import event_stream
+from app.services.events import CONTACT_EVENTS_CHANNEL, WORKER_ID, ContactEventBroker
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.channels = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+def contact():
+    return Contact(
+        id=7, name="Olena", surname="Shevchenko", email="olena@example.com",
+        phone="+380501234567", birthdate=date(1990, 5, 17), notes=None, user_id=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_events_are_delivered_to_owner_only():
+    broker = ContactEventBroker(MagicMock())
+    broker._listen = AsyncMock()
+    async with broker.subscribe(1) as mine, broker.subscribe(2) as theirs:
+        broker.dispatch({"user_id": 1, "type": "deleted", "id": 7})
+
+        assert mine.get_nowait()["id"] == 7
+        assert theirs.empty()
+    assert broker._queues == {}
+
+
+@pytest.mark.asyncio
+async def test_full_queue_gets_overflow_event(monkeypatch):
+    monkeypatch.setattr(settings, "CONTACTS_STREAM_QUEUE_SIZE", 2)
+    broker = ContactEventBroker(MagicMock())
+    broker._listen = AsyncMock()
+    async with broker.subscribe(1) as queue:
+        for id in range(3):
+            broker.dispatch({"user_id": 1, "type": "deleted", "id": id})
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait()["type"] == "overflow"
+
+
+@pytest.mark.asyncio
+async def test_listener_dispatches_published_events():
+    event = {"user_id": 1, "type": "deleted", "id": 7, "contact": None}
+    pubsub = FakePubSub([
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": json.dumps(event)},
+    ])
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+    broker = ContactEventBroker(redis)
+
+    async with broker.subscribe(1) as queue:
+        received = await asyncio.wait_for(queue.get(), 1)
+
+    assert received == event
+    assert pubsub.channels == [CONTACT_EVENTS_CHANNEL]
+
+
+@pytest.mark.asyncio
+async def test_listeners_receive_events_with_their_origin():
+    event = {"user_id": 1, "type": "deleted", "id": 7, "contact": None}
+    pubsub = FakePubSub([{"type": "message", "data": json.dumps({**event, "origin": "other"})}])
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+    broker = ContactEventBroker(redis)
+    received = asyncio.Queue()
+
+    def callback(event, origin):
+        received.put_nowait((event, origin))
+
+    broker.add_listener(callback)
+    assert await asyncio.wait_for(received.get(), 1) == (event, "other")
+    listener = broker._listener
+    broker.remove_listener(callback)
+    assert broker._listener is None
+    await asyncio.sleep(0)
+    assert listener.cancelled()
+    assert broker._event(1, "deleted", 7, None)["origin"] == WORKER_ID
+
+
+@pytest.mark.asyncio
+async def test_publish_many_uses_one_pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+    broker = ContactEventBroker(redis)
+
+    await broker.publish_many(1, "updated", {7: contact(), 8: None})
+
+    assert pipe.publish.call_count == 2
+    first = json.loads(pipe.publish.call_args_list[0].args[1])
+    assert first["contact"]["birthdate"] == "1990-05-17"
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_errors_are_swallowed():
+    redis = MagicMock()
+    redis.pipeline.side_effect = ConnectionError("redis is down")
+    broker = ContactEventBroker(redis)
+
+    await broker.publish(1, "deleted", 7)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_formats_events_and_keep_alive(monkeypatch):
+    monkeypatch.setattr(settings, "CONTACTS_STREAM_KEEPALIVE_SECONDS", 0.01)
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(side_effect=[False, False, True])
+    queue = asyncio.Queue()
+    queue.put_nowait({"user_id": 1, "type": "deleted", "id": 7, "contact": None})
+
+    chunks = [chunk async for chunk in event_stream(queue, request)]
+
+    assert chunks[0] == 'event: deleted\ndata: {"type": "deleted", "id": 7, "contact": null}\n\n'
+    assert chunks[1] == ": keep-alive\n\n"
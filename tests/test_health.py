@@ -0,0 +1,106 @@
+import asyncio
+import pytest
+
+from app.main import app
+from app.config.config import settings
+from app.services import health
+from app.services.health import health_checker
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    calls = {"database": 0, "redis": 0, "smtp": 0}
+
+    def probe(name, fail=False):
+        async def check():
+            calls[name] += 1
+            if fail:
+                raise ConnectionError(name)
+
+        return check
+
+    def configure(**failing):
+        monkeypatch.setattr(
+            health,
+            "CHECKS",
+            {name: probe(name, failing.get(name, False)) for name in calls},
+        )
+        health_checker.reset()
+
+    app.state.ready = True
+    yield configure, calls
+    app.state.ready = False
+    health_checker.reset()
+
+
+@pytest.mark.asyncio
+async def test_live(client):
+    response = await client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_ready_warming_up(client):
+    app.state.ready = False
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "warming_up"}
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_latency_and_caches(client, probes):
+    configure, calls = probes
+    configure()
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert set(body["checks"]) == {"database", "redis", "smtp"}
+    assert all(check["latency_ms"] >= 0 for check in body["checks"].values())
+    assert "queue_depth" in body["checks"]["smtp"]
+
+    await client.get("/health/ready")
+    assert calls == {"database": 1, "redis": 1, "smtp": 1}
+
+
+@pytest.mark.asyncio
+async def test_ready_smtp_failure_degrades(client, probes):
+    configure, _ = probes
+    configure(smtp=True)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "degraded"
+    smtp = response.json()["checks"]["smtp"]
+    assert smtp["status"] == "error"
+    assert smtp["error"] == "ConnectionError"
+
+
+@pytest.mark.asyncio
+async def test_ready_database_failure_unavailable(client, probes):
+    configure, _ = probes
+    configure(database=True)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "unavailable"
+
+
+@pytest.mark.asyncio
+async def test_database_probe():
+    result = await health._probe(health._check_database)
+    assert result["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_probe_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.01)
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    result = await health._probe(hang)
+    assert result["status"] == "timeout"
+    assert result["latency_ms"] < 500
@@ -0,0 +1,92 @@
+import logging
+import pytest
+from sqlalchemy import select, text
+
+from app.config.config import settings
+from app.database.models import User
+from app.database.instrumentation import (
+    QueryBudgetExceeded,
+    _explain,
+    query_budget,
+    track_queries,
+)
+
+
+@pytest.mark.asyncio
+async def test_track_queries_nested(db_session):
+    with track_queries() as outer:
+        await db_session.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            await db_session.execute(text("SELECT 2"))
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.duration >= inner.duration
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_detected(db_session, caplog):
+    with track_queries() as log:
+        for user_id in range(5):
+            await db_session.execute(select(User).where(User.id == user_id))
+        await db_session.execute(text("SELECT 1"))
+
+    repeated = log.repeated(5)
+    assert len(repeated) == 1
+    assert repeated[0][1] == 5
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        log.report("/api/test")
+    assert "Possible N+1 on /api/test" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_query_budget(db_session):
+    with query_budget(1):
+        await db_session.execute(text("SELECT 1"))
+
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(1):
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 2"))
+
+
+@pytest.mark.asyncio
+async def test_slow_query_logged_with_plan(db_session, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SQL_SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(settings, "SQL_EXPLAIN_SLOW_QUERIES", True)
+    monkeypatch.setattr(settings, "SQL_LOG_PARAMETERS", True)
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        await db_session.execute(select(User).where(User.name == "testuser"))
+
+    assert "Slow query" in caplog.text
+    assert "testuser" in caplog.text
+    assert "Plan:" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_slow_query_parameters_redacted(db_session, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SQL_SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        await db_session.execute(select(User).where(User.name == "testuser"))
+
+    assert "Slow query" in caplog.text
+    assert "testuser" not in caplog.text
+    assert "[redacted]" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_failed_explain_keeps_transaction_usable(db_session):
+    await db_session.execute(text("CREATE TEMP TABLE explain_probe (id INTEGER)"))
+    await db_session.execute(text("INSERT INTO explain_probe VALUES (1)"))
+    conn = await db_session.connection()
+
+    plan = await conn.run_sync(
+        lambda sync_conn: _explain(sync_conn, "SELECT * FROM missing_table", ())
+    )
+
+    assert plan.startswith("EXPLAIN failed")
+    result = await db_session.execute(text("SELECT count(*) FROM explain_probe"))
+    assert result.scalar() == 1
@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import text
+from prometheus_client import REGISTRY
+
+from app.services.current_user import get_current_user
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    response = await client.post("/api/auth/login", data={"username": "nobody", "password": "wrong"})
+    assert response.status_code == 401
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert "http_request_duration_seconds" in response.text
+    assert 'route="/api/auth/login",status="401"' in response.text
+    assert "http_requests_in_flight" in response.text
+
+
+@pytest.mark.asyncio
+async def test_query_duration_observed(db_session):
+    before = REGISTRY.get_sample_value("db_query_duration_seconds_count") or 0
+    await db_session.execute(text("SELECT 1"))
+    after = REGISTRY.get_sample_value("db_query_duration_seconds_count")
+    assert after == before + 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_miss_counted(mock_db_session):
+    before = REGISTRY.get_sample_value("user_cache_requests_total", {"result": "miss"}) or 0
+    with patch("app.services.current_user.redis_client.get", new_callable=AsyncMock, return_value=None):
+        with pytest.raises(Exception):
+            await get_current_user("invalid_token", mock_db_session)
+    after = REGISTRY.get_sample_value("user_cache_requests_total", {"result": "miss"})
+    assert after == before + 1
@@ -0,0 +1,30 @@
+import pytest
+
+from app.services.normalize import normalize_email, normalize_phone
+
+
+@pytest.mark.parametrize(
+    "phone, expected",
+    [
+        ("+380 (50) 123-45-67", "+380501234567"),
+        ("00380501234567", "+380501234567"),
+        ("050 123 45 67", "+380501234567"),
+        ("501234567", "+380501234567"),
+        ("", None),
+        ("n/a", None),
+        ("+1234567890123456", None),
+    ],
+)
+def test_normalize_phone(phone, expected):
+    assert normalize_phone(phone, country_code="380") == expected
+
+
+def test_normalize_phone_without_default_country_code():
+    assert normalize_phone("1 (234) 567-890", country_code="") == "+1234567890"
+    assert normalize_phone(None) is None
+
+
+def test_normalize_email():
+    assert normalize_email("  John.Doe@Example.COM ") == "john.doe@example.com"
+    assert normalize_email(" ") is None
+    assert normalize_email(None) is None
@@ -0,0 +1,82 @@
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.config.config import settings
+from app.middleware.profiling import ProfilingMiddleware, sign_profile_request
+from app.response.schemas import User
+from app.services.current_user import get_current_user
+
+
+def make_client(tmp_path, sample_rate=0.0, secret=None):
+    test_app = FastAPI()
+
+    @test_app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    test_app.add_middleware(
+        ProfilingMiddleware, sample_rate=sample_rate, secret=secret, directory=str(tmp_path)
+    )
+    return AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_sampled_request_is_profiled(tmp_path):
+    async with make_client(tmp_path, sample_rate=1.0) as client:
+        response = await client.get("/ping")
+
+    assert response.status_code == 200
+    profiles = list(tmp_path.glob("*.prof"))
+    assert len(profiles) == 1
+    assert "GET-ping" in profiles[0].name
+
+
+@pytest.mark.asyncio
+async def test_signed_header_forces_profile(tmp_path):
+    header = sign_profile_request("secret", "/ping", int(time.time()) + 60)
+    async with make_client(tmp_path, secret="secret") as client:
+        await client.get("/ping", headers={"X-Debug-Profile": header})
+        await client.get("/ping", headers={"X-Debug-Profile": header + "0"})
+        await client.get("/ping")
+
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_header_is_ignored(tmp_path):
+    header = sign_profile_request("secret", "/ping", int(time.time()) - 1)
+    async with make_client(tmp_path, secret="secret") as client:
+        await client.get("/ping", headers={"X-Debug-Profile": header})
+
+    assert list(tmp_path.glob("*.prof")) == []
+
+
+@pytest.mark.asyncio
+async def test_admin_profiles_routes(client, tmp_path, monkeypatch):
+    (tmp_path / "20250101T000000-GET-ping-5ms.prof").write_bytes(b"data")
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, name="admin", email="admin@example.com", avatar=None, role="ADMIN"
+    )
+    try:
+        response = await client.get("/api/admin/profiles")
+        assert response.json() == ["20250101T000000-GET-ping-5ms.prof"]
+
+        response = await client.get("/api/admin/profiles/20250101T000000-GET-ping-5ms.prof")
+        assert response.status_code == 200
+        assert response.content == b"data"
+
+        response = await client.get("/api/admin/profiles/missing.prof")
+        assert response.status_code == 404
+
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=2, name="user", email="user@example.com", avatar=None, role="USER"
+        )
+        response = await client.get("/api/admin/profiles")
+        assert response.status_code == 403
+    finally:
+        del app.dependency_overrides[get_current_user]
@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.controllers.contacts import ContactsController
+from app.services.single_flight import SingleFlight, single_flight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_run_once():
+    flight = SingleFlight()
+    calls = []
+
+    @single_flight(flight, group="user_id")
+    async def read(user_id, facets=()):
+        calls.append((user_id, facets))
+        await asyncio.sleep(0.01)
+        return {"user": user_id}
+
+    results = await asyncio.gather(
+        read(1, ["a"]), read(user_id=1, facets=["a"]), read(1, ["b"]), read(2, ["a"])
+    )
+    assert results == [{"user": 1}, {"user": 1}, {"user": 1}, {"user": 2}]
+    assert calls == [(1, ["a"]), (1, ["b"]), (2, ["a"])]
+    assert results[0] is results[1]
+    assert flight._calls == {}
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared():
+    flight = SingleFlight()
+    call = AsyncMock(side_effect=ValueError("boom"))
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return await call()
+
+    results = await asyncio.gather(
+        flight.do(1, "key", slow), flight.do(1, "key", slow), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert call.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_reruns_when_leader_is_cancelled():
+    flight = SingleFlight()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    leader = asyncio.create_task(flight.do(1, "key", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do(1, "key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_a_new_flight():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = asyncio.create_task(flight.do(1, "key", read))
+    await asyncio.sleep(0)
+    flight.forget(1)
+    second = asyncio.create_task(flight.do(1, "key", read))
+    await asyncio.sleep(0)
+    release.set()
+    assert (await first, await second) == (2, 2)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_controller_reads_are_coalesced():
+    db = MagicMock()
+    controller = ContactsController(db)
+
+    async def birthdays(user_id, fields):
+        await asyncio.sleep(0.01)
+        return []
+
+    controller.db.get_upcoming_birthdays = AsyncMock(side_effect=birthdays)
+    other = ContactsController(db)
+    other.db.get_upcoming_birthdays = controller.db.get_upcoming_birthdays
+
+    results = await asyncio.gather(
+        controller.get_upcoming_birthdays(7), other.get_upcoming_birthdays(user_id=7)
+    )
+    assert results == [{"contacts": []}, {"contacts": []}]
+    controller.db.get_upcoming_birthdays.assert_awaited_once_with(7, None)
+
+
+@pytest.mark.asyncio
+async def test_current_user_lookups_are_coalesced(mock_db_session, token):
+    from app.services.current_user import get_current_user
+
+    async def cached(key):
+        await asyncio.sleep(0.01)
+        return '{"id": 1, "name": "testuser", "email": "t@example.com", "avatar": null, "role": "USER"}'
+
+    access_token = token()
+    with patch("app.services.current_user.redis_client.get", new_callable=AsyncMock, side_effect=cached) as get:
+        users = await asyncio.gather(
+            get_current_user(access_token, mock_db_session),
+            get_current_user(access_token, MagicMock()),
+        )
+    assert users[0] is users[1]
+    get.assert_awaited_once()
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+from app.startup import LAZY_MODULES
+
+
+def test_heavy_integrations_imported_lazily():
+    code = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
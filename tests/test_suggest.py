@@ -0,0 +1,50 @@
+import time
+
+from app.services.suggest import PrefixIndex, SuggestIndexCache
+
+ROWS = [
+    (1, "Olena", "Koval", "olena@example.com"),
+    (2, "Oleh", "Bondar", "oleh@example.com"),
+    (3, "Taras", "Olenko", "taras@example.com"),
+]
+
+
+def test_prefix_search_orders_by_matching_value():
+    index = PrefixIndex(ROWS)
+    assert [contact["id"] for contact in index.search("ole", 10)] == [2, 1, 3]
+    assert [contact["id"] for contact in index.search("OLE", 2)] == [2, 1]
+    assert [contact["id"] for contact in index.search("t", 10)] == [3]
+    assert index.search("x", 10) == []
+
+
+def test_index_is_built_for_hot_users_and_evicted_lru():
+    cache = SuggestIndexCache(max_users=2, hot_requests=2, ttl=60)
+    assert cache.is_hot(1) is False
+    assert cache.is_hot(1) is True
+
+    for user_id in (1, 2, 3):
+        cache.put(user_id, PrefixIndex(ROWS))
+    assert cache.get(1) is None
+    assert cache.get(2) is not None and cache.get(3) is not None
+
+
+def test_invalidation_drops_stale_indexes():
+    cache = SuggestIndexCache(max_users=2, hot_requests=1, ttl=60)
+    started = time.monotonic()
+    cache.invalidate(1)
+    # Rows read before the write must not be cached after it.
+    cache.put(1, PrefixIndex(ROWS, built_at=started))
+    assert cache.get(1) is None
+
+    cache.put(1, PrefixIndex(ROWS))
+    cache.invalidate(1)
+    assert cache.get(1) is None
+
+    cache.mark_too_large(2)
+    assert cache.is_hot(2) is False
+
+
+def test_expired_index_is_dropped():
+    cache = SuggestIndexCache(max_users=2, hot_requests=1, ttl=60)
+    cache.put(1, PrefixIndex(ROWS, built_at=time.monotonic() - 61))
+    assert cache.get(1) is None
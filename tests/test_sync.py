@@ -0,0 +1,15 @@
+import pytest
+from datetime import datetime, UTC
+
+from app.services.sync import InvalidSyncToken, decode_sync_token, encode_sync_token
+
+
+def test_sync_token_round_trip():
+    moment = datetime(2025, 4, 13, 14, 19, 21, 820569, tzinfo=UTC)
+    assert decode_sync_token(encode_sync_token(moment)) == moment
+
+
+@pytest.mark.parametrize("token", ["", "not-a-token", "%%%"])
+def test_invalid_sync_token(token):
+    with pytest.raises(InvalidSyncToken):
+        decode_sync_token(token)
@@ -41,7 +41,7 @@ async def test_create_user(user_service, mock_db_session):
     assert user.email == "newuser@example.com"
     mock_db_session.add.assert_called_once()
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once()
+    mock_db_session.refresh.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_delete_user(user_service, mock_db_session):
@@ -90,4 +90,4 @@ async def test_update_user(user_service, mock_db_session):
     assert user.password == updated_user.password
     assert user.avatar == updated_user.avatar
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once()
\ No newline at end of file
+    mock_db_session.refresh.assert_not_called()
\ No newline at end of file
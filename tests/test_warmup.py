@@ -0,0 +1,57 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.database.db import DatabaseSessionManager
+from app.database.models import Base
+from app.services.warmup import warm_up, warm_up_until_ready
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    manager = DatabaseSessionManager(f"sqlite+aiosqlite:///{tmp_path}/warmup.db")
+    async with manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up(manager):
+    redis = AsyncMock()
+
+    timings = await warm_up(manager, redis)
+
+    assert set(timings) == {"db_connections", "redis_connections", "statements", "libraries"}
+    assert redis.ping.await_count == 5
+    assert all(elapsed >= 0 for elapsed in timings.values())
+    assert manager.engine.pool.checkedin() == 5
+
+
+@pytest.mark.asyncio
+async def test_warm_up_until_ready_retries(manager, monkeypatch):
+    redis = AsyncMock()
+    failures = [ConnectionError("down")]
+
+    async def ping():
+        if failures:
+            raise failures.pop()
+        return True
+
+    redis.ping.side_effect = ping
+    monkeypatch.setattr("app.services.warmup.asyncio.sleep", AsyncMock())
+    state = SimpleNamespace(state=SimpleNamespace(ready=False))
+
+    await warm_up_until_ready(state, manager, redis)
+
+    assert state.state.ready is True
+
+
+@pytest.mark.asyncio
+async def test_warm_up_caps_db_connections(manager, monkeypatch):
+    monkeypatch.setattr("app.services.warmup.settings.WARMUP_DB_CONNECTIONS", 50)
+    monkeypatch.setattr("app.services.warmup.settings.DB_POOL_SIZE", 3)
+
+    await warm_up(manager, AsyncMock())
+
+    assert manager.engine.pool.checkedin() <= 5